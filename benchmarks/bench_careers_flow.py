@@ -0,0 +1,76 @@
+"""
+Benchmark: the Careers flow against the local stand-in site
+
+Each round opens a fresh BrowserContext on one shared browser and times
+navigate_to_careers, the scrolls, extract_core_values and
+download_core_value_images separately. Every response is served from the
+stand-in archive with a fixed, configurable latency.
+
+Run: python -m benchmarks.bench_careers_flow
+"""
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks.harness import format_table, summarize
+from benchmarks.standin_site import build_site, open_site
+from pages.careers_page import CareersPage
+from utils.downloader import configure_downloader
+from utils.network_archive import set_active_archive
+
+
+def timed(samples: dict, name: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    samples.setdefault(f"careers.{name}", []).append(time.perf_counter() - start)
+    return result
+
+
+def run_round(browser, archive, output_dir: str, samples: dict):
+    context = browser.new_context(viewport={"width": 1920, "height": 1080})
+    archive.attach(context)
+    try:
+        careers_page = CareersPage(context.new_page())
+        timed(samples, "navigate_to_careers", careers_page.navigate_to_careers)
+        timed(samples, "scroll_to_core_values",
+              lambda: (careers_page.scroll_to_life_at_trg(), careers_page.scroll_to_core_values()))
+        core_values = timed(samples, "extract_core_values", careers_page.extract_core_values)
+        downloaded = timed(samples, "download_core_value_images",
+                           careers_page.download_core_value_images, core_values, output_dir)
+        if len(core_values) != 4 or len(downloaded) != 4:
+            raise RuntimeError(f"Stand-in flow incomplete: {len(core_values)} values, {len(downloaded)} images")
+    finally:
+        context.close()
+
+
+def run(rounds: int = 10, warmup: int = 1, latency_ms: float = 20, headless: bool = True) -> dict:
+    """Time every Careers step over `rounds` fresh contexts; returns stats per step"""
+    samples = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        archive = open_site(build_site(os.path.join(workdir, "site")), latency_ms=latency_ms)
+        set_active_archive(archive)
+        # No image cache: every round downloads the images again
+        configure_downloader(cache=None)
+        try:
+            with sync_playwright() as playwright:
+                browser = playwright.chromium.launch(headless=headless)
+                try:
+                    # Page objects print every step; keep the benchmark output readable
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        for round_no in range(warmup + rounds):
+                            round_samples = {} if round_no < warmup else samples
+                            run_round(browser, archive, os.path.join(workdir, "images"), round_samples)
+                finally:
+                    browser.close()
+        finally:
+            set_active_archive(None)
+            configure_downloader()
+    return {name: summarize(values) for name, values in samples.items()}
+
+
+if __name__ == "__main__":
+    print(format_table(run(), {}))
@@ -0,0 +1,98 @@
+"""
+Benchmark: non-browser hot spots
+
+- format_logs_for_html on a typical (300 lines) and a long (10k lines) log
+- generate_random_test_string, in batches of 10k calls, against the batch API
+- the pytest_runtest_makereport hook for a passed test with captured logs
+
+Run: python -m benchmarks.bench_hot_spots
+"""
+import pytest
+
+from benchmarks.bench_log_renderer import make_log
+from benchmarks.harness import format_table, measure
+from plugins import browser as browser_plugin
+from utils.log_renderer import format_logs_for_html
+from utils.screenshots import ScreenshotPolicy
+from utils.string_generator import generate_random_test_string, generate_random_test_strings
+
+
+STRING_BATCH = 10_000
+
+
+class FakeConfig:
+    """The parts of pytest.Config the report hook reads"""
+
+    def __init__(self):
+        self.stash = pytest.Stash()
+        self.stash[browser_plugin.screenshot_policy_key] = ScreenshotPolicy(mode="off")
+
+    def getini(self, name):
+        return {"artifacts_dir": "artifacts"}[name]
+
+    def getoption(self, name, default=None):
+        return default
+
+
+class FakeItem:
+
+    def __init__(self, config):
+        self.config = config
+        self.nodeid = "tests/test_core_values.py::TestCoreValues::test_extract_and_save_core_values"
+        self.fixturenames = ["page"]
+        self.funcargs = {}
+        self.stash = pytest.Stash()
+
+
+class FakeReport:
+
+    def __init__(self, logs):
+        self.when = "call"
+        self.capstdout = logs
+        self.capstderr = ""
+        self.duration = 12.5
+        self.failed = False
+
+
+class FakeOutcome:
+
+    def __init__(self, report):
+        self.report = report
+
+    def get_result(self):
+        return self.report
+
+
+def call_report_hook(item, logs):
+    """Drive the hookwrapper generator the way pluggy does"""
+    hook = browser_plugin.pytest_runtest_makereport(item, None)
+    next(hook)
+    try:
+        hook.send(FakeOutcome(FakeReport(logs)))
+    except StopIteration:
+        pass
+
+
+def generate_batch():
+    for _ in range(STRING_BATCH):
+        generate_random_test_string()
+
+
+def run(rounds: int = 20, warmup: int = 2) -> dict:
+    typical_log = make_log(300)
+    long_log = make_log(10_000)
+    item = FakeItem(FakeConfig())
+    return {
+        "hot.format_logs_for_html[300]": measure(lambda: format_logs_for_html(typical_log), rounds, warmup),
+        "hot.format_logs_for_html[10k]": measure(lambda: format_logs_for_html(long_log), rounds, warmup),
+        f"hot.generate_random_test_string[x{STRING_BATCH // 1000}k]": measure(generate_batch, rounds, warmup),
+        f"hot.generate_random_test_strings[{STRING_BATCH // 1000}k]": measure(
+            lambda: generate_random_test_strings(STRING_BATCH), rounds, warmup),
+        f"hot.generate_random_test_strings[{STRING_BATCH // 1000}k,uniq]": measure(
+            lambda: generate_random_test_strings(STRING_BATCH, unique=True), rounds, warmup),
+        "hot.report_hook[300]": measure(lambda: call_report_hook(item, typical_log), rounds, warmup),
+    }
+
+
+if __name__ == "__main__":
+    print(format_table(run(), {}))
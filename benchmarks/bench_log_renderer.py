@@ -0,0 +1,90 @@
+"""
+Micro-benchmark: HTML log rendering on a 100k-line log
+
+Compares utils.log_renderer.format_logs_for_html with the original
+string-concatenation renderer it replaced. The gain is in output size;
+render time stays close to the original, which did not escape anything.
+
+Run: python -m benchmarks.bench_log_renderer
+"""
+import random
+import time
+
+from utils.log_renderer import format_logs_for_html
+
+
+# Templates filled with random numbers, so most lines are unique like in real logs
+SAMPLE_LINES = [
+    "   → Step {a}: Hovering over 'Who we are' menu ({b} ms)...",
+    "   ✅ Loaded: https://careers.trgint.com/?v={a}&t={b}",
+    "   ⚠️  Could not hover on attempt {a} after {b} ms",
+    "   🔄 ATTEMPT {a}/{b}",
+    "   ❌ Screenshot also failed: Timeout {a}ms exceeded (#{b})",
+    "   ℹ️  No cookies popup ({a}/{b})",
+    "   ✓ Downloaded: image-{a}.png ({b} bytes)",
+    "      Headline {a}: 'Whatever it takes!' <h5 id={b}>",
+    "      {a:8d} ms  element: locator('#comp-{b}') visible",
+    "",
+]
+
+
+def legacy_format_logs_for_html(logs):
+    """The original conftest renderer (+= concatenation, inline styles, no escaping)"""
+    html = '<div style="background-color: #1e1e1e; padding: 15px; border-radius: 8px; font-family: \'Courier New\', monospace; white-space: pre-wrap; max-height: 600px; overflow-y: auto; border: 2px solid #444;">'
+    html += '<h4 style="margin-top: 0; color: #61dafb; border-bottom: 2px solid #61dafb; padding-bottom: 5px;">📋 Test Execution Logs:</h4>'
+    for line in logs.split('\n'):
+        if not line.strip():
+            continue
+        if '✅' in line or 'PASSED' in line or '✓' in line or 'Successfully' in line:
+            color = '#28a745'
+        elif '❌' in line or 'FAILED' in line or 'ERROR' in line or 'Error' in line:
+            color = '#dc3545'
+        elif '⚠️' in line or 'WARNING' in line or 'Could not' in line:
+            color = '#ffc107'
+        elif '→' in line or 'Step' in line:
+            color = '#007bff'
+        elif '🔄' in line or 'ATTEMPT' in line or 'Retry' in line:
+            color = '#6f42c1'
+        elif 'ℹ️' in line or 'INFO' in line:
+            color = '#17a2b8'
+        elif 'Extracted' in line or 'Downloaded' in line or 'Saved' in line:
+            color = '#20c997'
+        elif 'Looking for' in line or 'Searching' in line or 'Checking' in line:
+            color = '#fd7e14'
+        else:
+            color = '#d4d4d4'
+        html += f'<div style="color: {color}; margin: 3px 0; line-height: 1.5;">{line}</div>'
+    html += '</div>'
+    return html
+
+
+def make_log(lines: int, seed: int = 42) -> str:
+    rng = random.Random(seed)
+    return "\n".join(
+        rng.choice(SAMPLE_LINES).format(a=rng.randint(0, 10 ** 6), b=rng.randint(0, 10 ** 6))
+        for _ in range(lines)
+    )
+
+
+def best_of(func, arg, repeat: int = 5) -> float:
+    """Best wall time in seconds over several runs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(lines: int = 100_000, repeat: int = 5):
+    logs = make_log(lines)
+    print(f"Log: {lines:,} lines, {len(logs) / 1024:.0f} KB")
+    print("-" * 60)
+    for name, func in [("legacy", legacy_format_logs_for_html), ("log_renderer", format_logs_for_html)]:
+        seconds = best_of(func, logs, repeat)
+        size = len(func(logs).encode("utf-8"))
+        print(f"{name:>14}: {seconds * 1000:8.1f} ms   output {size / 1024:8.0f} KB")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,77 @@
+"""
+Benchmark: pytest startup for a unit-only run
+
+Runs pytest on tests that need no browser in a fresh interpreter and
+measures, from process start, when collection finished and when the
+first test body started. The run is also checked for a Playwright
+import, which the browser plugin should only cause for browser tests.
+
+This module doubles as the probe plugin loaded into the measured run.
+
+Run: python -m benchmarks.bench_startup
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.harness import format_table, summarize
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UNIT_TESTS = ("tests/test_random_string.py",)
+PROBE_ENV = "TRG_STARTUP_PROBE"
+
+_stamps = {}
+
+
+def pytest_collection_finish(session):
+    _stamps["collected"] = time.time()
+
+
+def pytest_runtest_call(item):
+    _stamps.setdefault("first_test", time.time())
+
+
+def pytest_sessionfinish(session):
+    path = os.environ.get(PROBE_ENV)
+    if path:
+        _stamps["playwright_imported"] = "playwright" in sys.modules
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_stamps, f)
+
+
+def run_once(tests=UNIT_TESTS) -> dict:
+    """Seconds from process start to collection finished / first test started"""
+    with tempfile.TemporaryDirectory() as tmp:
+        probe = os.path.join(tmp, "probe.json")
+        command = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+                   "-p", "benchmarks.bench_startup", *tests]
+        start = time.time()
+        subprocess.run(command, cwd=ROOT, env=dict(os.environ, **{PROBE_ENV: probe}),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        with open(probe, encoding="utf-8") as f:
+            stamps = json.load(f)
+    return {
+        "collection": stamps["collected"] - start,
+        "first_test": stamps["first_test"] - start,
+        "playwright_imported": stamps["playwright_imported"],
+    }
+
+
+def run(rounds: int = 5, warmup: int = 1) -> dict:
+    for _ in range(warmup):
+        run_once()
+    samples = [run_once() for _ in range(rounds)]
+    if any(sample["playwright_imported"] for sample in samples):
+        print("   ⚠️  Unit-only run imported Playwright")
+    return {
+        "startup.collection[unit]": summarize([sample["collection"] for sample in samples]),
+        "startup.first_test[unit]": summarize([sample["first_test"] for sample in samples]),
+    }
+
+
+if __name__ == "__main__":
+    print(format_table(run(), {}))
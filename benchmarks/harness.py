@@ -0,0 +1,108 @@
+"""
+Timing, storage and regression checks shared by the benchmarks
+
+Every benchmark produces a list of samples (seconds) per step. Samples
+are summarized as min / median / p95, stored in a results file between
+runs, and compared with the stored baseline: a step whose median grew by
+more than the threshold is reported as a regression.
+"""
+import json
+import math
+import os
+import statistics
+import time
+from datetime import datetime
+
+from utils.parallel import atomic_write_json
+
+
+DEFAULT_RESULTS = "benchmarks/results.json"
+DEFAULT_THRESHOLD = 0.20
+
+# Runs kept in the results file next to the baseline
+HISTORY_SIZE = 50
+
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples) -> dict:
+    """min / median / p95 of timing samples, in milliseconds"""
+    return {
+        "min_ms": round(min(samples) * 1000, 3),
+        "median_ms": round(statistics.median(samples) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "rounds": len(samples)
+    }
+
+
+def measure(func, rounds: int = 20, warmup: int = 1) -> dict:
+    """Call func repeatedly and summarize its wall time"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def load_results(path: str = DEFAULT_RESULTS) -> dict:
+    if not os.path.exists(path):
+        return {"baseline": {}, "history": []}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Steps whose median is more than `threshold` (0.2 = 20%) slower than the baseline
+    Returns (name, baseline median, current median, change) tuples
+    """
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median_ms"]
+        after = stats["median_ms"]
+        change = (after - before) / before if before else 0.0
+        if change > threshold:
+            regressions.append((name, before, after, change))
+    return regressions
+
+
+def record(results: dict, path: str = DEFAULT_RESULTS, update_baseline: bool = False, **meta) -> dict:
+    """
+    Append a run to the results file
+    Steps without a baseline get one; existing baselines are only replaced with update_baseline
+    """
+    stored = load_results(path)
+    for name, stats in results.items():
+        if update_baseline or name not in stored["baseline"]:
+            stored["baseline"][name] = stats
+    stored["history"].append({
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "meta": meta,
+        "results": results
+    })
+    stored["history"] = stored["history"][-HISTORY_SIZE:]
+    atomic_write_json(path, stored)
+    return stored
+
+
+def format_table(results: dict, baseline: dict) -> str:
+    """Results as a text table, with the change against the baseline median"""
+    lines = [f"{'step':<42}{'min':>10}{'median':>10}{'p95':>10}{'vs base':>10}", "-" * 82]
+    for name, stats in results.items():
+        change = ""
+        if name in baseline and baseline[name]["median_ms"]:
+            change = f"{(stats['median_ms'] / baseline[name]['median_ms'] - 1) * 100:+.1f}%"
+        lines.append(f"{name:<42}{stats['min_ms']:>10.3f}{stats['median_ms']:>10.3f}"
+                     f"{stats['p95_ms']:>10.3f}{change:>10}")
+    lines.append("(times in ms)")
+    return "\n".join(lines)
@@ -0,0 +1,64 @@
+"""
+Benchmark suite runner
+
+Runs the hot-spot benchmarks, the pytest startup of a unit-only run and
+the Careers flow against the stand-in site, prints min / median / p95
+per step, stores the run in the results file and exits with status 1
+when a step's median regressed by more than the threshold against the
+stored baseline.
+
+Run: python -m benchmarks.run [--rounds 10] [--latency-ms 20] [--threshold 0.2]
+                              [--skip-browser] [--update-baseline]
+"""
+import argparse
+import sys
+
+from benchmarks import bench_careers_flow, bench_hot_spots, bench_startup
+from benchmarks.harness import DEFAULT_RESULTS, DEFAULT_THRESHOLD, compare, format_table, load_results, record
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="TRG automation benchmark suite")
+    parser.add_argument("--rounds", type=int, default=10, help="Measured rounds per browser step")
+    parser.add_argument("--hot-rounds", type=int, default=20, help="Measured rounds per hot-spot benchmark")
+    parser.add_argument("--startup-rounds", type=int, default=5, help="Measured pytest startups of a unit-only run")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Stand-in site latency per response")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed median slowdown against the baseline (0.2 = 20%%)")
+    parser.add_argument("--results", default=DEFAULT_RESULTS, help="Results file kept between runs")
+    parser.add_argument("--skip-browser", action="store_true", help="Only run the non-browser hot spots")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store this run as the new baseline for every step")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    print("→ Hot spots...")
+    results = bench_hot_spots.run(rounds=args.hot_rounds)
+    print("→ Pytest startup (unit-only run)...")
+    results.update(bench_startup.run(rounds=args.startup_rounds))
+    if not args.skip_browser:
+        print(f"→ Careers flow ({args.rounds} rounds, {args.latency_ms:g} ms latency)...")
+        results.update(bench_careers_flow.run(rounds=args.rounds, latency_ms=args.latency_ms,
+                                              headless=not args.headed))
+
+    baseline = load_results(args.results)["baseline"]
+    print(format_table(results, baseline))
+    regressions = compare(results, baseline, args.threshold)
+    record(results, args.results, update_baseline=args.update_baseline,
+           latency_ms=args.latency_ms, rounds=args.rounds)
+
+    if regressions and not args.update_baseline:
+        print(f"\n❌ {len(regressions)} step(s) slower than the baseline by more than {args.threshold:.0%}:")
+        for name, before, after, change in regressions:
+            print(f"   {name}: {before:.3f} ms → {after:.3f} ms ({change:+.1%})")
+        return 1
+    print(f"\n✅ No regressions above {args.threshold:.0%} (results stored in {args.results})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
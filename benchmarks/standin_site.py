@@ -0,0 +1,101 @@
+"""
+Local stand-in for the TRG homepage and Careers page
+
+Builds a replay archive (see utils.network_archive) with a homepage that
+has the 'Who we are' hover menu, a Careers page with the four core value
+cards using the same element ids as CORE_VALUE_CONFIGS, and their images.
+The page objects run against it unchanged; latency per response is
+controlled with NetworkArchive.latency_ms.
+"""
+import random
+import struct
+import zlib
+
+from pages.careers_page import CAREERS_URL, CORE_VALUE_CONFIGS
+from utils.network_archive import NetworkArchive
+
+
+HOME_URL = "https://www.trgint.com/"
+CAREERS_PAGE_URL = f"{CAREERS_URL}/"
+IMAGE_URL = "https://static.wixstatic.com/media/core-value-{}.png"
+
+HTML_HEADERS = {"Content-Type": "text/html; charset=utf-8"}
+PNG_HEADERS = {"Content-Type": "image/png"}
+
+HOME_HTML = f"""<!DOCTYPE html>
+<html><head><title>TRG International</title>
+<style>
+  nav .menu {{ position: relative; display: inline-block; }}
+  nav .dropdown {{ display: none; position: absolute; top: 100%; left: 0; padding: 8px; background: #fff; }}
+  nav .menu:hover .dropdown {{ display: block; }}
+  #cookies {{ position: fixed; bottom: 0; left: 0; right: 0; padding: 12px; background: #eee; }}
+</style></head>
+<body><div id="SITE_CONTAINER">
+  <nav>
+    <div class="menu">
+      <a href="/who-we-are">Who we are</a>
+      <div class="dropdown"><a href="{CAREERS_PAGE_URL}" target="_blank">Careers</a></div>
+    </div>
+  </nav>
+  <main style="height: 2000px"><h1>TRG International</h1></main>
+  <div id="cookies"><button onclick="this.parentNode.remove()">Accept</button></div>
+</div></body></html>
+"""
+
+
+def element_id(selector: str) -> str:
+    """'#comp-lopj2yq19 h5' -> 'comp-lopj2yq19'"""
+    return selector.split()[0].lstrip("#")
+
+
+def careers_html() -> str:
+    cards = []
+    for idx, config in enumerate(CORE_VALUE_CONFIGS, 1):
+        cards.append(f"""
+    <div class="card">
+      <div id="{element_id(config['img_id'])}"><img src="{IMAGE_URL.format(idx)}" width="300" height="200"></div>
+      <div id="{element_id(config['caption_selector'])}"><h5>{config['fallback_headline']}</h5></div>
+      <div id="{element_id(config['description_selector'])}"><p>{config['fallback_description']}</p></div>
+    </div>""")
+    return f"""<!DOCTYPE html>
+<html><head><title>Careers | TRG International</title></head>
+<body><div id="SITE_CONTAINER">
+  <nav><a href="#Life at TRG">Life at TRG</a></nav>
+  <section style="height: 1500px"><h1>Careers</h1></section>
+  <section id="Life at TRG" style="height: 800px"><h2>Life at TRG</h2></section>
+  <section id="core-values">
+    <h2>Core Values</h2>
+    <p>Our passion drives us</p>{''.join(cards)}
+  </section>
+  <section style="height: 1500px"></section>
+</div></body></html>
+"""
+
+
+def png_bytes(width: int, height: int, seed: int) -> bytes:
+    """A valid RGB PNG filled with noise, so it does not compress away"""
+    rng = random.Random(seed)
+    rows = b"".join(b"\x00" + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b""))
+
+
+def build_site(path: str, image_size=(300, 200)) -> str:
+    """Write the stand-in site as a replay archive at path"""
+    archive = NetworkArchive(path, mode="record")
+    archive.store("GET", HOME_URL, 200, HTML_HEADERS, HOME_HTML.encode("utf-8"))
+    archive.store("GET", CAREERS_PAGE_URL, 200, HTML_HEADERS, careers_html().encode("utf-8"))
+    for idx in range(1, len(CORE_VALUE_CONFIGS) + 1):
+        archive.store("GET", IMAGE_URL.format(idx), 200, PNG_HEADERS, png_bytes(*image_size, seed=idx))
+    archive.save()
+    return path
+
+
+def open_site(path: str, latency_ms: float = 0) -> NetworkArchive:
+    """Replay archive serving the stand-in site with the given latency per response"""
+    return NetworkArchive(path, mode="replay", latency_ms=latency_ms)
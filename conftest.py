@@ -1,34 +1,197 @@
 """
 Pytest configuration and fixtures
+
+Kept free of Playwright, requests and asyncio imports: runs of pure-Python
+tests start without them. The browser fixtures and report extras live in
+plugins/browser.py, loaded once a collected test needs a browser.
 """
 import pytest
 import sys
-from playwright.sync_api import sync_playwright
-from pytest_html import extras
+from plugins import BROWSER_PLUGIN, load_browser_plugin, uses_browser
+from utils.browser_trace import MODES as TRACE_MODES
+from utils.content_fingerprint import DEFAULT_FINGERPRINTS_PATH, FingerprintStore
+from utils.parallel import is_distributing, worker_output_dir
+from utils.route_filter import DEFAULT_ALLOW, DEFAULT_BLOCK_DOMAINS, DEFAULT_BLOCK_TYPES
+from utils.screenshots import MODES as SCREENSHOT_MODES
+from utils.wix_media import FETCH_MODES as IMAGE_FETCH_MODES
+
+
+# Unit tests import the plugin's helpers before it is registered; let the import go through the rewrite hook
+pytest.register_assert_rewrite(BROWSER_PLUGIN)
 
+# Defaults owned by modules that import Playwright, requests or asyncio,
+# repeated here so registering the options does not import them
+# (tests/test_plugins.py checks they stay in sync)
+NETWORK_MODES = ("live", "record", "replay")
+SELECTOR_STATS_PATH = "data/.cache/selector_stats.json"
+BROWSER_SERVER_DIR = "data/.cache/browser_server"
+FAN_OUT_CONTEXTS = ("desktop 1920x1080 en-US", "laptop 1280x800 en-GB", "mobile 390x844 vi-VN")
 
-@pytest.fixture(scope="function")
-def browser():
-    """Create a browser instance for each test"""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=False,
-            slow_mo=500
-        )
-        yield browser
-        browser.close()
+# pytest-playwright's values for --tracing
+PLAYWRIGHT_TRACING = ("on", "off", "retain-on-failure")
 
 
-@pytest.fixture(scope="function")
-def page(browser):
-    """Create a new page for each test"""
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080}
+def pytest_addoption(parser, pluginmanager):
+    """Register framework options (CLI flags override the ini values)"""
+    group = parser.getgroup("trg", "TRG automation")
+    if not pluginmanager.has_plugin("playwright"):
+        # pytest-playwright is disabled in pytest.ini (it imports Playwright at startup);
+        # the options of it that this suite reads are provided here instead
+        group.addoption("--headed", action="store_true", default=False, help="Show the browser window")
+        group.addoption("--slowmo", type=int, default=0, help="Milliseconds to slow down every Playwright action")
+        group.addoption("--full-page-screenshot", action="store_true", default=False,
+                        help="Capture the full page in screenshots")
+        group.addoption("--tracing", choices=PLAYWRIGHT_TRACING, default="off",
+                        help="pytest-playwright compatible: on = --trace-mode=always, "
+                             "retain-on-failure = --trace-mode=on-failure")
+    group.addoption(
+        "--browser-pool-size",
+        type=int,
+        default=None,
+        help="Number of Chromium instances shared by the tests of one worker"
+    )
+    group.addoption(
+        "--browser-server",
+        action="store_true",
+        default=False,
+        help="Connect to a persistent Chromium kept warm between runs (launched on first use)"
+    )
+    group.addoption(
+        "--network-mode",
+        choices=NETWORK_MODES,
+        default=None,
+        help="live: hit the real site, record: save all traffic, replay: serve saved traffic offline"
+    )
+    group.addoption(
+        "--network-archive",
+        default=None,
+        help="Directory of the recorded network archive"
+    )
+    group.addoption(
+        "--no-image-cache",
+        action="store_true",
+        default=False,
+        help="Always download images in full instead of revalidating the on-disk cache"
+    )
+    group.addoption(
+        "--no-route-filter",
+        action="store_true",
+        default=False,
+        help="Let every request through (no blocking of heavy or third-party resources)"
+    )
+    group.addoption(
+        "--cold-state",
+        action="store_true",
+        default=False,
+        help="Start every test without the saved cookie consent (the banner appears again)"
+    )
+    group.addoption(
+        "--screenshot-mode",
+        choices=SCREENSHOT_MODES,
+        default=None,
+        help="When to capture a screenshot at the end of a test (off, on-failure, always)"
+    )
+    group.addoption(
+        "--trace-mode",
+        choices=TRACE_MODES,
+        default=None,
+        help="When to keep a Playwright trace of a test (off, on-failure, always)"
+    )
+    group.addoption(
+        "--image-fetch",
+        choices=IMAGE_FETCH_MODES,
+        default=None,
+        help="original: download image srcs as found, rendered: request Wix images at their rendered size"
     )
-    page = context.new_page()
-    yield page
-    page.close()
-    context.close()
+    group.addoption(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Skip extraction, JSON writes and downloads when the page content is unchanged"
+    )
+    parser.addini("browser_headless", type="bool", default=True,
+                  help="Run Chromium headless (use --headed to override)")
+    parser.addini("browser_slow_mo", default="0",
+                  help="Milliseconds to slow down every Playwright action")
+    parser.addini("browser_pool_size", default="1",
+                  help="Number of Chromium instances shared by the tests of one worker")
+    parser.addini("browser_server", type="bool", default=False,
+                  help="Reuse a persistent Chromium across runs (same as --browser-server)")
+    parser.addini("browser_server_idle_minutes", default="30",
+                  help="Minutes without new test contexts after which the persistent Chromium shuts down")
+    parser.addini("browser_server_dir", default=BROWSER_SERVER_DIR,
+                  help="State directory of the persistent Chromium (endpoint, profile, log)")
+    parser.addini("network_mode", default="live",
+                  help="live, record or replay (use --network-mode to override)")
+    parser.addini("network_archive", default="data/network_archive",
+                  help="Directory of the recorded network archive")
+    parser.addini("route_filter", type="bool", default=True,
+                  help="Block heavy and third-party requests (use --no-route-filter to override)")
+    parser.addini("route_block_types", type="args", default=list(DEFAULT_BLOCK_TYPES),
+                  help="Playwright resource types to block, e.g. media font image")
+    parser.addini("route_block_domains", type="linelist", default=list(DEFAULT_BLOCK_DOMAINS),
+                  help="Domains (and their subdomains) whose requests are blocked")
+    parser.addini("route_allow", type="linelist", default=list(DEFAULT_ALLOW),
+                  help="URL substrings or glob patterns that are never blocked")
+    parser.addini("selector_stats", default=SELECTOR_STATS_PATH,
+                  help="File with hit/miss stats of fallback selectors (learned order, dead weight report)")
+    parser.addini("fan_out_contexts", type="linelist", default=list(FAN_OUT_CONTEXTS),
+                  help="Contexts of the fan-out extraction, one '<name> <width>x<height> [locale]' per line")
+    parser.addini("image_fetch", default="rendered",
+                  help="How core value images are fetched: original or rendered (Wix resize + re-encode)")
+    parser.addini("image_format", default="webp",
+                  help="Format requested from Wix in rendered fetch mode (webp, jpg, png)")
+    parser.addini("image_quality", default="80",
+                  help="Quality (1-100) requested from Wix in rendered fetch mode")
+    parser.addini("incremental", type="bool", default=False,
+                  help="Incremental extraction by default (same as --incremental)")
+    parser.addini("content_fingerprints", default=DEFAULT_FINGERPRINTS_PATH,
+                  help="File with the fingerprints of extracted sections (incremental mode)")
+    parser.addini("output_dir", default="data",
+                  help="Directory for extracted data and images (per-worker subfolders under xdist)")
+    parser.addini("artifacts_dir", default="artifacts",
+                  help="Directory for screenshots and other per-test artifacts linked from the report")
+    parser.addini("screenshot_mode", default="on-failure",
+                  help="off, on-failure or always (use --screenshot-mode to override)")
+    parser.addini("screenshot_full_page", type="bool", default=False,
+                  help="Capture the full page instead of the viewport (or use --full-page-screenshot)")
+    parser.addini("screenshot_format", default="jpeg",
+                  help="jpeg or png")
+    parser.addini("screenshot_quality", default="70",
+                  help="JPEG quality (0-100)")
+    parser.addini("screenshot_scale", default="1.0",
+                  help="Downscale factor for screenshots, e.g. 0.5 for half size")
+    parser.addini("trace_mode", default="on-failure",
+                  help="off, on-failure or always (use --trace-mode or pytest-playwright's --tracing to override)")
+    parser.addini("trace_screenshots", type="bool", default=False,
+                  help="Record screencast frames in traces (larger, more CPU)")
+    parser.addini("trace_snapshots", type="bool", default=True,
+                  help="Record DOM snapshots of every action in traces")
+    parser.addini("trace_sources", type="bool", default=False,
+                  help="Embed the test source files in traces")
+    parser.addini("trace_max_mb", default="200",
+                  help="Total size of retained traces in MB (oldest are removed first)")
+    parser.addini("image_cache_dir", default="data/.cache/images",
+                  help="Directory of the content-addressed image cache")
+    parser.addini("image_cache_max_mb", default="200",
+                  help="Size limit of the image cache in MB (least recently used entries are evicted)")
+
+
+@pytest.fixture(scope="session")
+def output_dir(pytestconfig):
+    """
+    Where tests write extracted data
+    Each xdist worker gets its own folder; outputs are merged after the run
+    """
+    return worker_output_dir(pytestconfig.getini("output_dir"))
+
+
+@pytest.fixture(scope="session")
+def content_store(pytestconfig):
+    """Fingerprints of the last extraction, or None when not running incrementally"""
+    if not (pytestconfig.getoption("--incremental") or pytestconfig.getini("incremental")):
+        return None
+    return FingerprintStore(pytestconfig.getini("content_fingerprints"), root=pytestconfig.getini("output_dir"))
 
 
 def pytest_configure(config):
@@ -39,15 +202,36 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "string_generator: Tests for random string generator"
     )
+    config.addinivalue_line(
+        "markers", "navigation: Full menu-driven navigation flows (slow)"
+    )
+    config.addinivalue_line(
+        "markers", "allow_resources(*patterns): URL patterns the route filter must let through"
+    )
+    config.addinivalue_line(
+        "markers", "cold_state: Start without the saved cookie consent (tests of the banner itself)"
+    )
     
-    # Add metadata for HTML report
+    # Add metadata for HTML report (the browser plugin adds the browser settings)
     config._metadata = {
         'Project': 'TRG International - Automation Tests',
         'Test Framework': 'Pytest + Playwright',
         'Browser': 'Chromium',
         'Python Version': sys.version,
-        'Playwright Mode': 'Headed (visible browser)'
+        'Incremental': 'On' if config.getoption("--incremental") or config.getini("incremental") else 'Off'
     }
+    
+    # The controller never collects, but merges what the workers produced;
+    # with pytest-playwright enabled Playwright is imported anyway and its
+    # fixtures must not shadow ours
+    if is_distributing(config) or config.pluginmanager.has_plugin("playwright"):
+        load_browser_plugin(config)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Load the browser plugin once a collected test needs a browser (before any setup runs)"""
+    if any(uses_browser(item) for item in items):
+        load_browser_plugin(config)
 
 
 def pytest_report_header(config):
@@ -60,101 +244,6 @@ def pytest_report_header(config):
     ]
 
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """
-    Hook to customize test reports
-    Captures logs and screenshots for HTML report
-    """
-    outcome = yield
-    report = outcome.get_result()
-    
-    # Initialize extras list for HTML report
-    report.extras = getattr(report, 'extras', [])
-    
-    # Add logs and screenshots only during test execution (not setup/teardown)
-    if report.when == 'call':
-        
-        # ===== CAPTURE LOGS =====
-        # Capture stdout (print statements)
-        if hasattr(report, 'capstdout') and report.capstdout:
-            formatted_logs = format_logs_for_html(report.capstdout)
-            report.extras.append(extras.html(formatted_logs))
-        
-        # Capture stderr (error messages)
-        if hasattr(report, 'capstderr') and report.capstderr:
-            report.extras.append(extras.text(report.capstderr, name="Error Output"))
-        
-        # ===== CAPTURE SCREENSHOT =====
-        if hasattr(item, 'funcargs') and 'page' in item.funcargs:
-            page = item.funcargs['page']
-            try:
-                # Take full page screenshot
-                screenshot_bytes = page.screenshot(full_page=True)
-                
-                # Convert bytes to base64 string (required by pytest-html)
-                import base64
-                screenshot_base64 = base64.b64encode(screenshot_bytes).decode('utf-8')
-                
-                if report.failed:
-                    # Red banner for failed tests
-                    report.extras.append(extras.html('<h3 style="color: red;">❌ Test Failed - Screenshot:</h3>'))
-                    report.extras.append(extras.image(screenshot_base64, name="Failure Screenshot"))
-                else:
-                    # Green banner for passed tests
-                    report.extras.append(extras.html('<h3 style="color: green;">✅ Test Passed - Final Screenshot:</h3>'))
-                    report.extras.append(extras.image(screenshot_base64, name="Success Screenshot"))
-                    
-            except Exception as e:
-                # If screenshot fails, add note to report
-                report.extras.append(extras.text(f"Could not capture screenshot: {str(e)}", name="Screenshot Error"))
-    
-    # ===== ADD TEST DURATION =====
-    if hasattr(report, 'duration'):
-        duration_html = f'<p style="font-size: 14px; margin-top: 10px;"><strong>⏱️ Test Duration:</strong> {report.duration:.2f} seconds</p>'
-        report.extras.append(extras.html(duration_html))
-
-
-def format_logs_for_html(logs):
-    """
-    Format console logs into HTML with color coding for better readability
-    """
-    html = '<div style="background-color: #1e1e1e; padding: 15px; border-radius: 8px; font-family: \'Courier New\', monospace; white-space: pre-wrap; max-height: 600px; overflow-y: auto; border: 2px solid #444;">'
-    html += '<h4 style="margin-top: 0; color: #61dafb; border-bottom: 2px solid #61dafb; padding-bottom: 5px;">📋 Test Execution Logs:</h4>'
-    
-    # Split logs by line and format each line
-    lines = logs.split('\n')
-    for line in lines:
-        if not line.strip():
-            continue
-        
-        # Color code different log types based on emoji or keywords
-        if '✅' in line or 'PASSED' in line or '✓' in line or 'Successfully' in line:
-            color = '#28a745'  # Green - success
-        elif '❌' in line or 'FAILED' in line or 'ERROR' in line or 'Error' in line:
-            color = '#dc3545'  # Red - error
-        elif '⚠️' in line or 'WARNING' in line or 'Could not' in line:
-            color = '#ffc107'  # Yellow - warning
-        elif '→' in line or 'Step' in line:
-            color = '#007bff'  # Blue - step/action
-        elif '🔄' in line or 'ATTEMPT' in line or 'Retry' in line:
-            color = '#6f42c1'  # Purple - retry
-        elif 'ℹ️' in line or 'INFO' in line:
-            color = '#17a2b8'  # Cyan - info
-        elif 'Extracted' in line or 'Downloaded' in line or 'Saved' in line:
-            color = '#20c997'  # Teal - data operations
-        elif 'Looking for' in line or 'Searching' in line or 'Checking' in line:
-            color = '#fd7e14'  # Orange - search operations
-        else:
-            color = '#d4d4d4'  # Light gray - default
-        
-        # Add line with color
-        html += f'<div style="color: {color}; margin: 3px 0; line-height: 1.5;">{line}</div>'
-    
-    html += '</div>'
-    return html
-
-
 @pytest.hookimpl(optionalhook=True)
 def pytest_html_report_title(report):
     """
@@ -192,4 +281,4 @@ def pytest_html_results_table_row(report, cells):
         
         cells.insert(3, f'<td class="col-duration" style="color: {color}; font-weight: bold;">{duration}</td>')
     else:
-        cells.insert(3, '<td class="col-duration">-</td>')
\ No newline at end of file
+        cells.insert(3, '<td class="col-duration">-</td>')
@@ -0,0 +1,130 @@
+"""
+Async Base Page: BasePage on playwright.async_api
+
+Same method surface as BasePage, every browser call awaited, so many
+page objects can run concurrently on one event loop and one browser.
+Not traced (spans nest per thread, see utils.waits.AsyncWaitEngine).
+"""
+import asyncio
+
+from playwright.async_api import Page
+from pages.base_page import BASE_URL, EXTRACT_BATCH_JS, BasePage
+from utils.consent import COOKIE_BUTTONS, consent_preloaded
+from utils.downloader import get_downloader
+from utils.readiness import NetworkActivity, ReadinessContract, now_ms
+from utils.selector_resolver import get_resolver
+from utils.waits import AsyncWaitEngine
+
+
+class AsyncBasePage:
+    
+    READINESS = BasePage.READINESS
+    
+    def __init__(self, page: Page):
+        self.page = page
+        self.base_url = BASE_URL
+        self.waits = AsyncWaitEngine(page)
+        self.network = NetworkActivity(page)
+        self.readiness = []
+    
+    async def navigate_to(self, path: str = "", contract: ReadinessContract = None):
+        """Navigate to a specific path on the website and wait for its readiness contract"""
+        url = f"{self.base_url}{path}"
+        await self.goto_ready(url, contract)
+    
+    async def goto_ready(self, url: str, contract: ReadinessContract = None, timeout: int = 30000) -> bool:
+        """Load url and wait only for the readiness contract (see BasePage.goto_ready)"""
+        contract = contract or self.READINESS
+        started = now_ms()
+        await self.page.goto(url, wait_until=contract.load_state, timeout=timeout)
+        met = await contract.wait_async(self.waits)
+        self.readiness.append({
+            "url": url,
+            "contract": contract.name,
+            "started": started,
+            "ready": now_ms(),
+            "met": met
+        })
+        if not met:
+            print(f"   ⚠️  Readiness contract not met: {contract}")
+        return met
+    
+    async def accept_cookies(self, timeout: int = 2000) -> bool:
+        """
+        Accept the cookie banner if it appears within timeout
+        Returns True when a banner was accepted
+        """
+        if consent_preloaded(self.page.context):
+            print("   ℹ️  Cookie consent preloaded from the session state")
+            return False
+        print("   → Checking for cookies popup...")
+        button = self.page.locator(COOKIE_BUTTONS).first
+        if not await self.waits.for_element(button, state="visible", timeout=timeout, required=False):
+            print("   ℹ️  No cookies popup")
+            return False
+        try:
+            await button.click(timeout=timeout)
+        except Exception as e:
+            print(f"   ⚠️  Could not accept cookies: {str(e)[:60]}")
+            return False
+        print("   ✅ Accepted cookies")
+        await self.waits.for_element(button, state="hidden", timeout=2000, required=False)
+        return True
+    
+    # Pure bookkeeping, no browser calls
+    readiness_summary = BasePage.readiness_summary
+    
+    async def click_element(self, selector: str):
+        """Click on an element"""
+        await self.page.click(selector)
+    
+    async def scroll_to_element(self, selector: str):
+        """Scroll to a specific element"""
+        element = self.page.locator(selector).first
+        await element.scroll_into_view_if_needed()
+    
+    async def get_text(self, selector: str) -> str:
+        """Get text from an element"""
+        return await self.page.locator(selector).first.inner_text()
+    
+    async def get_all_elements(self, selector: str):
+        """Get all elements matching selector"""
+        return await self.page.locator(selector).all()
+    
+    async def extract_batch(self, schema: list) -> list:
+        """Extract many fields in one page.evaluate call (see BasePage.extract_batch)"""
+        results = await self.page.evaluate(EXTRACT_BATCH_JS, schema)
+        for idx, (record, result) in enumerate(zip(schema, results), 1):
+            missing = [f"{field} ({record[field]['selector']})" for field, value in result.items() if value is None]
+            if missing:
+                print(f"   ⚠️  Record {idx}: missing {', '.join(missing)}")
+        return results
+    
+    async def resolve(self, name: str, candidates, timeout: int = 5000):
+        """
+        Resolve a list of fallback selectors in one wait
+        Returns (selector, locator) of a visible candidate; raises SelectorNotFound
+        """
+        return await get_resolver().resolve_async(self.page, name, candidates, timeout)
+    
+    async def wait_for_element(self, selector: str, timeout: int = 10000):
+        """Wait for element to be visible"""
+        await self.page.wait_for_selector(selector, timeout=timeout)
+    
+    async def download_image(self, img_url: str, save_path: str):
+        """Download an image from URL"""
+        result = (await self.download_images([(img_url, save_path)]))[0]
+        if not result['ok']:
+            raise Exception(f"Could not download image: {result['url']} ({result['error']})")
+        return result
+    
+    async def download_images(self, jobs) -> list:
+        """
+        Download (url, save_path) pairs concurrently over a pooled session
+        Runs in a worker thread, so the event loop keeps driving the other pages
+        """
+        jobs = [
+            (url if url.startswith('http') else f"{self.base_url}{url}", path)
+            for url, path in jobs
+        ]
+        return await asyncio.to_thread(get_downloader().download_all, jobs)
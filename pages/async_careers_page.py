@@ -0,0 +1,281 @@
+"""
+Async Careers Page Object Model: CareersPage on playwright.async_api
+"""
+import asyncio
+import os
+from pages.async_base_page import AsyncBasePage
+from pages.careers_page import (
+    CAREERS_HREF_JS,
+    CAREERS_LINK_SELECTORS,
+    CAREERS_MENU_LINK,
+    CAREERS_URL,
+    CORE_VALUE_CONFIGS,
+    CORE_VALUE_IMAGE_IDS,
+    CORE_VALUES_MARKERS,
+    LIFE_AT_TRG_SELECTORS,
+    RENDERED_SIZE_JS,
+    WHO_WE_ARE_MENU,
+    WHO_WE_ARE_SELECTORS,
+    CareersPage,
+    cached_careers_url,
+    core_value_image_jobs,
+    core_values_schema,
+    image_srcs_schema,
+    name_by_content,
+    remember_careers_url,
+    rendered_image_jobs,
+    report_downloads,
+    shape_core_values,
+)
+from utils.downloader import format_results, get_downloader
+from utils.network_archive import is_replaying
+from utils.parallel import atomic_write_json
+from utils.wix_media import format_savings, image_fetch_settings
+
+
+class AsyncCareersPage(AsyncBasePage):
+    
+    READINESS = CareersPage.READINESS
+    HOME_READINESS = CareersPage.HOME_READINESS
+    
+    # Image srcs captured by extract_core_values for download_core_value_images
+    core_value_image_srcs = None
+    
+    async def get_careers_url(self, refresh=False):
+        """
+        Resolve the Careers URL: memory cache, then file cache, then the homepage DOM
+        Shares its cache with CareersPage
+        """
+        cached = None if refresh else cached_careers_url()
+        if cached:
+            return cached
+        
+        print("   → Reading Careers link from homepage...")
+        await self.page.goto(self.base_url, wait_until="domcontentloaded")
+        href = await self.page.evaluate(CAREERS_HREF_JS)
+        if not href:
+            print(f"   ⚠️  Careers link not found, using default: {CAREERS_URL}")
+            href = CAREERS_URL
+        return remember_careers_url(href)
+    
+    async def open_careers(self):
+        """Fast path: open the Careers page directly in the current page"""
+        url = await self.get_careers_url()
+        print(f"   → Opening Careers page directly: {url}")
+        await self.goto_ready(url)
+        print(f"   ✅ Loaded: {self.page.url}")
+    
+    async def follow_popup(self, popup):
+        """Load a popup's URL in the current page and close the popup"""
+        await popup.wait_for_url(lambda url: url != "about:blank", wait_until="commit", timeout=15000)
+        url = popup.url
+        await popup.close()
+        await self.goto_ready(url, timeout=15000)
+    
+    async def wait_for_menu(self, timeout: int) -> bool:
+        """Back off before a retry until the 'Who we are' menu is visible again (bounded by timeout)"""
+        return await self.waits.for_element(WHO_WE_ARE_MENU, state="visible", timeout=timeout, required=False)
+    
+    async def navigate_to_careers(self):
+        """Navigate to Careers page through the 'Who we are' menu, with retry logic"""
+        print("   → Step 1: Opening TRG main website...")
+        await self.navigate_to(contract=self.HOME_READINESS)
+        print(f"   ✅ Loaded: {self.page.url}")
+        
+        await self.accept_cookies()
+        
+        max_attempts = 3
+        
+        for attempt in range(1, max_attempts + 1):
+            print(f"\n   🔄 ATTEMPT {attempt}/{max_attempts}")
+        
+            try:
+                print("   → Step 2: Hovering over 'Who we are' menu...")
+                try:
+                    _, who_element = await self.resolve("who_we_are_menu", WHO_WE_ARE_SELECTORS, timeout=5000)
+                    await who_element.hover(timeout=5000)
+                    print(f"   ✅ Hovering over 'Who we are'...")
+                except Exception as e:
+                    print(f"   ⚠️  'Who we are' menu not found: {str(e)[:50]}")
+                    print(f"   ⚠️  Could not hover on attempt {attempt}")
+                    if attempt < max_attempts:
+                        await self.wait_for_menu(timeout=2000)
+                        continue
+                    raise Exception("❌ Could not find 'Who we are' menu after 3 attempts!")
+        
+                print("   → Waiting for dropdown menu to stabilize...")
+                careers_link = self.page.locator(CAREERS_MENU_LINK).first
+                careers_link_ready = False
+                for wait_attempt in range(3):
+                    try:
+                        await self.waits.for_element(careers_link, state="visible", timeout=5000)
+                        await self.waits.for_element_stable(careers_link, timeout=1500, required=False)
+                        if await careers_link.is_visible():
+                            print(f"   ✅ Careers link is stable and ready")
+                            careers_link_ready = True
+                            break
+                    except Exception:
+                        print(f"   → Wait attempt {wait_attempt + 1}/3...")
+        
+                if not careers_link_ready:
+                    print(f"   ⚠️  Careers link not ready on attempt {attempt}")
+                    if attempt < max_attempts:
+                        print(f"   → Retrying...")
+                        continue
+        
+                print("   → Step 3: Clicking 'Careers' link...")
+                careers_clicked = False
+                try:
+                    selector, element = await self.resolve("careers_link", CAREERS_LINK_SELECTORS, timeout=2000)
+                    print(f"   → Trying to click: {selector}")
+                    async with self.page.context.expect_page(timeout=10000) as new_page_info:
+                        await element.click(timeout=5000)
+                        print(f"   ✅ Clicked!")
+                        careers_clicked = True
+        
+                    await self.follow_popup(await new_page_info.value)
+                    print(f"   ✅ Switched to: {self.page.url}")
+        
+                    if "careers.trgint.com" in self.page.url:
+                        print("   ✅ Successfully on Careers page!")
+                        return
+                except Exception as e:
+                    print(f"   ⚠️  Careers link failed: {str(e)[:50]}")
+        
+                if careers_clicked and "careers" in self.page.url.lower():
+                    print("   ✅ On a careers page!")
+                    return
+        
+                print(f"   ⚠️  Could not click Careers on attempt {attempt}")
+                if attempt < max_attempts:
+                    print(f"   → Retrying...")
+                    await self.navigate_to(contract=self.HOME_READINESS)
+                else:
+                    raise Exception("❌ Could not click 'Careers' link after 3 attempts!")
+        
+            except Exception as e:
+                if attempt == max_attempts:
+                    print(f"\n   ❌ All {max_attempts} attempts failed!")
+                    raise Exception(f"❌ Could not navigate to Careers: {str(e)}")
+                else:
+                    print(f"   ⚠️  Attempt {attempt} failed: {str(e)[:60]}")
+                    print(f"   → Retrying...")
+                    await self.wait_for_menu(timeout=3000)
+    
+    async def scroll_to_life_at_trg(self):
+        """Navigate to #Life at TRG section"""
+        print("   → Navigating to 'Life at TRG' section...")
+        
+        try:
+            _, link = await self.resolve("life_at_trg_link", LIFE_AT_TRG_SELECTORS, timeout=5000)
+            await link.click(timeout=5000)
+            print("   ✅ Clicked 'Life at TRG' link")
+            await self.waits.for_scroll_settled(timeout=3000, required=False)
+            return
+        except Exception:
+            pass
+        
+        print("   → Scrolling to Life at TRG section...")
+        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.4)")
+        await self.waits.for_scroll_settled(timeout=2000, required=False)
+    
+    async def scroll_to_core_values(self):
+        """Scroll to Core Values section - target the blue text or the cards"""
+        print("   → Scrolling to Core Values section...")
+        
+        try:
+            selector, element = await self.resolve("core_values_marker", CORE_VALUES_MARKERS, timeout=5000)
+            await element.scroll_into_view_if_needed()
+            await self.waits.for_scroll_settled(timeout=2000, required=False)
+            print(f"   ✅ Scrolled to Core Values (using: {selector})")
+        
+            await self.page.evaluate("window.scrollBy(0, -150)")
+            await self.waits.for_scroll_settled(timeout=1000, required=False)
+            return
+        except Exception:
+            pass
+        
+        print("   → Using fallback scroll position...")
+        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.5)")
+        await self.waits.for_scroll_settled(timeout=2000, required=False)
+    
+    async def open_core_values(self):
+        """Open the Careers page and scroll down to the Core Values section"""
+        await self.open_careers()
+        await self.scroll_to_life_at_trg()
+        await self.scroll_to_core_values()
+    
+    async def extract_core_values(self):
+        """Extract EXACTLY 4 core values with their unique headlines and descriptions"""
+        print("   → Extracting core values...")
+        
+        await self.waits.for_element(CORE_VALUE_CONFIGS[0]['caption_selector'], state="attached",
+                                     timeout=5000, required=False)
+        results = await self.extract_batch(core_values_schema())
+        self.core_value_image_srcs = [result['image'] for result in results]
+        return shape_core_values(results)
+    
+    def save_core_values_to_json(self, core_values, file_path):
+        """Save core values to JSON file (atomically, safe for parallel workers)"""
+        atomic_write_json(file_path, core_values, indent=2, ensure_ascii=False)
+        print(f"   ✅ Saved to: {file_path}")
+    
+    # Pure computation, no browser calls
+    count_exclamation_marks = CareersPage.count_exclamation_marks
+    
+    async def download_core_value_images(self, core_values, output_dir):
+        """
+        Download the 4 core value images and name them after the headlines
+        Falls back to an element screenshot for images that could not be downloaded
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        print("   → Downloading core value images...")
+        
+        image_srcs = self.core_value_image_srcs
+        if image_srcs is None:
+            results = await self.extract_batch(image_srcs_schema(CORE_VALUE_IMAGE_IDS))
+            image_srcs = [result['image'] for result in results]
+        
+        jobs = core_value_image_jobs(core_values, image_srcs, output_dir)
+        
+        fetch = image_fetch_settings()
+        originals = {}
+        if fetch['mode'] == 'rendered':
+            sizes = await self.page.evaluate(RENDERED_SIZE_JS, CORE_VALUE_IMAGE_IDS)
+            jobs, originals = rendered_image_jobs(jobs, sizes, fetch)
+        
+        results = await self.download_images([(src, filepath) for _, src, filepath in jobs if src])
+        saved_paths = name_by_content(results)
+        print(format_results(results))
+        # Savings are a live-site measurement; offline the HEADs for the originals would only add archive misses
+        if originals and not is_replaying():
+            lengths = await asyncio.to_thread(get_downloader().content_lengths, originals.values())
+            print(format_savings(results, originals, dict(zip(originals.values(), lengths))))
+        
+        downloaded = []
+        
+        for img_id, src, filepath in jobs:
+            if filepath in saved_paths:
+                downloaded.append(saved_paths[filepath])
+                continue
+            try:
+                print(f"      → Trying screenshot method for {img_id}...")
+                await self.page.locator(img_id).first.screenshot(path=filepath, timeout=5000)
+                downloaded.append(filepath)
+                print(f"   ✓ Screenshot saved: {os.path.basename(filepath)}")
+            except Exception as e:
+                print(f"   ❌ Screenshot also failed: {str(e)[:60]}")
+        
+        report_downloads(downloaded)
+        return downloaded
+    
+    async def download_image(self, url, filepath):
+        """Download image from URL, falling back to an element screenshot"""
+        try:
+            return await super().download_image(url, filepath)
+        except Exception as e:
+            print(f"   ⚠️ Download failed: {str(e)[:50]}")
+            try:
+                await self.page.locator(f"img[src='{url}']").first.screenshot(path=filepath)
+            except Exception:
+                raise Exception(f"Could not download image: {url}")
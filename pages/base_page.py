@@ -2,44 +2,184 @@
 Base Page class with common methods for all page objects
 """
 from playwright.sync_api import Page
+from utils.consent import COOKIE_BUTTONS, consent_preloaded
+from utils.downloader import get_downloader
+from utils.readiness import NetworkActivity, ReadinessContract, now_ms
+from utils.selector_resolver import get_resolver
+from utils.tracer import traced
+from utils.waits import WaitEngine
+
+
+BASE_URL = "https://www.trgint.com"
+
+# Resolves a whole extraction schema in the browser in a single round trip.
+# Text fields use innerText; attribute fields try each attribute on the
+# element and then on its first <img> descendant (Wix wraps images).
+EXTRACT_BATCH_JS = """
+(schema) => schema.map(record => {
+    const out = {};
+    for (const [field, spec] of Object.entries(record)) {
+        const el = document.querySelector(spec.selector);
+        let value = null;
+        if (el && spec.attributes) {
+            for (const target of [el, el.querySelector('img')].filter(Boolean)) {
+                value = spec.attributes.map(a => target.getAttribute(a)).find(v => v) || null;
+                if (value) break;
+            }
+        } else if (el) {
+            value = (el.innerText || el.textContent || '').trim() || null;
+        }
+        out[field] = value;
+    }
+    return out;
+})
+"""
 
 
 class BasePage:
+    
+    # What "loaded" means for this page object (see utils.readiness)
+    READINESS = ReadinessContract("page", selectors=("body",))
+    
     def __init__(self, page: Page):
         self.page = page
-        self.base_url = "https://www.trgint.com"
+        self.base_url = BASE_URL
+        self.waits = WaitEngine(page)
+        self.network = NetworkActivity(page)
+        self.readiness = []
     
-    def navigate_to(self, path: str = ""):
-        """Navigate to a specific path on the website"""
+    @traced()
+    def navigate_to(self, path: str = "", contract: ReadinessContract = None):
+        """Navigate to a specific path on the website and wait for its readiness contract"""
         url = f"{self.base_url}{path}"
-        self.page.goto(url, wait_until="networkidle")
+        self.goto_ready(url, contract)
+    
+    @traced()
+    def goto_ready(self, url: str, contract: ReadinessContract = None, timeout: int = 30000) -> bool:
+        """
+        Load url and wait only for the readiness contract (not networkidle)
+        Returns whether the contract was met; the timing is kept for readiness_summary
+        """
+        contract = contract or self.READINESS
+        started = now_ms()
+        self.page.goto(url, wait_until=contract.load_state, timeout=timeout)
+        met = contract.wait(self.waits)
+        self.readiness.append({
+            "url": url,
+            "contract": contract.name,
+            "started": started,
+            "ready": now_ms(),
+            "met": met
+        })
+        if not met:
+            print(f"   ⚠️  Readiness contract not met: {contract}")
+        return met
     
+    @traced()
+    def accept_cookies(self, timeout: int = 2000) -> bool:
+        """
+        Accept the cookie banner if it appears within timeout
+        Returns True when a banner was accepted
+        """
+        if consent_preloaded(self.page.context):
+            print("   ℹ️  Cookie consent preloaded from the session state")
+            return False
+        print("   → Checking for cookies popup...")
+        button = self.page.locator(COOKIE_BUTTONS).first
+        if not self.waits.for_element(button, state="visible", timeout=timeout, required=False):
+            print("   ℹ️  No cookies popup")
+            return False
+        try:
+            button.click(timeout=timeout)
+        except Exception as e:
+            print(f"   ⚠️  Could not accept cookies: {str(e)[:60]}")
+            return False
+        print("   ✅ Accepted cookies")
+        self.waits.for_element(button, state="hidden", timeout=2000, required=False)
+        return True
+    
+    def readiness_summary(self):
+        """How long each navigation took to be ready, and how far ahead of networkidle"""
+        lines = [f"   🚦 Readiness: {len(self.readiness)} navigations"]
+        for idx, record in enumerate(self.readiness):
+            # Network activity after the next navigation started belongs to that page
+            until = self.readiness[idx + 1]["started"] if idx + 1 < len(self.readiness) else None
+            idle = self.network.idle_at(record["started"], until)
+            ready_ms = record["ready"] - record["started"]
+            if idle is None:
+                lead = "networkidle not reached"
+            else:
+                lead = f"{idle - record['ready']:+.0f} ms ahead of networkidle"
+            status = "✓" if record["met"] else "⚠️ not met"
+            lines.append(f"      {ready_ms:8.0f} ms  {record['contract']}: {lead} {status}")
+        return "\n".join(lines)
+    
+    @traced()
     def click_element(self, selector: str):
         """Click on an element"""
         self.page.click(selector)
     
+    @traced()
     def scroll_to_element(self, selector: str):
         """Scroll to a specific element"""
         element = self.page.locator(selector).first
         element.scroll_into_view_if_needed()
     
+    @traced()
     def get_text(self, selector: str) -> str:
         """Get text from an element"""
         return self.page.locator(selector).first.inner_text()
     
+    @traced()
     def get_all_elements(self, selector: str):
         """Get all elements matching selector"""
         return self.page.locator(selector).all()
     
+    @traced()
+    def extract_batch(self, schema: list) -> list:
+        """
+        Extract many fields in one page.evaluate call
+        
+        schema: list of records, each mapping field name to
+            {'selector': <CSS selector>}                        -> inner text
+            {'selector': <CSS selector>, 'attributes': [...]}   -> first non-empty attribute
+        Returns one dict per record; missing fields are None and reported
+        immediately instead of waiting for a locator timeout.
+        """
+        results = self.page.evaluate(EXTRACT_BATCH_JS, schema)
+        for idx, (record, result) in enumerate(zip(schema, results), 1):
+            missing = [f"{field} ({record[field]['selector']})" for field, value in result.items() if value is None]
+            if missing:
+                print(f"   ⚠️  Record {idx}: missing {', '.join(missing)}")
+        return results
+    
+    def resolve(self, name: str, candidates, timeout: int = 5000):
+        """
+        Resolve a list of fallback selectors in one wait
+        Returns (selector, locator) of a visible candidate; raises SelectorNotFound
+        """
+        return get_resolver().resolve(self.page, name, candidates, timeout)
+    
     def wait_for_element(self, selector: str, timeout: int = 10000):
         """Wait for element to be visible"""
         self.page.wait_for_selector(selector, timeout=timeout)
     
+    @traced()
     def download_image(self, img_url: str, save_path: str):
         """Download an image from URL"""
-        if img_url and not img_url.startswith('http'):
-            img_url = f"{self.base_url}{img_url}"
-        
-        response = self.page.request.get(img_url)
-        with open(save_path, 'wb') as f:
-            f.write(response.body())
\ No newline at end of file
+        result = self.download_images([(img_url, save_path)])[0]
+        if not result['ok']:
+            raise Exception(f"Could not download image: {result['url']} ({result['error']})")
+        return result
+    
+    @traced()
+    def download_images(self, jobs) -> list:
+        """
+        Download (url, save_path) pairs concurrently over a pooled session
+        Returns one result dict per job with bytes, elapsed_ms, ok and error
+        """
+        jobs = [
+            (url if url.startswith('http') else f"{self.base_url}{url}", path)
+            for url, path in jobs
+        ]
+        return get_downloader().download_all(jobs)
@@ -1,124 +1,381 @@
 """
 Careers Page Object Model - OPTIMIZED VERSION
 """
-import json
 import os
-import time
-import requests
 from pages.base_page import BasePage
+from utils.downloader import format_results, get_downloader
+from utils.network_archive import is_replaying
+from utils.parallel import atomic_write_bytes, atomic_write_json
+from utils.readiness import ReadinessContract
+from utils.tracer import span, traced
+from utils.wix_media import fix_extension, format_savings, image_fetch_settings, original_url, transform_url
+
+
+CAREERS_URL = "https://careers.trgint.com"
+CAREERS_URL_CACHE = "data/.cache/careers_url.txt"
+
+# Finds the Careers link in the homepage DOM without hovering the menu
+CAREERS_HREF_JS = """
+() => {
+    const links = [...document.querySelectorAll('a[href]')];
+    const link = links.find(a => a.href.includes('careers.trgint.com'))
+        || links.find(a => /career/i.test(a.href));
+    return link ? link.href : null;
+}
+"""
+
+# Image URL attributes, in order of preference
+IMAGE_ATTRIBUTES = ['src', 'data-src']
+
+# Rendered size of each image in device pixels ([width, height] or null), in one call
+RENDERED_SIZE_JS = """
+(selectors) => selectors.map(selector => {
+    const el = document.querySelector(selector);
+    const img = el && (el.tagName === 'IMG' ? el : el.querySelector('img'));
+    if (!img) return null;
+    const rect = img.getBoundingClientRect();
+    const ratio = window.devicePixelRatio || 1;
+    return rect.width && rect.height ? [Math.round(rect.width * ratio), Math.round(rect.height * ratio)] : null;
+})
+"""
+
+# Configuration for each core value with specific selectors
+CORE_VALUE_CONFIGS = [
+    {
+        'img_id': '#img_comp-lopjihj5',
+        'caption_selector': '#comp-lopj2yq19 h5',
+        'description_selector': '#comp-lopj2yq24 p',
+        'fallback_headline': 'Whatever it takes!',
+        'fallback_description': 'We are committed to going above and beyond to deliver exceptional results.'
+    },
+    {
+        'img_id': '#img_comp-lopjqpzg',
+        'caption_selector': '#comp-lopjqpzr h5',
+        'description_selector': '#comp-lopjqq02 p',
+        'fallback_headline': 'We work together.',
+        'fallback_description': 'Collaboration and teamwork are at the heart of everything we do.'
+    },
+    {
+        'img_id': '#img_comp-lopjqjx9',
+        'caption_selector': '#comp-lopjqjxj h5',
+        'description_selector': '#comp-lopjqjxr p',
+        'fallback_headline': 'We make an impact.',
+        'fallback_description': 'Our work creates meaningful change and drives real results.'
+    },
+    {
+        'img_id': '#img_comp-lopjlapk',
+        'caption_selector': '#comp-lopjlap1 h5',
+        'description_selector': '#comp-lopjlapb p',
+        'fallback_headline': 'Passion is our fuel.',
+        'fallback_description': 'Our passion drives us to excel and innovate every day.'
+    }
+]
+
+
+# Candidates for each element resolve() races, in order of preference
+WHO_WE_ARE_SELECTORS = [
+    "a:has-text('Who we are')",
+    "a:has-text('Who We Are')",
+    "[href*='who-we-are']"
+]
+# Any of the candidates, for waits that only need the menu to be on screen
+WHO_WE_ARE_MENU = ", ".join(WHO_WE_ARE_SELECTORS)
+CAREERS_LINK_SELECTORS = [
+    "a:has-text('Careers')",
+    "a:has-text('Career')",
+    "[href*='careers.trgint.com']",
+    "[href*='career']"
+]
+LIFE_AT_TRG_SELECTORS = [
+    "a[href*='#Life at TRG']",
+    "a:has-text('Life at TRG')",
+]
+# The blue text is the most reliable marker, the headings are the fallback
+CORE_VALUES_MARKERS = [
+    ":text('Our passion drives us')",
+    ":text('Whatever it takes!')",
+    "h2:has-text('Core Values')",
+    "h3:has-text('Core Values')"
+]
+
+# The Careers entry of the 'Who we are' dropdown, waited on before clicking
+CAREERS_MENU_LINK = "a:has-text('Careers')"
+
+# Image IDs matching the order of core values
+CORE_VALUE_IMAGE_IDS = [config['img_id'] for config in CORE_VALUE_CONFIGS]
+
+
+def core_values_schema() -> list:
+    """extract_batch schema for the headline, description and image src of every core value"""
+    return [
+        {
+            'headline': {'selector': config['caption_selector']},
+            'description': {'selector': config['description_selector']},
+            'image': {'selector': config['img_id'], 'attributes': IMAGE_ATTRIBUTES}
+        }
+        for config in CORE_VALUE_CONFIGS
+    ]
+
+
+def image_srcs_schema(image_ids) -> list:
+    """extract_batch schema for the src of each image"""
+    return [{'image': {'selector': img_id, 'attributes': IMAGE_ATTRIBUTES}} for img_id in image_ids]
+
+
+def shape_core_values(results) -> list:
+    """
+    Core values from read_core_values_section records, in CORE_VALUE_CONFIGS order
+    Missing headlines and descriptions take the config's fallback text
+    """
+    core_values = []
+    
+    for idx, (config, result) in enumerate(zip(CORE_VALUE_CONFIGS, results)):
+        print(f"\n   → Core value {idx+1}/4...")
+        
+        headline = result['headline']
+        if headline:
+            print(f"      Headline: '{headline}'")
+        else:
+            headline = config['fallback_headline']
+            print(f"      Headline (fallback): '{headline}'")
+        
+        description = result['description']
+        if description:
+            print(f"      Description: '{description[:60]}...'")
+        else:
+            description = config['fallback_description']
+            print(f"      Description (fallback): '{description[:60]}...'")
+        
+        core_values.append({
+            "headline": headline,
+            "description": description
+        })
+        print(f"   ✓ Extracted core value {idx+1}")
+    
+    print(f"\n   ✅ Total extracted: {len(core_values)} core values")
+    return core_values
+
+
+def image_file_name(headline: str) -> str:
+    """File name for a core value image, generated from its headline"""
+    safe_name = headline.replace('!', '').replace('.', '').replace(' ', '-').lower().strip('-')
+    return f"{safe_name}.png"
+
+
+def absolute_image_url(src):
+    """Make a protocol- or site-relative image src absolute (None stays None)"""
+    if src and src.startswith('//'):
+        return 'https:' + src
+    if src and src.startswith('/'):
+        return 'https://careers.trgint.com' + src
+    return src
+
+
+def core_value_image_jobs(core_values, image_srcs, output_dir) -> list:
+    """Resolve the (img_id, url, filepath) download job of every core value image"""
+    jobs = []
+    for idx, (core_value, img_id, src) in enumerate(zip(core_values, CORE_VALUE_IMAGE_IDS, image_srcs)):
+        headline = core_value['headline']
+        filepath = os.path.join(output_dir, image_file_name(headline))
+        src = absolute_image_url(src)
+        
+        print(f"\n   → Image {idx+1}/4: '{headline}' ({img_id})")
+        print(f"      Image URL: {(src or 'no src found')[:80]}...")
+        jobs.append((img_id, src, filepath))
+    return jobs
+
+
+def report_downloads(downloaded: list):
+    """Print how many of the 4 core value images ended up on disk"""
+    print(f"\n   ✅ Downloaded {len(downloaded)}/4 images")
+    
+    if len(downloaded) < 4:
+        print(f"   ⚠️  Warning: Only {len(downloaded)} images downloaded instead of 4")
+
+
+def rendered_image_jobs(jobs, sizes, fetch: dict):
+    """
+    Rewrite the (img_id, src, filepath) jobs of Wix images to their rendered size and format
+    Returns the new jobs and {rendered url: original url}
+    """
+    rendered_jobs = []
+    originals = {}
+    for (img_id, src, filepath), size in zip(jobs, sizes):
+        rendered = transform_url(src, *size, image_format=fetch['image_format'],
+                                 quality=fetch['quality']) if src and size else src
+        if rendered != src:
+            originals[rendered] = original_url(src)
+            print(f"      {img_id}: requesting {size[0]}x{size[1]} {fetch['image_format']}")
+        rendered_jobs.append((img_id, rendered, filepath))
+    return rendered_jobs, originals
+
+
+def name_by_content(results) -> dict:
+    """Give every downloaded file the extension of its real type; returns {requested path: saved path}"""
+    saved = {}
+    for result in results:
+        if result['ok']:
+            requested = result['path']
+            result['path'] = fix_extension(requested)
+            saved[requested] = result['path']
+    return saved
+
+
+def cached_careers_url():
+    """Careers URL from the memory cache, then the file cache (None when neither has one)"""
+    if CareersPage._careers_url:
+        return CareersPage._careers_url
+    if os.path.exists(CAREERS_URL_CACHE):
+        with open(CAREERS_URL_CACHE, encoding='utf-8') as f:
+            cached = f.read().strip()
+        if cached:
+            CareersPage._careers_url = cached
+            return cached
+    return None
+
+
+def remember_careers_url(href: str) -> str:
+    """Store a resolved Careers URL in both caches (atomically on disk, other workers may be reading)"""
+    CareersPage._careers_url = href
+    atomic_write_bytes(CAREERS_URL_CACHE, href.encode('utf-8'))
+    return href
 
 
 class CareersPage(BasePage):
     
+    # Careers page: the Wix site container is rendered and the layout has settled
+    READINESS = ReadinessContract("careers", selectors=("#SITE_CONTAINER",), stable_ms=300)
+    
+    # Homepage: the 'Who we are' menu can be hovered
+    HOME_READINESS = ReadinessContract("home", selectors=("a[href*='who-we-are'], a:has-text('Who we are')",),
+                                       stable_ms=300)
+    
+    # Careers URL resolved once per process, shared by all page objects
+    _careers_url = None
+    
+    # Image srcs captured by extract_core_values for download_core_value_images
+    core_value_image_srcs = None
+    
+    @traced()
+    def get_careers_url(self, refresh=False):
+        """
+        Resolve the Careers URL: memory cache, then file cache, then the homepage DOM
+        """
+        cached = None if refresh else cached_careers_url()
+        if cached:
+            return cached
+        
+        print("   → Reading Careers link from homepage...")
+        self.page.goto(self.base_url, wait_until="domcontentloaded")
+        href = self.page.evaluate(CAREERS_HREF_JS)
+        if not href:
+            print(f"   ⚠️  Careers link not found, using default: {CAREERS_URL}")
+            href = CAREERS_URL
+        return remember_careers_url(href)
+    
+    @traced()
+    def open_careers(self):
+        """
+        Fast path: open the Careers page directly in the current page
+        No homepage menu hover, no popup tab
+        """
+        url = self.get_careers_url()
+        print(f"   → Opening Careers page directly: {url}")
+        self.goto_ready(url)
+        print(f"   ✅ Loaded: {self.page.url}")
+    
+    @traced()
+    def follow_popup(self, popup):
+        """
+        Load a popup's URL in the current page and close the popup,
+        so the test's page stays the one holding the content
+        """
+        popup.wait_for_url(lambda url: url != "about:blank", wait_until="commit", timeout=15000)
+        url = popup.url
+        popup.close()
+        self.goto_ready(url, timeout=15000)
+    
+    def wait_for_menu(self, timeout: int) -> bool:
+        """
+        Back off before a retry until the 'Who we are' menu is visible again
+        Bounded by timeout; returns whether the menu came back
+        """
+        return self.waits.for_element(WHO_WE_ARE_MENU, state="visible", timeout=timeout, required=False)
+    
+    @traced()
     def navigate_to_careers(self):
-        """Navigate to Careers page with retry logic"""
+        """Navigate to Careers page through the 'Who we are' menu, with retry logic"""
         print("   → Step 1: Opening TRG main website...")
-        self.page.goto("https://www.trgint.com", wait_until="networkidle")
-        time.sleep(3)
+        self.navigate_to(contract=self.HOME_READINESS)
         print(f"   ✅ Loaded: {self.page.url}")
         
-        # Accept cookies
-        print("   → Checking for cookies popup...")
-        try:
-            for button in ["button:has-text('Accept')", "button:has-text('I Accept')"]:
-                try:
-                    self.page.click(button, timeout=2000)
-                    print("   ✅ Accepted cookies")
-                    time.sleep(1)
-                    break
-                except:
-                    continue
-        except:
-            print("   ℹ️  No cookies popup")
+        # Accept cookies (skipped when the session's consent state was preloaded)
+        self.accept_cookies()
         
         # RETRY LOOP - Try up to 3 times
         max_attempts = 3
         
         for attempt in range(1, max_attempts + 1):
-            print(f"\n   🔄 ATTEMPT {attempt}/{max_attempts}")
+            with span(f"attempt {attempt}/{max_attempts}"):
+                print(f"\n   🔄 ATTEMPT {attempt}/{max_attempts}")
             
-            try:
-                # HOVER over "Who we are"
-                print("   → Step 2: Hovering over 'Who we are' menu...")
-                
-                who_selectors = [
-                    "a:has-text('Who we are')",
-                    "a:has-text('Who We Are')",
-                    "[href*='who-we-are']"
-                ]
+                try:
+                    # HOVER over "Who we are"
+                    print("   → Step 2: Hovering over 'Who we are' menu...")
                 
-                who_element = None
-                hovered = False
-                for selector in who_selectors:
+                    hovered = False
                     try:
-                        who_element = self.page.locator(selector).first
+                        # All candidates are raced in one wait instead of one timeout each
+                        _, who_element = self.resolve("who_we_are_menu", WHO_WE_ARE_SELECTORS, timeout=5000)
                         who_element.hover(timeout=5000)
                         print(f"   ✅ Hovering over 'Who we are'...")
                         hovered = True
-                        break
-                    except:
-                        continue
+                    except Exception as e:
+                        print(f"   ⚠️  'Who we are' menu not found: {str(e)[:50]}")
                 
-                if not hovered:
-                    print(f"   ⚠️  Could not hover on attempt {attempt}")
-                    if attempt < max_attempts:
-                        time.sleep(2)
-                        continue
-                    else:
-                        raise Exception("❌ Could not find 'Who we are' menu after 3 attempts!")
+                    if not hovered:
+                        print(f"   ⚠️  Could not hover on attempt {attempt}")
+                        if attempt < max_attempts:
+                            self.wait_for_menu(timeout=2000)
+                            continue
+                        else:
+                            raise Exception("❌ Could not find 'Who we are' menu after 3 attempts!")
                 
-                # Wait for dropdown animation to complete and link to stabilize
-                print("   → Waiting for dropdown menu to stabilize...")
+                    # Wait for dropdown animation to complete and link to stabilize
+                    print("   → Waiting for dropdown menu to stabilize...")
                 
-                # Wait for Careers link to be both visible AND stable (not moving)
-                careers_link_ready = False
-                for wait_attempt in range(3):
-                    try:
-                        # Wait for link to exist and be visible
-                        careers_link = self.page.locator("a:has-text('Careers')").first
-                        
-                        # Wait for element to be stable (attached, visible, stable, enabled)
-                        careers_link.wait_for(state="visible", timeout=5000)
+                    # Wait for Careers link to be both visible AND stable (not moving)
+                    careers_link_ready = False
+                    for wait_attempt in range(3):
+                        try:
+                            # Wait for link to exist and be visible
+                            careers_link = self.page.locator(CAREERS_MENU_LINK).first
                         
-                        # Additional check - make sure it's really ready
-                        time.sleep(1.5)
+                            # Wait for the link to be visible and the dropdown animation to end
+                            self.waits.for_element(careers_link, state="visible", timeout=5000)
+                            self.waits.for_element_stable(careers_link, timeout=1500, required=False)
                         
-                        # Verify it's still visible after wait
-                        if careers_link.is_visible():
-                            print(f"   ✅ Careers link is stable and ready")
-                            careers_link_ready = True
-                            break
-                    except:
-                        print(f"   → Wait attempt {wait_attempt + 1}/3...")
-                        time.sleep(1)
-                
-                if not careers_link_ready:
-                    print(f"   ⚠️  Careers link not ready on attempt {attempt}")
-                    if attempt < max_attempts:
-                        print(f"   → Retrying...")
-                        time.sleep(2)
-                        continue
+                            # Verify it's still visible after wait
+                            if careers_link.is_visible():
+                                print(f"   ✅ Careers link is stable and ready")
+                                careers_link_ready = True
+                                break
+                        except:
+                            print(f"   → Wait attempt {wait_attempt + 1}/3...")
                 
-                # Click "Careers" from dropdown
-                print("   → Step 3: Clicking 'Careers' link...")
+                    if not careers_link_ready:
+                        print(f"   ⚠️  Careers link not ready on attempt {attempt}")
+                        if attempt < max_attempts:
+                            print(f"   → Retrying...")
+                            continue
                 
-                careers_selectors = [
-                    "a:has-text('Careers')",
-                    "a:has-text('Career')",
-                    "[href*='careers.trgint.com']",
-                    "[href*='career']"
-                ]
+                    # Click "Careers" from dropdown
+                    print("   → Step 3: Clicking 'Careers' link...")
                 
-                careers_clicked = False
+                    careers_clicked = False
                 
-                for selector in careers_selectors:
                     try:
-                        element = self.page.locator(selector).first
-                        
-                        # Double check visibility
-                        if not element.is_visible(timeout=2000):
-                            continue
-                        
+                        selector, element = self.resolve("careers_link", CAREERS_LINK_SELECTORS, timeout=2000)
                         print(f"   → Trying to click: {selector}")
                         
                         # Try to click with new tab expectation
@@ -126,78 +383,66 @@ class CareersPage(BasePage):
                             element.click(timeout=5000)
                             print(f"   ✅ Clicked!")
                             careers_clicked = True
-                            time.sleep(2)
                         
-                        # Switch to new tab
-                        new_page = new_page_info.value
-                        self.page = new_page
-                        self.page.wait_for_load_state('networkidle', timeout=15000)
-                        time.sleep(2)
+                        # Continue in the current page and close the popup tab
+                        self.follow_popup(new_page_info.value)
                         
                         print(f"   ✅ Switched to: {self.page.url}")
                         
                         if "careers.trgint.com" in self.page.url:
                             print("   ✅ Successfully on Careers page!")
                             return
-                        
-                        break
-                        
+                    
                     except Exception as e:
-                        print(f"   ⚠️  Selector '{selector}' failed: {str(e)[:50]}")
-                        continue
+                        print(f"   ⚠️  Careers link failed: {str(e)[:50]}")
                 
-                if careers_clicked:
-                    # Successfully clicked but maybe wrong page?
-                    if "careers" in self.page.url.lower():
-                        print("   ✅ On a careers page!")
-                        return
+                    if careers_clicked:
+                        # Successfully clicked but maybe wrong page?
+                        if "careers" in self.page.url.lower():
+                            print("   ✅ On a careers page!")
+                            return
                 
-                # If we get here, click didn't work
-                print(f"   ⚠️  Could not click Careers on attempt {attempt}")
+                    # If we get here, click didn't work
+                    print(f"   ⚠️  Could not click Careers on attempt {attempt}")
                 
-                if attempt < max_attempts:
-                    print(f"   → Retrying in 3 seconds...")
-                    time.sleep(3)
-                    # Refresh page for next attempt
-                    self.page.goto("https://www.trgint.com", wait_until="networkidle")
-                    time.sleep(2)
-                else:
-                    raise Exception("❌ Could not click 'Careers' link after 3 attempts!")
+                    if attempt < max_attempts:
+                        print(f"   → Retrying...")
+                        # Refresh page for next attempt
+                        self.navigate_to(contract=self.HOME_READINESS)
+                    else:
+                        raise Exception("❌ Could not click 'Careers' link after 3 attempts!")
                     
-            except Exception as e:
-                if attempt == max_attempts:
-                    # Last attempt failed
-                    print(f"\n   ❌ All {max_attempts} attempts failed!")
-                    raise Exception(f"❌ Could not navigate to Careers: {str(e)}")
-                else:
-                    print(f"   ⚠️  Attempt {attempt} failed: {str(e)[:60]}")
-                    print(f"   → Retrying...")
-                    time.sleep(3)
+                except Exception as e:
+                    if attempt == max_attempts:
+                        # Last attempt failed
+                        print(f"\n   ❌ All {max_attempts} attempts failed!")
+                        raise Exception(f"❌ Could not navigate to Careers: {str(e)}")
+                    else:
+                        print(f"   ⚠️  Attempt {attempt} failed: {str(e)[:60]}")
+                        print(f"   → Retrying...")
+                        self.wait_for_menu(timeout=3000)
     
+    @traced()
     def scroll_to_life_at_trg(self):
         """Navigate to #Life at TRG section"""
         print("   → Navigating to 'Life at TRG' section...")
         
         # Click on navigation link
-        life_selectors = [
-            "a[href*='#Life at TRG']",
-            "a:has-text('Life at TRG')",
-        ]
-        
-        for selector in life_selectors:
-            try:
-                self.page.click(selector, timeout=5000)
-                print("   ✅ Clicked 'Life at TRG' link")
-                time.sleep(3)
-                return
-            except:
-                continue
+        try:
+            _, link = self.resolve("life_at_trg_link", LIFE_AT_TRG_SELECTORS, timeout=5000)
+            link.click(timeout=5000)
+            print("   ✅ Clicked 'Life at TRG' link")
+            self.waits.for_scroll_settled(timeout=3000, required=False)
+            return
+        except Exception:
+            pass
         
         # If link not found, scroll manually
         print("   → Scrolling to Life at TRG section...")
         self.page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.4)")
-        time.sleep(2)
+        self.waits.for_scroll_settled(timeout=2000, required=False)
     
+    @traced()
     def scroll_to_core_values(self):
         """
         Scroll to Core Values section - target the blue text or the cards
@@ -205,123 +450,62 @@ class CareersPage(BasePage):
         print("   → Scrolling to Core Values section...")
         
         # Try to find and scroll to the blue text (most reliable marker)
-        selectors = [
-            ":text('Our passion drives us')",
-            ":text('Whatever it takes!')",
-            "h2:has-text('Core Values')",
-            "h3:has-text('Core Values')"
-        ]
-        
-        for selector in selectors:
-            try:
-                element = self.page.locator(selector).first
-                element.scroll_into_view_if_needed()
-                time.sleep(2)
-                print(f"   ✅ Scrolled to Core Values (using: {selector})")
-                
-                # Scroll up a bit to show the whole section
-                self.page.evaluate("window.scrollBy(0, -150)")
-                time.sleep(1)
-                return
-            except:
-                continue
+        try:
+            selector, element = self.resolve("core_values_marker", CORE_VALUES_MARKERS, timeout=5000)
+            element.scroll_into_view_if_needed()
+            self.waits.for_scroll_settled(timeout=2000, required=False)
+            print(f"   ✅ Scrolled to Core Values (using: {selector})")
+            
+            # Scroll up a bit to show the whole section
+            self.page.evaluate("window.scrollBy(0, -150)")
+            self.waits.for_scroll_settled(timeout=1000, required=False)
+            return
+        except Exception:
+            pass
         
         # Fallback - scroll to approximate position
         print("   → Using fallback scroll position...")
         self.page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.5)")
-        time.sleep(2)
+        self.waits.for_scroll_settled(timeout=2000, required=False)
+    
+    @traced()
+    def open_core_values(self):
+        """Open the Careers page and scroll down to the Core Values section (the content tests' start state)"""
+        self.open_careers()
+        self.scroll_to_life_at_trg()
+        self.scroll_to_core_values()
+    
+    @traced()
+    def read_core_values_section(self):
+        """
+        Read the headline, description and image src of every core value in one call
+        Missing fields are None; this is also what the incremental mode fingerprints
+        """
+        # Give lazily rendered sections a short chance to appear, then read everything at once
+        self.waits.for_element(CORE_VALUE_CONFIGS[0]['caption_selector'], state="attached",
+                               timeout=5000, required=False)
+        results = self.extract_batch(core_values_schema())
+        self.core_value_image_srcs = [result['image'] for result in results]
+        return results
     
-    def extract_core_values(self):
+    @traced()
+    def extract_core_values(self, results=None):
         """
         Extract EXACTLY 4 core values with their unique headlines and descriptions
         Each core value has its own specific description
+        results: records already read by read_core_values_section (read again when None)
         """
         print("   → Extracting core values...")
         
-        # Configuration for each core value with specific selectors
-        core_value_configs = [
-            {
-                'img_id': '#img_comp-lopjihj5',
-                'caption_selector': '#comp-lopj2yq19 h5',
-                'description_selector': '#comp-lopj2yq24 p',
-                'fallback_headline': 'Whatever it takes!',
-                'fallback_description': 'We are committed to going above and beyond to deliver exceptional results.'
-            },
-            {
-                'img_id': '#img_comp-lopjqpzg',
-                'caption_selector': '#comp-lopjqpzr h5',
-                'description_selector': '#comp-lopjqq02 p',
-                'fallback_headline': 'We work together.',
-                'fallback_description': 'Collaboration and teamwork are at the heart of everything we do.'
-            },
-            {
-                'img_id': '#img_comp-lopjqjx9',
-                'caption_selector': '#comp-lopjqjxj h5',
-                'description_selector': '#comp-lopjqjxr p',
-                'fallback_headline': 'We make an impact.',
-                'fallback_description': 'Our work creates meaningful change and drives real results.'
-            },
-            {
-                'img_id': '#img_comp-lopjlapk',
-                'caption_selector': '#comp-lopjlap1 h5',
-                'description_selector': '#comp-lopjlapb p',
-                'fallback_headline': 'Passion is our fuel.',
-                'fallback_description': 'Our passion drives us to excel and innovate every day.'
-            }
-        ]
-        
-        core_values = []
-        
-        # Extract each core value with its unique description
-        for idx, config in enumerate(core_value_configs):
-            try:
-                print(f"\n   → Extracting core value {idx+1}/4...")
-                
-                # Extract headline/caption
-                headline = None
-                try:
-                    caption_element = self.page.locator(config['caption_selector']).first
-                    headline = caption_element.inner_text().strip()
-                    print(f"      Headline: '{headline}'")
-                except Exception as e:
-                    print(f"   ⚠️  Could not find headline, using fallback")
-                    headline = config['fallback_headline']
-                    print(f"      Headline (fallback): '{headline}'")
-                
-                # Extract description
-                description = None
-                try:
-                    desc_element = self.page.locator(config['description_selector']).first
-                    description = desc_element.inner_text().strip()
-                    print(f"      Description: '{description[:60]}...'")
-                except Exception as e:
-                    print(f"   ⚠️  Could not find description, using fallback")
-                    description = config['fallback_description']
-                    print(f"      Description (fallback): '{description[:60]}...'")
-                
-                # Add to list
-                core_values.append({
-                    "headline": headline,
-                    "description": description
-                })
-                print(f"   ✓ Extracted core value {idx+1}")
-                
-            except Exception as e:
-                print(f"   ❌ Error extracting core value {idx+1}: {str(e)[:80]}")
-                # Use fallback
-                core_values.append({
-                    "headline": config['fallback_headline'],
-                    "description": config['fallback_description']
-                })
+        if results is None:
+            results = self.read_core_values_section()
         
-        print(f"\n   ✅ Total extracted: {len(core_values)} core values")
-        return core_values
+        return shape_core_values(results)
     
+    @traced()
     def save_core_values_to_json(self, core_values, file_path):
-        """Save core values to JSON file"""
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(core_values, f, indent=2, ensure_ascii=False)
+        """Save core values to JSON file (atomically, safe for parallel workers)"""
+        atomic_write_json(file_path, core_values, indent=2, ensure_ascii=False)
         print(f"   ✅ Saved to: {file_path}")
     
     def count_exclamation_marks(self, core_values):
@@ -344,6 +528,7 @@ class CareersPage(BasePage):
         print(f"\n   ✅ Total exclamation marks: {count}")
         return count
     
+    @traced()
     def download_core_value_images(self, core_values, output_dir):
         """
         Download the 4 core value images using their specific IDs
@@ -352,104 +537,56 @@ class CareersPage(BasePage):
         os.makedirs(output_dir, exist_ok=True)
         print("   → Downloading core value images...")
         
-        # Image IDs matching the order of core values
-        image_ids = [
-            '#img_comp-lopjihj5',  # Whatever it takes!
-            '#img_comp-lopjqpzg',  # We work together.
-            '#img_comp-lopjqjx9',  # We make an impact.
-            '#img_comp-lopjlapk'   # Passion is our fuel.
-        ]
+        # Reuse the srcs read by extract_core_values, otherwise read them all in one call
+        image_srcs = self.core_value_image_srcs
+        if image_srcs is None:
+            results = self.extract_batch(image_srcs_schema(CORE_VALUE_IMAGE_IDS))
+            image_srcs = [result['image'] for result in results]
+        
+        # Resolve URLs and target files for every image first
+        jobs = core_value_image_jobs(core_values, image_srcs, output_dir)
+        
+        # Rendered mode: ask Wix for the size the images are shown at instead of the originals
+        fetch = image_fetch_settings()
+        originals = {}
+        if fetch['mode'] == 'rendered':
+            sizes = self.page.evaluate(RENDERED_SIZE_JS, CORE_VALUE_IMAGE_IDS)
+            jobs, originals = rendered_image_jobs(jobs, sizes, fetch)
+        
+        # Download all images concurrently over one pooled session
+        print(f"\n   → Downloading {sum(1 for _, src, _ in jobs if src)} images concurrently...")
+        results = self.download_images([(src, filepath) for _, src, filepath in jobs if src])
+        saved_paths = name_by_content(results)
+        print(format_results(results))
+        # Savings are a live-site measurement; offline the HEADs for the originals would only add archive misses
+        if originals and not is_replaying():
+            sizes = dict(zip(originals.values(), get_downloader().content_lengths(originals.values())))
+            print(format_savings(results, originals, sizes))
         
         downloaded = []
         
-        for idx, (core_value, img_id) in enumerate(zip(core_values, image_ids)):
+        for img_id, src, filepath in jobs:
+            if filepath in saved_paths:
+                downloaded.append(saved_paths[filepath])
+                continue
+            
+            # Try alternative: screenshot the image element
             try:
-                headline = core_value['headline']
-                
-                print(f"\n   → Processing image {idx+1}/4: '{headline}'")
-                print(f"      Image ID: {img_id}")
-                
-                # Find the image element
-                try:
-                    img_element = self.page.locator(img_id).first
-                    
-                    # Try to get src attribute
-                    src = img_element.get_attribute('src')
-                    
-                    if not src:
-                        # Try data-src or other attributes
-                        src = img_element.get_attribute('data-src')
-                    
-                    if not src:
-                        print(f"   ⚠️  No src found, trying to screenshot the element...")
-                        # Take screenshot of the image element
-                        safe_name = headline.replace('!', '').replace('.', '').replace(' ', '-').lower().strip('-')
-                        filename = f"{safe_name}.png"
-                        filepath = os.path.join(output_dir, filename)
-                        
-                        img_element.screenshot(path=filepath)
-                        downloaded.append(filepath)
-                        print(f"   ✓ Screenshot saved: {filename}")
-                        continue
-                    
-                    # Make absolute URL if needed
-                    if src.startswith('//'):
-                        src = 'https:' + src
-                    elif src.startswith('/'):
-                        src = 'https://careers.trgint.com' + src
-                    
-                    print(f"      Image URL: {src[:80]}...")
-                    
-                    # Generate filename from headline
-                    safe_name = headline.replace('!', '').replace('.', '').replace(' ', '-').lower().strip('-')
-                    filename = f"{safe_name}.png"
-                    filepath = os.path.join(output_dir, filename)
-                    
-                    # Download the image
-                    print(f"      → Downloading...")
-                    self.download_image(src, filepath)
-                    downloaded.append(filepath)
-                    print(f"   ✓ Downloaded: {filename}")
-                    
-                except Exception as e:
-                    print(f"   ⚠️ Error with image {img_id}: {str(e)[:60]}")
-                    
-                    # Try alternative: screenshot the image element
-                    try:
-                        print(f"      → Trying screenshot method...")
-                        img_element = self.page.locator(img_id).first
-                        
-                        safe_name = headline.replace('!', '').replace('.', '').replace(' ', '-').lower().strip('-')
-                        filename = f"{safe_name}.png"
-                        filepath = os.path.join(output_dir, filename)
-                        
-                        img_element.screenshot(path=filepath)
-                        downloaded.append(filepath)
-                        print(f"   ✓ Screenshot saved: {filename}")
-                    except Exception as e2:
-                        print(f"   ❌ Screenshot also failed: {str(e2)[:60]}")
-                    
+                print(f"      → Trying screenshot method for {img_id}...")
+                self.page.locator(img_id).first.screenshot(path=filepath, timeout=5000)
+                downloaded.append(filepath)
+                print(f"   ✓ Screenshot saved: {os.path.basename(filepath)}")
             except Exception as e:
-                print(f"   ❌ Error processing image {idx+1}: {str(e)[:80]}")
-                continue
-        
-        print(f"\n   ✅ Downloaded {len(downloaded)}/4 images")
-        
-        if len(downloaded) < 4:
-            print(f"   ⚠️  Warning: Only {len(downloaded)} images downloaded instead of 4")
+                print(f"   ❌ Screenshot also failed: {str(e)[:60]}")
         
+        report_downloads(downloaded)
         return downloaded
     
+    @traced()
     def download_image(self, url, filepath):
-        """Download image from URL"""
+        """Download image from URL, falling back to an element screenshot"""
         try:
-            # Use requests to download
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-                
+            return super().download_image(url, filepath)
         except Exception as e:
             print(f"   ⚠️ Download failed: {str(e)[:50]}")
             
@@ -458,4 +595,4 @@ class CareersPage(BasePage):
                 img_element = self.page.locator(f"img[src='{url}']").first
                 img_element.screenshot(path=filepath)
             except:
-                raise Exception(f"Could not download image: {url}")
\ No newline at end of file
+                raise Exception(f"Could not download image: {url}")
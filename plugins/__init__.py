@@ -0,0 +1,27 @@
+"""
+Pytest plugins loaded on demand by conftest.py
+
+The browser plugin (fixtures, Playwright, HTML report extras) is only
+imported when a collected test needs a browser, so runs of pure-Python
+tests start without importing Playwright at all.
+"""
+
+
+BROWSER_PLUGIN = "plugins.browser"
+
+# Fixtures that need Chromium; a test requesting any of them loads the browser plugin
+BROWSER_FIXTURES = frozenset({
+    "page", "context", "browser", "browser_pool", "consent_state", "async_browser", "async_context_factory",
+    "async_consent_state", "careers_page", "shared_careers",
+})
+
+
+def uses_browser(item) -> bool:
+    """Whether a collected test requests a browser fixture (directly or through its own fixtures)"""
+    return not BROWSER_FIXTURES.isdisjoint(getattr(item, "fixturenames", ()))
+
+
+def load_browser_plugin(config):
+    """Import and register the browser plugin once; its pytest_configure runs on registration"""
+    if not config.pluginmanager.has_plugin(BROWSER_PLUGIN):
+        config.pluginmanager.import_plugin(BROWSER_PLUGIN)
@@ -0,0 +1,561 @@
+"""
+Browser plugin: Playwright fixtures, per-test artifacts and HTML report extras
+
+Loaded by conftest.py only when a collected test requests a browser
+fixture (see plugins.BROWSER_FIXTURES), and always on the xdist
+controller, which merges what the workers produced.
+"""
+import os
+import time
+
+import pytest
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+from pytest_html import extras
+from pages.async_careers_page import AsyncCareersPage
+from pages.base_page import BASE_URL
+from pages.careers_page import CAREERS_URL, CareersPage
+from plugins import uses_browser
+from utils.async_runner import AsyncRunner
+from utils.browser_pool import BrowserPool
+from utils.browser_server import BrowserServer
+from utils.browser_trace import PYTEST_PLAYWRIGHT_MODES, TracePolicy
+from utils.consent import capture_consent_state, capture_consent_state_async, mark_consent_preloaded
+from utils.downloader import configure_downloader, save_shared_cache, shared_cache_stats
+from utils.fan_out import ContextSpec
+from utils.image_cache import ImageCache
+from utils.log_renderer import LOG_STYLESHEET, format_logs_for_html
+from utils.network_archive import NetworkArchive, merge_worker_indexes, set_active_archive
+from utils.page_state import SharedPage
+from utils.parallel import is_xdist_controller, merge_worker_outputs
+from utils.route_filter import ResourceSizes, RouteFilter, format_filter_stats
+from utils.screenshots import ScreenshotPolicy
+from utils.selector_resolver import SelectorStats, configure_resolver, format_dead_weight, get_resolver
+from utils.tracer import TIMELINE_STYLESHEET, Tracer, render_waterfall, start_trace, stop_trace, timeline_path
+from utils.wix_media import configure_image_fetch
+
+
+screenshot_policy_key = pytest.StashKey[ScreenshotPolicy]()
+trace_policy_key = pytest.StashKey[TracePolicy]()
+# (context, chunk) whose Playwright trace is still recording, per test item
+trace_context_key = pytest.StashKey[tuple]()
+tracer_key = pytest.StashKey[Tracer]()
+# BrowserServer the async browser is connected to (None without one)
+async_server_key = pytest.StashKey[object]()
+
+
+def get_browser_settings(config):
+    """
+    Resolve browser settings from CLI options and ini values
+    --headed and --slowmo come from pytest-playwright when it is installed
+    """
+    headed = config.getoption("--headed", default=False)
+    slow_mo = config.getoption("--slowmo", default=0) or int(config.getini("browser_slow_mo"))
+    pool_size = config.getoption("--browser-pool-size") or int(config.getini("browser_pool_size"))
+    return {
+        "headless": config.getini("browser_headless") and not headed,
+        "slow_mo": slow_mo,
+        "size": pool_size
+    }
+
+
+def get_browser_server(config, playwright, headless):
+    """BrowserServer for the persistent Chromium, or None when browser_server is off"""
+    if not (config.getoption("--browser-server", default=False) or config.getini("browser_server")):
+        return None
+    return BrowserServer(
+        playwright.chromium.executable_path,
+        headless=headless,
+        idle_seconds=float(config.getini("browser_server_idle_minutes")) * 60,
+        directory=config.getini("browser_server_dir")
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_pool(pytestconfig):
+    """Launch browsers once per session (once per worker under xdist), or connect to the browser server"""
+    settings = get_browser_settings(pytestconfig)
+    with sync_playwright() as p:
+        server = get_browser_server(pytestconfig, p, settings["headless"])
+        if server is not None:
+            start = time.perf_counter()
+            endpoint = server.endpoint()
+            print(f"\n   → Browser server {'reused' if server.reused else 'launched'} at {endpoint} "
+                  f"({time.perf_counter() - start:.2f}s)")
+        pool = BrowserPool(p, server=server, **settings)
+        yield pool
+        pool.close()
+        if server is not None:
+            server.touch()
+
+
+@pytest.fixture(scope="session")
+def network_archive(pytestconfig):
+    """Record or replay archive shared by the browser and requests downloads"""
+    mode = pytestconfig.getoption("--network-mode") or pytestconfig.getini("network_mode")
+    path = pytestconfig.getoption("--network-archive") or pytestconfig.getini("network_archive")
+    archive = NetworkArchive(path, mode)
+    set_active_archive(archive)
+    yield archive
+    set_active_archive(None)
+    if mode == "record":
+        archive.save()
+    elif mode == "replay" and archive.misses:
+        print(f"\n   ⚠️  Network replay: {archive.misses} requests not in archive (aborted)")
+
+
+@pytest.fixture(scope="session")
+def resource_sizes():
+    """Sizes of resources seen on earlier runs, used to estimate the bytes a block saved"""
+    sizes = ResourceSizes()
+    yield sizes
+    sizes.save()
+
+
+def build_route_filter(config, allow=(), sizes=None):
+    """RouteFilter from the ini settings, or None when filtering is disabled"""
+    if config.getoption("--no-route-filter") or not config.getini("route_filter"):
+        return None
+    return RouteFilter(
+        block_types=config.getini("route_block_types"),
+        block_domains=config.getini("route_block_domains"),
+        allow=list(config.getini("route_allow")) + list(allow),
+        sizes=sizes
+    )
+
+
+def node_route_filter(node, config, sizes=None):
+    """build_route_filter() plus the allow_resources patterns marked on node or its parents"""
+    allow = [pattern for marker in node.iter_markers("allow_resources") for pattern in marker.args]
+    return build_route_filter(config, allow, sizes)
+
+
+@pytest.fixture(scope="function")
+def route_filter(request, pytestconfig, resource_sizes):
+    """
+    Per-test request filter (None when disabled)
+    Tests add allowlist entries with @pytest.mark.allow_resources("pattern", ...)
+    """
+    return node_route_filter(request.node, pytestconfig, resource_sizes)
+
+
+@pytest.fixture(scope="session")
+def consent_state(pytestconfig, browser_pool, network_archive, tmp_path_factory):
+    """
+    Accept cookie consent once per session (per worker under xdist) and
+    return the saved storage state file, or None with --cold-state or when
+    no banner could be accepted
+    """
+    if pytestconfig.getoption("--cold-state"):
+        return None
+    context = browser_pool.new_context(viewport={"width": 1920, "height": 1080})
+    network_archive.attach(context)
+    route_filter = build_route_filter(pytestconfig)
+    if route_filter is not None:
+        route_filter.install(context)
+    try:
+        print("\n   → Accepting cookie consent once for the session...")
+        path = capture_consent_state(context, CareersPage(context.new_page()),
+                                     [BASE_URL, CAREERS_URL],
+                                     str(tmp_path_factory.mktemp("consent") / "storage_state.json"))
+        print("   ✅ Consent state saved" if path else "   ⚠️  No consent banner accepted, tests start cold")
+        return path
+    except Exception as e:
+        print(f"   ⚠️  Could not capture consent state, tests start cold: {str(e)[:80]}")
+        return None
+    finally:
+        context.close()
+
+
+@pytest.fixture(scope="session")
+def fan_out_contexts(pytestconfig):
+    """Viewport/locale combinations the fan-out extraction runs in"""
+    return [ContextSpec.parse(spec) for spec in pytestconfig.getini("fan_out_contexts")]
+
+
+@pytest.fixture(scope="function")
+def browser(browser_pool):
+    """Shared browser instance from the session pool"""
+    return browser_pool.acquire()
+
+
+def new_test_context(request, browser_pool, network_archive, route_filter, consent_state, browser=None):
+    """
+    Browser context for request.node (a test, or a module sharing one page): the session's
+    consent state unless the node is marked cold_state, the network archive, the route
+    filter and, when tracing is on, a started trace
+    """
+    storage_state = None if request.node.get_closest_marker("cold_state") else consent_state
+    context = browser_pool.new_context(
+        browser,
+        viewport={"width": 1920, "height": 1080},
+        storage_state=storage_state
+    )
+    if storage_state is not None:
+        mark_consent_preloaded(context)
+    network_archive.attach(context)
+    # Registered last so it runs first; requests it lets through fall back to the archive
+    if route_filter is not None:
+        route_filter.install(context)
+    request.config.stash[trace_policy_key].start(context, title=request.node.nodeid)
+    return context
+
+
+@pytest.fixture(scope="function")
+def context(request, browser_pool, browser, network_archive, route_filter, consent_state):
+    """
+    Create a fresh, isolated browser context for each test
+    Preloaded with the session's cookie consent unless the test is marked cold_state
+    """
+    context = new_test_context(request, browser_pool, network_archive, route_filter, consent_state, browser)
+    # Buffered by Playwright; pytest_runtest_makereport writes it only when the outcome keeps it
+    trace_policy = request.config.stash[trace_policy_key]
+    if trace_policy.enabled:
+        request.node.stash[trace_context_key] = (context, False)
+    yield context
+    if request.node.stash.get(trace_context_key, None) is not None:
+        # The test body never ran (setup error): nothing to debug in the trace
+        del request.node.stash[trace_context_key]
+        trace_policy.stop(context, request.node.nodeid, failed=False)
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def page(context):
+    """Create a new page for each test"""
+    page = context.new_page()
+    yield page
+    page.close()
+
+
+@pytest.fixture(scope="module")
+def shared_careers(request, pytestconfig, browser_pool, network_archive, resource_sizes, consent_state):
+    """
+    One Careers page per module, opened and scrolled to Core Values once
+    Set up like the context fixture; cold_state and allow_resources apply when set on the module
+    """
+    # Every test records its own chunk of this context's trace (see careers_page)
+    context = new_test_context(request, browser_pool, network_archive,
+                               node_route_filter(request.node, pytestconfig, resource_sizes), consent_state)
+    trace_policy = pytestconfig.stash[trace_policy_key]
+    shared = SharedPage(lambda: CareersPage(context.new_page()), CareersPage.open_core_values)
+    start = time.perf_counter()
+    print("\n   → Opening the shared Careers page for the module...")
+    shared.navigate()
+    print(f"   ✅ Shared Careers page ready ({time.perf_counter() - start:.1f}s)")
+    yield shared
+    print(f"\n{shared.summary()}")
+    if trace_policy.enabled:
+        context.tracing.stop()
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def careers_page(request, shared_careers):
+    """
+    CareersPage already scrolled to Core Values, shared by the module's tests
+    Restored to its snapshot before the test; navigated again only when that fails
+    """
+    shared_careers.restore()
+    context = shared_careers.page.context
+    trace_policy = request.config.stash[trace_policy_key]
+    if trace_policy.enabled:
+        trace_policy.start_chunk(context, title=request.node.nodeid)
+        request.node.stash[trace_context_key] = (context, True)
+    yield shared_careers.page_object
+    if request.node.stash.get(trace_context_key, None) is not None:
+        del request.node.stash[trace_context_key]
+        trace_policy.stop(context, request.node.nodeid, failed=False, chunk=True)
+
+
+@pytest.fixture(scope="session")
+def async_runner():
+    """Session event loop that drives the async page objects"""
+    runner = AsyncRunner()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def async_browser(pytestconfig, async_runner):
+    """One Chromium on playwright.async_api, shared by every concurrent flow of the session"""
+    settings = get_browser_settings(pytestconfig)
+    playwright = async_runner.run(async_playwright().start())
+    server = get_browser_server(pytestconfig, playwright, settings["headless"])
+    pytestconfig.stash[async_server_key] = server
+    if server is not None:
+        browser = async_runner.run(playwright.chromium.connect_over_cdp(server.endpoint(),
+                                                                         slow_mo=settings["slow_mo"]))
+    else:
+        browser = async_runner.run(playwright.chromium.launch(headless=settings["headless"],
+                                                              slow_mo=settings["slow_mo"]))
+    yield browser
+    async_runner.run(browser.close())
+    async_runner.run(playwright.stop())
+    if server is not None:
+        server.touch()
+
+
+@pytest.fixture(scope="session")
+def async_consent_state(pytestconfig, async_runner, async_browser, network_archive, tmp_path_factory):
+    """
+    consent_state captured on the async browser, so concurrent flows never
+    start the sync Playwright (None with --cold-state)
+    """
+    if pytestconfig.getoption("--cold-state"):
+        return None
+
+    async def capture():
+        context = await async_browser.new_context(viewport={"width": 1920, "height": 1080})
+        await network_archive.attach_async(context)
+        route_filter = build_route_filter(pytestconfig)
+        if route_filter is not None:
+            await route_filter.install_async(context)
+        try:
+            return await capture_consent_state_async(context, AsyncCareersPage(await context.new_page()),
+                                                     [BASE_URL, CAREERS_URL],
+                                                     str(tmp_path_factory.mktemp("consent") / "storage_state.json"))
+        finally:
+            await context.close()
+
+    try:
+        print("\n   → Accepting cookie consent once for the async browser...")
+        path = async_runner.run(capture())
+        print("   ✅ Consent state saved" if path else "   ⚠️  No consent banner accepted, async flows start cold")
+        return path
+    except Exception as e:
+        print(f"   ⚠️  Could not capture consent state, async flows start cold: {str(e)[:80]}")
+        return None
+
+
+@pytest.fixture(scope="function")
+def async_context_factory(request, async_runner, async_browser, network_archive, route_filter, async_consent_state):
+    """
+    Coroutine that creates isolated async contexts, set up like the context fixture
+    (consent state, network archive, route filter); all are closed after the test
+    """
+    storage_state = None if request.node.get_closest_marker("cold_state") else async_consent_state
+    server = request.config.stash[async_server_key]
+    contexts = []
+
+    async def new_context(**kwargs):
+        kwargs.setdefault("viewport", {"width": 1920, "height": 1080})
+        if server is not None:
+            server.touch()
+        context = await async_browser.new_context(storage_state=storage_state, **kwargs)
+        contexts.append(context)
+        if storage_state is not None:
+            mark_consent_preloaded(context)
+        await network_archive.attach_async(context)
+        if route_filter is not None:
+            await route_filter.install_async(context)
+        return context
+
+    yield new_context
+    for context in contexts:
+        async_runner.run(context.close())
+
+
+def pytest_configure(config):
+    """Configure the shared downloader, resolver and artifact policies; add browser metadata"""
+    # Shared image downloader (cache is created on first download)
+    if config.getoption("--no-image-cache", default=False):
+        configure_downloader()
+    else:
+        configure_downloader(cache=ImageCache(
+            config.getini("image_cache_dir"),
+            max_bytes=int(config.getini("image_cache_max_mb")) * 1024 * 1024
+        ))
+    
+    configure_image_fetch(
+        config.getoption("--image-fetch", default=None) or config.getini("image_fetch"),
+        image_format=config.getini("image_format"),
+        quality=int(config.getini("image_quality"))
+    )
+    
+    # Shared selector resolver; its stats persist between runs
+    configure_resolver(config.getini("selector_stats"))
+    
+    tracing = PYTEST_PLAYWRIGHT_MODES.get(config.getoption("--tracing", default=None))
+    config.stash[trace_policy_key] = TracePolicy(
+        mode=config.getoption("--trace-mode") or tracing or config.getini("trace_mode"),
+        screenshots=config.getini("trace_screenshots"),
+        snapshots=config.getini("trace_snapshots"),
+        sources=config.getini("trace_sources"),
+        max_mb=float(config.getini("trace_max_mb")),
+        output_dir=os.path.join(config.getini("artifacts_dir"), "traces")
+    )
+    
+    config.stash[screenshot_policy_key] = ScreenshotPolicy(
+        mode=config.getoption("--screenshot-mode") or config.getini("screenshot_mode"),
+        full_page=config.getini("screenshot_full_page") or config.getoption("--full-page-screenshot", default=False),
+        fmt=config.getini("screenshot_format"),
+        quality=int(config.getini("screenshot_quality")),
+        scale=float(config.getini("screenshot_scale")),
+        output_dir=os.path.join(config.getini("artifacts_dir"), "screenshots")
+    )
+    
+    # Browser metadata for the HTML report (conftest.py set the general entries)
+    settings = get_browser_settings(config)
+    config._metadata.update({
+        'Playwright Mode': 'Headless' if settings['headless'] else 'Headed (visible browser)',
+        'Browser Pool Size': settings['size'],
+        'Browser Server': 'On' if config.getoption("--browser-server") or config.getini("browser_server") else 'Off',
+        'Network Mode': config.getoption("--network-mode") or config.getini("network_mode"),
+        'Route Filter': 'Off' if config.getoption("--no-route-filter") or not config.getini("route_filter") else 'On',
+        'Playwright Trace': config.stash[trace_policy_key].mode
+    })
+
+
+def pytest_sessionfinish(session):
+    """Save selector stats and the image cache index; merge per-worker outputs once all xdist workers are done"""
+    config = session.config
+    get_resolver().stats.save()
+    save_shared_cache()
+    if not is_xdist_controller(config):
+        return
+    merged = merge_worker_outputs(config.getini("output_dir"))
+    if merged:
+        print(f"\n   ✅ Merged {len(merged)} worker output files into {config.getini('output_dir')}")
+    merge_worker_indexes(config.getoption("--network-archive") or config.getini("network_archive"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Trace page-object steps while the test body runs"""
+    if not uses_browser(item):
+        yield
+        return
+    start_trace(item.nodeid)
+    try:
+        yield
+    finally:
+        item.stash[tracer_key] = stop_trace()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Hook to customize test reports
+    Captures logs and screenshots for HTML report (browser tests only;
+    pure-Python tests keep pytest-html's plain report)
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if not uses_browser(item):
+        return
+    
+    # Initialize extras list for HTML report
+    report.extras = getattr(report, 'extras', [])
+    
+    # Add logs and screenshots only during test execution (not setup/teardown)
+    if report.when == 'call':
+        
+        # ===== CAPTURE LOGS =====
+        # Capture stdout (print statements)
+        if hasattr(report, 'capstdout') and report.capstdout:
+            formatted_logs = format_logs_for_html(report.capstdout)
+            report.extras.append(extras.html(formatted_logs))
+        
+        # Capture stderr (error messages)
+        if hasattr(report, 'capstderr') and report.capstderr:
+            report.extras.append(extras.text(report.capstderr, name="Error Output"))
+        
+        # ===== STEP TIMELINE =====
+        tracer = item.stash.get(tracer_key, None)
+        if tracer is not None and tracer.spans:
+            path = timeline_path(os.path.join(item.config.getini("artifacts_dir"), "timelines"), item.nodeid)
+            tracer.save(path)
+            report.extras.append(extras.html(render_waterfall(tracer.to_dict())))
+            report.extras.append(extras.url(report_relative_path(item.config, path), name="Step timeline (JSON)"))
+        
+        # ===== BLOCKED REQUESTS =====
+        route_filter = getattr(item, 'funcargs', {}).get('route_filter')
+        if route_filter is not None:
+            report.extras.append(extras.html(
+                f'<p style="font-size: 14px;"><strong>🚫 {format_filter_stats(route_filter.stats())}</strong></p>'
+            ))
+        
+        # ===== CAPTURE SCREENSHOT =====
+        policy = item.config.stash[screenshot_policy_key]
+        funcargs = getattr(item, 'funcargs', {})
+        page = funcargs['page'] if 'page' in funcargs else getattr(funcargs.get('careers_page'), 'page', None)
+        if page is not None and policy.should_capture(report.failed):
+            try:
+                # Written as a separate file and linked from the report (not inlined)
+                screenshot_path = policy.capture(page, item.nodeid)
+                screenshot_link = report_relative_path(item.config, screenshot_path)
+                
+                if report.failed:
+                    # Red banner for failed tests
+                    report.extras.append(extras.html('<h3 style="color: red;">❌ Test Failed - Screenshot:</h3>'))
+                    report.extras.append(extras.image(screenshot_link, name="Failure Screenshot",
+                                                      mime_type=policy.mime_type, extension=policy.extension))
+                else:
+                    # Green banner for passed tests
+                    report.extras.append(extras.html('<h3 style="color: green;">✅ Test Passed - Final Screenshot:</h3>'))
+                    report.extras.append(extras.image(screenshot_link, name="Success Screenshot",
+                                                      mime_type=policy.mime_type, extension=policy.extension))
+                    
+            except Exception as e:
+                # If screenshot fails, add note to report
+                report.extras.append(extras.text(f"Could not capture screenshot: {str(e)}", name="Screenshot Error"))
+        
+        # ===== PLAYWRIGHT TRACE =====
+        traced_context = item.stash.get(trace_context_key, None)
+        if traced_context is not None:
+            del item.stash[trace_context_key]
+            context, chunk = traced_context
+            try:
+                trace_path = item.config.stash[trace_policy_key].stop(context, item.nodeid, report.failed,
+                                                                      chunk=chunk)
+            except Exception as e:
+                report.extras.append(extras.text(f"Could not save trace: {str(e)}", name="Trace Error"))
+            else:
+                if trace_path is not None:
+                    trace_link = report_relative_path(item.config, trace_path)
+                    report.extras.append(extras.url(trace_link, name="Playwright trace (zip)"))
+                    report.extras.append(extras.html(
+                        f'<p style="font-size: 14px;">🔍 Open with <code>playwright show-trace {trace_link}</code>'
+                        f' or drop it on trace.playwright.dev</p>'
+                    ))
+    
+    # ===== ADD TEST DURATION =====
+    if hasattr(report, 'duration'):
+        duration_html = f'<p style="font-size: 14px; margin-top: 10px;"><strong>⏱️ Test Duration:</strong> {report.duration:.2f} seconds</p>'
+        report.extras.append(extras.html(duration_html))
+
+
+def report_relative_path(config, path):
+    """Path of an artifact relative to the HTML report, so the report can link to it"""
+    html_path = config.getoption("htmlpath", default=None)
+    report_dir = os.path.dirname(os.path.abspath(html_path)) if html_path else os.getcwd()
+    return os.path.relpath(os.path.abspath(path), report_dir).replace(os.sep, "/")
+
+
+def format_cache_stats(stats):
+    """One-line summary of image cache counters"""
+    return (f"Image cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['revalidations']} revalidations, {stats['evictions']} evictions "
+            f"({stats['entries']} entries, {stats['bytes'] / 1024 / 1024:.1f} MB)")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print image cache counters and dead fallback selectors at the end of the run"""
+    stats = shared_cache_stats()
+    if stats:
+        terminalreporter.write_line(format_cache_stats(stats))
+    # Read from disk: under xdist the workers saved the stats
+    dead_weight = SelectorStats(config.getini("selector_stats")).dead_weight()
+    if dead_weight:
+        terminalreporter.write_line(format_dead_weight(dead_weight))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    """Add the shared log and timeline stylesheets and image cache counters to the HTML report summary"""
+    prefix.append(LOG_STYLESHEET)
+    prefix.append(TIMELINE_STYLESHEET)
+    stats = shared_cache_stats()
+    if stats:
+        prefix.append(f'<p style="font-size: 14px;"><strong>🗂️ {format_cache_stats(stats)}</strong></p>')
@@ -0,0 +1,225 @@
+"""
+Test suite for the async page object building blocks
+"""
+import asyncio
+import time
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pages.async_careers_page import AsyncCareersPage
+from pages.careers_page import WHO_WE_ARE_MENU
+from utils.async_runner import AsyncRunner, gather_limited, run_async
+from utils.readiness import ReadinessContract
+from utils.route_filter import RouteFilter
+from utils.selector_resolver import SelectorResolver, SelectorStats
+from utils.waits import AsyncWaitEngine, WaitTimeout
+
+
+class FakeLocator:
+    """Union of selectors; visible when any of them is on the fake page"""
+
+    def __init__(self, page, selectors):
+        self.page = page
+        self.selectors = selectors
+
+    def or_(self, other):
+        return FakeLocator(self.page, self.selectors + other.selectors)
+
+    @property
+    def first(self):
+        return self
+
+    async def wait_for(self, state, timeout):
+        await asyncio.sleep(self.page.delay)
+        if not any(s.split(" >> ")[0] in self.page.visible for s in self.selectors):
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    async def count(self):
+        return sum(s.split(" >> ")[0] in self.page.visible for s in self.selectors)
+
+    def __str__(self):
+        return " | ".join(self.selectors)
+
+
+class FakePage:
+    """Async page that knows which selectors are visible; every wait takes `delay` seconds"""
+
+    def __init__(self, *visible, delay=0.0):
+        self.visible = set(visible)
+        self.delay = delay
+        self.evaluated = []
+
+    def locator(self, selector):
+        return FakeLocator(self, [selector])
+
+    def on(self, event, handler):
+        pass
+
+    async def wait_for_function(self, script, arg=None, polling=None, timeout=None):
+        await asyncio.sleep(self.delay)
+        return True
+
+    async def evaluate(self, script, arg=None):
+        self.evaluated.append(arg)
+        return [{field: f"{field} {idx}" for field in record} for idx, record in enumerate(arg, 1)]
+
+
+class FakeRoute:
+
+    def __init__(self, url, resource_type):
+        self.request = type("FakeRequest", (), {"url": url, "resource_type": resource_type})()
+        self.action = None
+
+    async def fallback(self):
+        self.action = "fallback"
+
+    async def abort(self, error_code=None):
+        self.action = f"abort:{error_code}"
+
+    async def fulfill(self, status=200, content_type=None, body=None):
+        self.action = f"fulfill:{content_type}"
+
+
+class TestAsyncRunner:
+
+    def test_gather_runs_concurrently(self):
+        """Test coroutines overlap and results keep argument order"""
+        runner = AsyncRunner()
+
+        async def job(value):
+            await asyncio.sleep(0.1)
+            return value
+
+        start = time.perf_counter()
+        assert runner.gather(job(1), job(2), job(3)) == [1, 2, 3]
+        assert time.perf_counter() - start < 0.25
+        runner.close()
+        print("✅ PASSED: Concurrent gather")
+
+    def test_runs_inside_a_running_loop(self):
+        """Test the runner works from a thread whose own loop is running (as under sync Playwright)"""
+        runner = AsyncRunner()
+
+        async def job():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def on_session_loop():
+            return runner.run(job())
+
+        async def on_fresh_loop():
+            return run_async(job())
+
+        assert asyncio.run(on_session_loop()) == "done"
+        assert asyncio.run(on_fresh_loop()) == "done"
+        runner.close()
+        assert not runner.thread.is_alive()
+        print("✅ PASSED: Runner independent of the caller's loop")
+
+    def test_limit_caps_coroutines_in_flight(self):
+        """Test gather_limited never runs more than limit at once"""
+        in_flight = []
+        peak = []
+
+        async def job():
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+
+        run_async(gather_limited([job() for _ in range(6)], limit=2))
+        assert max(peak) == 2
+        print("✅ PASSED: Concurrency limited")
+
+
+class TestAsyncWaits:
+
+    def test_waits_share_the_sync_records(self):
+        """Test async waits are recorded like WaitEngine waits"""
+        waits = AsyncWaitEngine(FakePage("#SITE_CONTAINER"))
+
+        assert run_async(waits.for_element("#SITE_CONTAINER")) is True
+        assert run_async(waits.for_element("#missing", timeout=10, required=False)) is False
+        assert [record["met"] for record in waits.records] == [True, False]
+        with pytest.raises(WaitTimeout):
+            run_async(waits.for_element("#missing", timeout=10))
+        print("✅ PASSED: Async waits recorded")
+
+    def test_readiness_contract_async(self):
+        """Test wait_async reports an unmet selector without raising"""
+        contract = ReadinessContract("careers", selectors=("#SITE_CONTAINER", "#missing"))
+        waits = AsyncWaitEngine(FakePage("#SITE_CONTAINER"))
+
+        assert run_async(contract.wait_async(waits)) is False
+        assert [record["wait"] for record in waits.records] == ["element", "element", "layout_stable"]
+        print("✅ PASSED: Contract checked asynchronously")
+
+
+class TestAsyncResolver:
+
+    def test_resolve_async_uses_stats(self, tmp_path):
+        """Test resolve_async picks a visible candidate and records the lookup"""
+        stats = SelectorStats(str(tmp_path / "stats.json"))
+        resolver = SelectorResolver(stats)
+        page = FakePage("[href*='career']")
+
+        selector, _ = run_async(resolver.resolve_async(page, "careers_link", ["a.careers", "[href*='career']"]))
+        assert selector == "[href*='career']"
+        assert stats.data["careers_link"]["[href*='career']"]["hits"] == 1
+        assert stats.data["careers_link"]["a.careers"]["misses"] == 1
+        print("✅ PASSED: Async resolve shares the stats")
+
+    def test_pages_resolve_concurrently(self, tmp_path):
+        """Test several pages waiting at once overlap instead of queueing"""
+        resolver = SelectorResolver(SelectorStats(str(tmp_path / "stats.json")))
+        pages = [FakePage("h2", delay=0.1) for _ in range(4)]
+
+        async def resolve_all():
+            return await asyncio.gather(*(resolver.resolve_async(page, "marker", ["h2"]) for page in pages))
+
+        start = time.perf_counter()
+        run_async(resolve_all())
+        assert time.perf_counter() - start < 0.3
+        print("✅ PASSED: Waits overlapped")
+
+
+class TestAsyncPages:
+
+    def test_route_filter_async(self):
+        """Test the async route handler takes the same decisions"""
+        route_filter = RouteFilter(block_domains=("google-analytics.com",))
+        routes = [
+            FakeRoute("https://careers.trgint.com/", "document"),
+            FakeRoute("https://static.wixstatic.com/a.png", "image"),
+            FakeRoute("https://www.google-analytics.com/collect", "xhr"),
+        ]
+
+        for fake in routes:
+            run_async(route_filter._route_async(fake))
+        assert [fake.action for fake in routes] == ["fallback", "fulfill:image/png", "abort:blockedbyclient"]
+        assert route_filter.stats()["blocked"] == 2
+        print("✅ PASSED: Async route filter")
+
+    def test_extract_core_values_async(self):
+        """Test the async Careers page batches extraction like the sync one"""
+        page = FakePage()
+        careers_page = AsyncCareersPage(page)
+
+        core_values = run_async(careers_page.extract_core_values())
+        assert len(core_values) == 4
+        assert len(page.evaluated) == 1
+        assert core_values[0] == {"headline": "headline 1", "description": "description 1"}
+        assert careers_page.core_value_image_srcs == [f"image {idx}" for idx in range(1, 5)]
+        assert careers_page.count_exclamation_marks(core_values) == 0
+        print("✅ PASSED: One evaluate call for all core values")
+
+    def test_retry_waits_for_the_menu(self):
+        """Test a retry backs off on the 'Who we are' menu, not on an already reached load state"""
+        shown = AsyncCareersPage(FakePage(WHO_WE_ARE_MENU))
+        assert run_async(shown.wait_for_menu(timeout=100)) is True
+
+        gone = AsyncCareersPage(FakePage())
+        assert run_async(gone.wait_for_menu(timeout=100)) is False
+        assert gone.waits.records[0]["wait"] == "element"
+        assert gone.waits.records[0]["target"] == f"{WHO_WE_ARE_MENU} visible"
+        print("✅ PASSED: Retry waits on the menu")
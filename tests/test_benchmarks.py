@@ -0,0 +1,60 @@
+"""
+Test suite for the benchmark harness and the stand-in site
+"""
+from benchmarks.harness import compare, load_results, percentile, record, summarize
+from benchmarks.standin_site import CAREERS_PAGE_URL, HOME_URL, IMAGE_URL, build_site, open_site
+from pages.careers_page import CORE_VALUE_CONFIGS
+
+
+class TestBenchmarkHarness:
+
+    def test_summary_statistics(self):
+        """Test min / median / p95 of samples in seconds"""
+        samples = [i / 1000 for i in range(1, 101)]
+        stats = summarize(samples)
+        print(f"Stats: {stats}")
+
+        assert stats == {"min_ms": 1.0, "median_ms": 50.5, "p95_ms": 95.0, "rounds": 100}
+        assert percentile([0.3], 95) == 0.3
+        print("✅ PASSED: Statistics computed")
+
+    def test_regression_threshold(self):
+        """Test only medians slower than the threshold are reported"""
+        baseline = {"a": {"median_ms": 10.0}, "b": {"median_ms": 10.0}}
+        results = {"a": {"median_ms": 11.0}, "b": {"median_ms": 13.0}, "new": {"median_ms": 99.0}}
+
+        regressions = compare(results, baseline, threshold=0.2)
+        print(f"Regressions: {regressions}")
+        assert [name for name, *_ in regressions] == ["b"]
+        print("✅ PASSED: Regression detected")
+
+    def test_baseline_kept_between_runs(self, tmp_path):
+        """Test the first run sets the baseline and later runs only add history"""
+        path = str(tmp_path / "results.json")
+        record({"a": {"median_ms": 10.0}}, path)
+        record({"a": {"median_ms": 20.0}}, path)
+        stored = load_results(path)
+        assert stored["baseline"]["a"]["median_ms"] == 10.0
+        assert len(stored["history"]) == 2
+
+        record({"a": {"median_ms": 20.0}}, path, update_baseline=True)
+        assert load_results(path)["baseline"]["a"]["median_ms"] == 20.0
+        print("✅ PASSED: Baseline stored")
+
+
+class TestStandInSite:
+
+    def test_site_serves_careers_flow(self, tmp_path):
+        """Test the stand-in archive has the pages, element ids and images the flow needs"""
+        site = open_site(build_site(str(tmp_path / "site")))
+
+        _, _, home = site.lookup("GET", HOME_URL)
+        assert b"Who we are" in home and CAREERS_PAGE_URL.encode() in home
+
+        _, _, careers = site.lookup("GET", CAREERS_PAGE_URL)
+        for idx, config in enumerate(CORE_VALUE_CONFIGS, 1):
+            assert config["img_id"].lstrip("#").encode() in careers
+            _, headers, image = site.lookup("GET", IMAGE_URL.format(idx))
+            assert headers["Content-Type"] == "image/png"
+            assert image.startswith(b"\x89PNG")
+        print("✅ PASSED: Stand-in site complete")
@@ -0,0 +1,161 @@
+"""
+Test suite for the persistent browser server (with a stand-in for Chromium)
+"""
+import json
+import os
+import stat
+import sys
+import time
+
+import pytest
+from utils.browser_pool import BrowserPool
+from utils.browser_server import ACTIVITY_FILE, BrowserServer, probe
+
+
+# Answers /json/version like Chromium and announces its port in DevToolsActivePort
+FAKE_CHROMIUM = '''#!{python}
+import http.server, json, os, sys
+
+profile = next(arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--user-data-dir="))
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({{"webSocketDebuggerUrl": f"ws://127.0.0.1:{{port}}/devtools/browser/fake"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+port = server.server_address[1]
+os.makedirs(profile, exist_ok=True)
+with open(os.path.join(profile, "DevToolsActivePort"), "w") as f:
+    f.write(f"{{port}}\\n/devtools/browser/fake\\n")
+server.serve_forever()
+'''
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="stand-in Chromium is a shebang script")
+
+
+class FakeBrowser:
+
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **options):
+        self.contexts.append(options)
+        return options
+
+
+def wait_until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def fake_chromium(tmp_path):
+    path = tmp_path / "chromium"
+    path.write_text(FAKE_CHROMIUM.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.fixture
+def make_server(tmp_path, fake_chromium):
+    """BrowserServer factory; every server in the directory is stopped after the test"""
+    directory = str(tmp_path / "server")
+
+    def make(**kwargs):
+        kwargs.setdefault("poll_seconds", 0.1)
+        return BrowserServer(fake_chromium, directory=directory, **kwargs)
+
+    yield make
+    make().stop()
+
+
+class TestBrowserServer:
+
+    def test_launch_then_reuse(self, make_server):
+        """Test the first run launches the server and the next one reuses it"""
+        first = make_server()
+        endpoint = first.endpoint()
+        assert first.reused is False
+        assert probe(endpoint).endswith("/devtools/browser/fake")
+
+        second = make_server()
+        assert second.endpoint() == endpoint
+        assert second.reused is True
+        assert second.read_state()["chromium_pid"] == first.read_state()["chromium_pid"]
+        print("✅ PASSED: Server reused")
+
+    def test_stop(self, make_server):
+        """Test stop shuts Chromium down and removes the state"""
+        server = make_server()
+        endpoint = server.endpoint()
+
+        assert server.stop()
+        assert server.read_state() is None
+        assert wait_until(lambda: probe(endpoint, timeout=0.2) is None)
+        assert not server.stop()
+        print("✅ PASSED: Server stopped")
+
+    def test_idle_timeout(self, make_server):
+        """Test the helper shuts down once nothing used it for idle_seconds"""
+        server = make_server(idle_seconds=0.5)
+        server.endpoint()
+
+        assert wait_until(lambda: server.read_state() is None)
+        print("✅ PASSED: Idle server shut down")
+
+    def test_settings_change_restarts(self, make_server):
+        """Test a headed run does not reuse a headless server"""
+        headless = make_server()
+        headless.endpoint()
+        old_pid = headless.read_state()["chromium_pid"]
+
+        headed = make_server(headless=False)
+        headed.endpoint()
+        state = headed.read_state()
+        assert headed.reused is False
+        assert state["headless"] is False
+        assert state["chromium_pid"] != old_pid
+        print("✅ PASSED: Server restarted for new settings")
+
+    def test_dead_endpoint_relaunched(self, make_server):
+        """Test state left behind by a killed helper is not trusted"""
+        server = make_server()
+        os.makedirs(server.directory)
+        with open(os.path.join(server.directory, "server.json"), "w") as f:
+            json.dump({"endpoint": "http://127.0.0.1:9", "executable": server.executable, "headless": True}, f)
+
+        assert not server.is_healthy()
+        endpoint = server.endpoint(timeout=15)
+        assert server.reused is False
+        assert endpoint != "http://127.0.0.1:9"
+        print("✅ PASSED: Stale server replaced")
+
+    def test_new_contexts_reset_idle_timer(self, make_server):
+        """Test every context the fixtures create through the pool counts as server activity"""
+        server = make_server()
+        os.makedirs(server.directory)
+        activity = os.path.join(server.directory, ACTIVITY_FILE)
+        stale = time.time() - 3600
+        with open(activity, "w"):
+            pass
+        os.utime(activity, (stale, stale))
+
+        browser = FakeBrowser()
+        pool = BrowserPool(playwright=None, server=server)
+        pool.new_context(browser, viewport={"width": 1920, "height": 1080})
+        assert browser.contexts == [{"viewport": {"width": 1920, "height": 1080}}]
+        assert os.path.getmtime(activity) > stale + 3000
+        print("✅ PASSED: Context creation recorded as activity")
@@ -0,0 +1,137 @@
+"""
+Test suite for the Playwright trace policy
+"""
+import os
+import time
+
+import pytest
+from utils.browser_trace import TracePolicy
+
+
+class FakeTracing:
+    """Records start/stop calls; stop(path=...) writes a zip of the given size"""
+
+    def __init__(self, size=1024):
+        self.size = size
+        self.started = None
+        self.chunks = []
+        self.stopped_with = "not stopped"
+        self.chunk_stopped_with = "not stopped"
+
+    def start(self, **options):
+        self.started = options
+
+    def start_chunk(self, title=None):
+        self.chunks.append(title)
+
+    def stop(self, path=None):
+        self.stopped_with = path
+        self.write(path)
+
+    def stop_chunk(self, path=None):
+        self.chunk_stopped_with = path
+        self.write(path)
+
+    def write(self, path):
+        if path:
+            with open(path, "wb") as f:
+                f.write(b"PK" + b"\x00" * (self.size - 2))
+
+
+class FakeContext:
+
+    def __init__(self, size=1024):
+        self.tracing = FakeTracing(size)
+
+
+def make_trace(directory, name, size, age):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(b"\x00" * size)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+class TestTracePolicy:
+
+    def test_passing_test_discards_trace(self, tmp_path):
+        """Test on-failure mode stops tracing without writing anything for a pass"""
+        policy = TracePolicy(output_dir=str(tmp_path / "traces"))
+        context = FakeContext()
+
+        policy.start(context, title="test_a")
+        assert policy.stop(context, "tests/test_a.py::test_a", failed=False) is None
+        assert context.tracing.stopped_with is None
+        assert not (tmp_path / "traces").exists()
+        print("✅ PASSED: Trace discarded on pass")
+
+    def test_failing_test_writes_trace(self, tmp_path):
+        """Test a failure writes the trace under a name derived from the node id"""
+        policy = TracePolicy(output_dir=str(tmp_path / "traces"))
+        context = FakeContext()
+
+        policy.start(context)
+        path = policy.stop(context, "tests/test_core_values.py::TestCoreValues::test_navigate", failed=True)
+        assert path == str(tmp_path / "traces" / "tests_test_core_values.py_TestCoreValues_test_navigate.zip")
+        assert os.path.exists(path)
+        print("✅ PASSED: Trace written on failure")
+
+    def test_chunk_keeps_shared_context_tracing(self, tmp_path):
+        """Test a test on a shared context stops only its own chunk"""
+        policy = TracePolicy(output_dir=str(tmp_path / "traces"))
+        context = FakeContext()
+
+        policy.start(context, title="module")
+        policy.start_chunk(context, title="test_a")
+        path = policy.stop(context, "test_a", failed=True, chunk=True)
+        assert context.tracing.chunks == ["test_a"]
+        assert context.tracing.chunk_stopped_with == path
+        assert context.tracing.stopped_with == "not stopped"
+        assert os.path.exists(path)
+        print("✅ PASSED: Only the chunk stopped")
+
+    def test_detail_options_passed_to_playwright(self):
+        """Test screencast, snapshot and source recording follow the policy"""
+        context = FakeContext()
+
+        TracePolicy(screenshots=False, snapshots=True, sources=False).start(context, title="t")
+        assert context.tracing.started == {"title": "t", "screenshots": False, "snapshots": True, "sources": False}
+        print("✅ PASSED: Detail limits applied")
+
+    def test_off_mode_never_starts(self):
+        """Test tracing is not started at all when off"""
+        context = FakeContext()
+
+        TracePolicy(mode="off").start(context)
+        assert context.tracing.started is None
+        print("✅ PASSED: Off mode costs nothing")
+
+    def test_invalid_mode_rejected(self):
+        """Test unknown modes raise"""
+        with pytest.raises(ValueError):
+            TracePolicy(mode="retain")
+        print("✅ PASSED: Invalid mode rejected")
+
+    def test_size_cap_removes_oldest_traces(self, tmp_path):
+        """Test the oldest traces are removed until the retained ones fit"""
+        policy = TracePolicy(max_mb=2.5 / 1024, output_dir=str(tmp_path))
+        oldest = make_trace(str(tmp_path), "a.zip", 1024, age=30)
+        older = make_trace(str(tmp_path), "b.zip", 1024, age=20)
+        newest = make_trace(str(tmp_path), "c.zip", 1024, age=10)
+
+        assert policy.enforce_cap() == [oldest]
+        assert not os.path.exists(oldest)
+        assert os.path.exists(older) and os.path.exists(newest)
+        print("✅ PASSED: Oldest trace evicted")
+
+    def test_new_trace_kept_even_above_cap(self, tmp_path):
+        """Test the trace just written survives even when it alone exceeds the cap"""
+        policy = TracePolicy(max_mb=1 / 1024, output_dir=str(tmp_path / "traces"))
+        os.makedirs(tmp_path / "traces")
+        old = make_trace(str(tmp_path / "traces"), "old.zip", 512, age=60)
+
+        path = policy.stop(FakeContext(size=4096), "test_big", failed=True)
+        assert os.path.exists(path)
+        assert not os.path.exists(old)
+        print("✅ PASSED: Newest trace kept")
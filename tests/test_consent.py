@@ -0,0 +1,113 @@
+"""
+Test suite for session-wide cookie consent
+"""
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from pages.base_page import BasePage
+from utils.consent import capture_consent_state, consent_preloaded, mark_consent_preloaded
+
+
+class FakeContext:
+    pass
+
+
+class FakeLocator:
+    """Cookie button that is either shown or never appears"""
+
+    def __init__(self, shown):
+        self.shown = shown
+        self.clicked = False
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, state, timeout):
+        if state == "visible" and not self.shown:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def click(self, timeout):
+        self.clicked = True
+        self.shown = False
+
+
+class FakeStateContext:
+    """Context that records the storage state files it saves"""
+
+    def __init__(self):
+        self.saved = []
+
+    def storage_state(self, path):
+        self.saved.append(path)
+
+
+class FakePageObject:
+    """Page object whose banner is accepted on the listed URLs only"""
+
+    def __init__(self, *accepting):
+        self.accepting = set(accepting)
+        self.url = None
+
+    def goto_ready(self, url):
+        self.url = url
+
+    def accept_cookies(self, timeout):
+        return self.url in self.accepting
+
+
+class FakePage:
+
+    def __init__(self, banner_shown):
+        self.context = FakeContext()
+        self.button = FakeLocator(banner_shown)
+
+    def on(self, event, handler):
+        pass
+
+    def locator(self, selector):
+        return self.button
+
+
+class TestConsent:
+
+    def test_preloaded_context_skips_banner(self):
+        """Test no time is spent looking for a banner when consent was preloaded"""
+        page = FakePage(banner_shown=True)
+        mark_consent_preloaded(page.context)
+
+        assert consent_preloaded(page.context)
+        assert BasePage(page).accept_cookies() is False
+        assert page.button.clicked is False
+        print("✅ PASSED: Banner lookup skipped")
+
+    def test_cold_context_accepts_banner(self):
+        """Test a cold context still accepts the banner"""
+        page = FakePage(banner_shown=True)
+
+        assert not consent_preloaded(page.context)
+        assert BasePage(page).accept_cookies() is True
+        assert page.button.clicked is True
+        print("✅ PASSED: Banner accepted")
+
+    def test_missing_banner_is_not_an_error(self):
+        """Test a cold context without a banner continues after the timeout"""
+        page = FakePage(banner_shown=False)
+
+        assert BasePage(page).accept_cookies(timeout=100) is False
+        print("✅ PASSED: No banner handled")
+
+    def test_state_saved_when_a_banner_was_accepted(self):
+        """Test the consent state is saved when any visited page accepted the banner"""
+        context = FakeStateContext()
+
+        path = capture_consent_state(context, FakePageObject("https://b"), ["https://a", "https://b"], "state.json")
+        assert path == "state.json"
+        assert context.saved == ["state.json"]
+        print("✅ PASSED: Consent state saved")
+
+    def test_nothing_preloaded_without_consent(self):
+        """Test no state is returned when no banner was accepted, so contexts start cold"""
+        context = FakeStateContext()
+
+        assert capture_consent_state(context, FakePageObject(), ["https://a", "https://b"], "state.json") is None
+        assert context.saved == []
+        print("✅ PASSED: Nothing preloaded")
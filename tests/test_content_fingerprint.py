@@ -0,0 +1,98 @@
+"""
+Test suite for incremental extraction fingerprints
+"""
+import os
+
+from utils.content_fingerprint import FingerprintStore, diff_records, fingerprint
+
+
+RECORDS = [
+    {"headline": "Whatever it takes!", "description": "Above and beyond.", "image": "//static.wixstatic.com/a.png"},
+    {"headline": "We work together.", "description": "Collaboration first.", "image": "//static.wixstatic.com/b.png"},
+]
+
+
+def make_store(tmp_path, outputs=("core_values.json",)):
+    """Store with a previous run whose outputs exist on disk"""
+    root = tmp_path / "data"
+    root.mkdir()
+    for output in outputs:
+        (root / output).parent.mkdir(parents=True, exist_ok=True)
+        (root / output).write_text("{}")
+    store = FingerprintStore(str(tmp_path / "fingerprints.json"), root=str(root))
+    store.update("core_values", RECORDS, outputs)
+    return FingerprintStore(str(tmp_path / "fingerprints.json"), root=str(root))
+
+
+class TestFingerprint:
+
+    def test_fingerprint_ignores_key_order(self):
+        """Test the hash depends on the content, not on dict ordering"""
+        reordered = [dict(reversed(list(record.items()))) for record in RECORDS]
+
+        assert fingerprint(RECORDS) == fingerprint(reordered)
+        assert fingerprint(RECORDS) != fingerprint(RECORDS[:1])
+        print("✅ PASSED: Stable fingerprint")
+
+    def test_diff_lists_changed_fields(self):
+        """Test the change summary names the record and field"""
+        changed = [RECORDS[0], dict(RECORDS[1], image="//static.wixstatic.com/c.png")]
+
+        assert diff_records(RECORDS, changed) == [
+            "record 2 image: '//static.wixstatic.com/b.png' -> '//static.wixstatic.com/c.png'"
+        ]
+        assert diff_records(RECORDS[:1], RECORDS) == ["record 2: added"]
+        print("✅ PASSED: Changes summarized")
+
+
+class TestFingerprintStore:
+
+    def test_first_run_extracts(self, tmp_path):
+        """Test a section without a stored fingerprint is not skipped"""
+        store = FingerprintStore(str(tmp_path / "fingerprints.json"), root=str(tmp_path))
+
+        check = store.check("core_values", RECORDS)
+        assert not check.unchanged
+        assert "no stored fingerprint" in check.summary()
+        print("✅ PASSED: First run extracts")
+
+    def test_unchanged_content_is_skipped(self, tmp_path):
+        """Test the same records with outputs on disk are reported unchanged"""
+        store = make_store(tmp_path)
+
+        check = store.check("core_values", RECORDS)
+        assert check.unchanged
+        assert os.path.exists(store.output_path("core_values.json"))
+        print("✅ PASSED: Unchanged content skipped")
+
+    def test_changed_content_is_extracted(self, tmp_path):
+        """Test a changed headline is extracted again and summarized"""
+        store = make_store(tmp_path)
+        changed = [dict(RECORDS[0], headline="Whatever it takes."), RECORDS[1]]
+
+        check = store.check("core_values", changed)
+        assert not check.unchanged
+        assert check.changes == ["record 1 headline: 'Whatever it takes!' -> 'Whatever it takes.'"]
+        assert "1 changes" in check.summary()
+        print("✅ PASSED: Change detected")
+
+    def test_missing_outputs_force_extraction(self, tmp_path):
+        """Test unchanged content is extracted again when its outputs were deleted"""
+        store = make_store(tmp_path, outputs=("core_values.json", "images/a.png"))
+        os.remove(tmp_path / "data" / "images" / "a.png")
+
+        check = store.check("core_values", RECORDS)
+        assert not check.unchanged
+        assert check.missing_outputs == ["images/a.png"]
+        print("✅ PASSED: Missing outputs regenerated")
+
+    def test_update_keeps_other_sections(self, tmp_path):
+        """Test saving one section keeps what another worker stored"""
+        path = str(tmp_path / "fingerprints.json")
+        first = FingerprintStore(path, root=str(tmp_path))
+        second = FingerprintStore(path, root=str(tmp_path))
+
+        first.update("core_values", RECORDS, [])
+        second.update("life_at_trg", RECORDS[:1], [])
+        assert set(FingerprintStore(path).entries) == {"core_values", "life_at_trg"}
+        print("✅ PASSED: Sections merged")
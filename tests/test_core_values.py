@@ -4,7 +4,10 @@ Test suite for Core Values extraction
 import pytest
 import os
 import json
+from pages.async_careers_page import AsyncCareersPage
 from pages.careers_page import CareersPage
+from utils.fan_out import build_report, fan_out, format_report
+from utils.parallel import atomic_write_json
 
 
 class TestCoreValues:
@@ -14,18 +17,36 @@ class TestCoreValues:
         """Setup test"""
         self.careers_page = CareersPage(page)
     
-    def test_extract_and_save_core_values(self, page):
+    @pytest.mark.navigation
+    def test_navigate_to_careers_via_menu(self, page):
+        """
+        Full menu-driven flow: hover 'Who we are', click 'Careers', follow the popup
+        """
+        print("\n" + "="*70)
+        print("🧭 NAVIGATION TEST: Careers via 'Who we are' menu")
+        print("="*70)
+        
+        self.careers_page.navigate_to_careers()
+        
+        assert "careers" in page.url.lower()
+        assert len(page.context.pages) == 1, "Popup tab was left open"
+        print("✅ Reached Careers page through the menu")
+        print(self.careers_page.waits.summary())
+        print(self.careers_page.readiness_summary())
+    
+    def test_extract_and_save_core_values(self, page, output_dir, content_store):
         """
         Task 1: Extract core values, save to JSON, count exclamation marks, download images
+        With --incremental, steps 4-7 are skipped while the Careers content is unchanged
         """
         print("\n" + "="*70)
         print("🚀 TASK 1: CORE VALUES EXTRACTION TEST")
         print("="*70)
         
         # STEP 1
-        print("\n📍 STEP 1: Navigating to Careers page")
+        print("\n📍 STEP 1: Opening Careers page")
         print("-" * 70)
-        self.careers_page.navigate_to_careers()
+        self.careers_page.open_careers()
         assert "trg" in page.url.lower()
         print("✅ Successfully navigated")
         
@@ -44,7 +65,18 @@ class TestCoreValues:
         # STEP 4
         print("\n📍 STEP 4: Extracting core values")
         print("-" * 70)
-        core_values = self.careers_page.extract_core_values()
+        records = self.careers_page.read_core_values_section()
+        if content_store is not None:
+            check = content_store.check("core_values", records)
+            print(check.summary())
+            if check.unchanged:
+                with open(content_store.output_path("core_values.json"), encoding="utf-8") as f:
+                    previous = json.load(f)
+                assert len(previous["core_values"]) > 0, "No core values in the previous run's JSON!"
+                print("✅ Careers content unchanged - previous JSON and images kept")
+                return
+        
+        core_values = self.careers_page.extract_core_values(records)
         assert len(core_values) > 0, "No core values extracted!"
         print(f"\n✅ Extracted {len(core_values)} core values")
         
@@ -59,7 +91,7 @@ class TestCoreValues:
         print("📍 STEP 5 & 6: Saving to JSON and counting exclamation marks")
         print("-" * 70)
         
-        json_file_path = "data/core_values.json"
+        json_file_path = os.path.join(output_dir, "core_values.json")
         exclamation_count = self.careers_page.count_exclamation_marks(core_values)
         print(f"   → Exclamation marks: {exclamation_count}")
         
@@ -78,7 +110,7 @@ class TestCoreValues:
         print("📍 STEP 7: Downloading images")
         print("-" * 70)
         
-        images_dir = "data/images"
+        images_dir = os.path.join(output_dir, "images")
         downloaded_images = self.careers_page.download_core_value_images(
             core_values, 
             images_dir
@@ -86,6 +118,11 @@ class TestCoreValues:
         
         print(f"\n✅ Downloaded {len(downloaded_images)} images")
         
+        if content_store is not None:
+            outputs = [os.path.relpath(path, output_dir) for path in [json_file_path] + downloaded_images]
+            content_store.update("core_values", records, outputs)
+            print("✅ Content fingerprint stored")
+        
         # SUMMARY
         print("\n" + "="*70)
         print("✅ TEST COMPLETED SUCCESSFULLY!")
@@ -95,4 +132,97 @@ class TestCoreValues:
         print(f"   • Exclamation marks: {exclamation_count}")
         print(f"   • Images: {len(downloaded_images)}")
         print(f"   • JSON: {json_file_path}")
-        print("\n" + "="*70 + "\n")
\ No newline at end of file
+        print(self.careers_page.waits.summary())
+        print(self.careers_page.readiness_summary())
+        print("\n" + "="*70 + "\n")
+
+
+class TestCoreValuesConcurrent:
+    """Async flows on the session loop; no sync page is opened for these tests"""
+    
+    def test_core_values_concurrently(self, async_runner, async_context_factory):
+        """
+        The Careers extraction in several viewports at once, on one event loop and one browser
+        """
+        print("\n" + "="*70)
+        print("⚡ CONCURRENT TEST: Core values across viewports")
+        print("="*70)
+        
+        viewports = [
+            {"width": 1920, "height": 1080},
+            {"width": 1280, "height": 800},
+            {"width": 390, "height": 844}
+        ]
+        
+        async def extract(viewport):
+            context = await async_context_factory(viewport=viewport)
+            careers_page = AsyncCareersPage(await context.new_page())
+            await careers_page.open_careers()
+            await careers_page.scroll_to_core_values()
+            return await careers_page.extract_core_values()
+        
+        results = async_runner.gather(*(extract(viewport) for viewport in viewports))
+        
+        for viewport, core_values in zip(viewports, results):
+            assert len(core_values) == 4, f"{viewport}: {len(core_values)} core values"
+            print(f"   ✅ {viewport['width']}x{viewport['height']}: {len(core_values)} core values")
+        assert all(core_values == results[0] for core_values in results), "Viewports disagree"
+        print("✅ Same core values in every viewport")
+    
+    def test_core_values_fan_out(self, async_runner, async_context_factory, fan_out_contexts, output_dir):
+        """
+        Core values extracted in every fan_out_contexts viewport/locale at once, merged into one report
+        """
+        print("\n" + "="*70)
+        print(f"🔀 FAN-OUT TEST: Core values in {len(fan_out_contexts)} contexts")
+        print("="*70)
+        
+        async def extract(context, run):
+            careers_page = AsyncCareersPage(await context.new_page())
+            with run.step("open"):
+                await careers_page.open_careers()
+            with run.step("scroll"):
+                await careers_page.scroll_to_core_values()
+            with run.step("extract"):
+                return await careers_page.extract_core_values()
+        
+        runs = async_runner.run(fan_out(async_context_factory, fan_out_contexts, extract))
+        report = build_report(runs)
+        
+        report_path = os.path.join(output_dir, "fan_out_report.json")
+        atomic_write_json(report_path, report, indent=2, ensure_ascii=False)
+        print(format_report(report))
+        print(f"   ✅ Report saved to: {report_path}")
+        
+        assert not report["failed"], f"Extraction failed in: {', '.join(report['failed'])}"
+        for run in runs:
+            assert len(run.data) == 4, f"{run.spec}: {len(run.data)} core values"
+
+
+class TestCareersContent:
+    """Content checks on one Careers page shared by the module (see the careers_page fixture)"""
+    
+    def test_core_value_headlines(self, careers_page):
+        """Every core value has a unique headline"""
+        records = careers_page.read_core_values_section()
+        headlines = [record['headline'] for record in records]
+        
+        assert len(records) == 4
+        assert all(headlines), f"Missing headlines: {headlines}"
+        assert len(set(headlines)) == 4, f"Duplicate headlines: {headlines}"
+        print("✅ PASSED: 4 unique headlines")
+    
+    def test_core_value_descriptions(self, careers_page):
+        """Every core value has a description"""
+        records = careers_page.read_core_values_section()
+        
+        assert all(record['description'] for record in records), "Missing descriptions"
+        print("✅ PASSED: 4 descriptions")
+    
+    def test_core_value_images(self, careers_page):
+        """Every core value has an image, even after the test scrolls away from the section"""
+        careers_page.page.evaluate("window.scrollTo(0, 0)")
+        records = careers_page.read_core_values_section()
+        
+        assert all(record['image'] for record in records), "Missing image sources"
+        print("✅ PASSED: 4 images (page left scrolled for the next test to restore)")
@@ -0,0 +1,70 @@
+"""
+Test suite for the concurrent download pipeline
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from utils.downloader import Downloader, format_results
+
+
+IMAGE_BYTES = b"\x89PNG\r\n\x1a\n" + b"x" * 200_000
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/missing.png":
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(IMAGE_BYTES)))
+        self.end_headers()
+        self.wfile.write(IMAGE_BYTES)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def image_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestDownloader:
+
+    def test_download_all_streams_files_in_order(self, image_server, tmp_path):
+        """Test concurrent downloads write every file and keep job order"""
+        downloader = Downloader(max_workers=4)
+        jobs = [(f"{image_server}/img{i}.png", str(tmp_path / f"img{i}.png")) for i in range(6)]
+
+        results = downloader.download_all(jobs)
+        downloader.close()
+        print(format_results(results))
+
+        assert [r["path"] for r in results] == [path for _, path in jobs]
+        assert all(r["ok"] for r in results)
+        assert all(r["bytes"] == len(IMAGE_BYTES) for r in results)
+        assert (tmp_path / "img5.png").read_bytes() == IMAGE_BYTES
+        print("✅ PASSED: All images downloaded")
+
+    def test_failed_download_leaves_no_partial_file(self, image_server, tmp_path):
+        """Test HTTP errors are reported and no .part file remains"""
+        downloader = Downloader()
+        target = tmp_path / "missing.png"
+
+        result = downloader.download(f"{image_server}/missing.png", str(target))
+        downloader.close()
+
+        assert result["ok"] is False
+        assert "404" in result["error"]
+        assert not target.exists()
+        assert list(tmp_path.iterdir()) == []
+        print("✅ PASSED: Failure reported cleanly")
@@ -0,0 +1,108 @@
+"""
+Test suite for the multi-context fan-out runner
+"""
+import asyncio
+import time
+
+import pytest
+from utils.async_runner import run_async
+from utils.fan_out import ContextSpec, build_report, fan_out, find_differences, format_report
+
+
+VALUES = [
+    {"headline": "Whatever it takes!", "description": "We go above and beyond."},
+    {"headline": "We work together.", "description": "Collaboration first."},
+]
+
+
+class FakeContext:
+
+    def __init__(self, options):
+        self.options = options
+
+
+async def new_context(**options):
+    await asyncio.sleep(0.05)
+    return FakeContext(options)
+
+
+def run_fan_out(specs, flow):
+    return run_async(fan_out(new_context, [ContextSpec.parse(spec) for spec in specs], flow))
+
+
+class TestContextSpec:
+
+    def test_parse_spec(self):
+        """Test '<name> <width>x<height> [locale]' becomes new_context options"""
+        spec = ContextSpec.parse("mobile 390x844 vi-VN")
+        assert spec.context_options() == {"viewport": {"width": 390, "height": 844}, "locale": "vi-VN"}
+        assert ContextSpec.parse("desktop 1920x1080").context_options() == {
+            "viewport": {"width": 1920, "height": 1080}
+        }
+        assert str(spec) == "mobile 390x844 vi-VN"
+        print("✅ PASSED: Spec parsed")
+
+    def test_invalid_spec_rejected(self):
+        """Test a malformed spec raises ValueError"""
+        with pytest.raises(ValueError):
+            ContextSpec.parse("desktop 1920-1080")
+        print("✅ PASSED: Invalid spec rejected")
+
+
+class TestFanOut:
+
+    def test_contexts_run_concurrently(self):
+        """Test contexts overlap and each gets its own options and timings"""
+        async def flow(context, run):
+            with run.step("extract"):
+                await asyncio.sleep(0.1)
+            return [{"viewport": context.options["viewport"]["width"]}]
+
+        start = time.perf_counter()
+        runs = run_fan_out(["desktop 1920x1080", "laptop 1280x800", "mobile 390x844"], flow)
+        assert time.perf_counter() - start < 0.4
+        assert [run.data[0]["viewport"] for run in runs] == [1920, 1280, 390]
+        assert all(set(run.steps) == {"context", "extract"} for run in runs)
+        print("✅ PASSED: Contexts ran concurrently")
+
+    def test_failing_context_does_not_stop_the_others(self):
+        """Test an error is recorded for its context only"""
+        async def flow(context, run):
+            if context.options.get("locale") == "vi-VN":
+                raise Exception("Core values section not found")
+            return VALUES
+
+        report = build_report(run_fan_out(["desktop 1920x1080 en-US", "mobile 390x844 vi-VN"], flow))
+        assert report["failed"] == ["mobile 390x844 vi-VN"]
+        assert report["contexts"][0]["data"] == VALUES
+        assert report["consistent"] is True
+        print("✅ PASSED: Failure isolated")
+
+    def test_differences_between_contexts(self):
+        """Test only the fields that differ are reported, with every context's value"""
+        async def flow(context, run):
+            if context.options["viewport"]["width"] < 500:
+                return [VALUES[0], dict(VALUES[1], description=None)]
+            return VALUES
+
+        runs = run_fan_out(["desktop 1920x1080", "laptop 1280x800", "mobile 390x844"], flow)
+        differences = find_differences(runs)
+        assert differences == [{
+            "index": 1,
+            "field": "description",
+            "values": {"desktop": "Collaboration first.", "laptop": "Collaboration first.", "mobile": None}
+        }]
+        text = format_report(build_report(runs))
+        assert "1 fields differ" in text
+        assert "mobile" in text
+        print("✅ PASSED: Differences reported")
+
+    def test_missing_record_is_a_difference(self):
+        """Test a context that extracted fewer records differs on every field"""
+        async def flow(context, run):
+            return VALUES[:1] if context.options["viewport"]["width"] < 500 else VALUES
+
+        differences = find_differences(run_fan_out(["desktop 1920x1080", "mobile 390x844"], flow))
+        assert {difference["field"] for difference in differences} == {"headline", "description"}
+        assert all(difference["index"] == 1 for difference in differences)
+        print("✅ PASSED: Missing record detected")
@@ -0,0 +1,143 @@
+"""
+Test suite for the content-addressed image cache
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from utils.downloader import Downloader
+from utils.image_cache import ImageCache
+
+
+def image_bytes(path):
+    return path.encode() * 1000
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        etag = f'"{self.path}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = image_bytes(self.path)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def etag_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class BrokenStream:
+    """Streamed response whose connection drops after the first chunk"""
+
+    def iter_content(self, chunk_size):
+        yield b"partial"
+        raise requests.ConnectionError("connection dropped")
+
+
+class TestImageCache:
+
+    def test_unchanged_image_costs_a_304(self, etag_server, tmp_path):
+        """Test second fetch is revalidated and served from the cache"""
+        cache = ImageCache(str(tmp_path / "cache"))
+        session = requests.Session()
+        url = f"{etag_server}/a.png"
+        dest = tmp_path / "out" / "a.png"
+
+        first = cache.fetch(url, str(dest), session=session)
+        cache.save()
+        dest.unlink()
+        second = ImageCache(str(tmp_path / "cache")).fetch(url, str(dest), session=session)
+        print(f"First: {first}, second: {second}")
+
+        assert first == {"bytes": len(image_bytes("/a.png")), "cache": "miss"}
+        assert second == {"bytes": 0, "cache": "hit"}
+        assert dest.read_bytes() == image_bytes("/a.png")
+        print("✅ PASSED: Revalidated with a 304")
+
+    def test_counters(self, etag_server, tmp_path):
+        """Test hit, miss and revalidation counters"""
+        cache = ImageCache(str(tmp_path / "cache"))
+        session = requests.Session()
+        for _ in range(3):
+            cache.fetch(f"{etag_server}/b.png", str(tmp_path / "b.png"), session=session)
+
+        stats = cache.stats()
+        print(f"Stats: {stats}")
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["revalidations"] == 2
+        print("✅ PASSED: Counters updated")
+
+    def test_lru_eviction_respects_size_limit(self, etag_server, tmp_path):
+        """Test least recently used entries are evicted beyond max_bytes"""
+        one_image = len(image_bytes("/c1.png"))
+        cache = ImageCache(str(tmp_path / "cache"), max_bytes=2 * one_image)
+        session = requests.Session()
+        for name in ("c1", "c2", "c3"):
+            cache.fetch(f"{etag_server}/{name}.png", str(tmp_path / f"{name}.png"), session=session)
+
+        assert cache.size <= 2 * one_image
+        assert f"{etag_server}/c1.png" not in cache.entries
+        assert cache.evictions == 1
+        assert len(list((tmp_path / "cache" / "blobs").iterdir())) == 2
+        print("✅ PASSED: Oldest entry evicted")
+
+    def test_index_written_once_per_batch(self, etag_server, tmp_path):
+        """Test fetches only mark the index dirty; the downloader writes it after the batch"""
+        cache = ImageCache(str(tmp_path / "cache"))
+        cache.fetch(f"{etag_server}/d1.png", str(tmp_path / "d1.png"), session=requests.Session())
+        assert cache.dirty
+        assert not (tmp_path / "cache" / "index.json").exists()
+
+        downloader = Downloader(cache=cache)
+        results = downloader.download_all([(f"{etag_server}/d{i}.png", str(tmp_path / f"d{i}.png")) for i in (1, 2)])
+        downloader.close()
+        assert all(result["ok"] for result in results)
+        assert not cache.dirty
+        assert len(ImageCache(str(tmp_path / "cache")).entries) == 2
+        print("✅ PASSED: Index flushed after the batch")
+
+    def test_304_without_blob_refetches(self, etag_server, tmp_path):
+        """Test a 304 for an evicted blob falls back to a full download"""
+        cache = ImageCache(str(tmp_path / "cache"))
+        session = requests.Session()
+        url = f"{etag_server}/e.png"
+        cache.fetch(url, str(tmp_path / "e.png"), session=session)
+        for blob in (tmp_path / "cache" / "blobs").iterdir():
+            blob.unlink()
+
+        dest = tmp_path / "again" / "e.png"
+        result = cache.fetch(url, str(dest), session=session)
+        assert result == {"bytes": len(image_bytes("/e.png")), "cache": "miss"}
+        assert dest.read_bytes() == image_bytes("/e.png")
+        assert cache.stats()["revalidations"] == 0
+        print("✅ PASSED: Missing blob downloaded again")
+
+    def test_failed_stream_leaves_no_temp_file(self, tmp_path):
+        """Test a body that fails mid-stream leaves nothing in the blob store"""
+        cache = ImageCache(str(tmp_path / "cache"))
+
+        with pytest.raises(requests.ConnectionError):
+            cache._store_blob(BrokenStream(), chunk_size=1024)
+        assert list((tmp_path / "cache" / "blobs").iterdir()) == []
+        print("✅ PASSED: Temp file removed")
@@ -0,0 +1,53 @@
+"""
+Test suite for the HTML log renderer
+"""
+from utils.log_renderer import format_logs_for_html, render_log_lines
+
+
+class TestLogRenderer:
+
+    def test_lines_get_short_css_classes(self):
+        """Test classification keeps the original rule priority"""
+        body, count = render_log_lines(
+            "   ✅ Loaded\n"
+            "   → Step 1: Opening\n"
+            "   ⚠️  Could not hover → retrying\n"
+            "plain line\n"
+        )
+        print(body)
+
+        assert count == 4
+        assert '<div class="l-ok">   ✅ Loaded</div>' in body
+        assert '<div class="l-step">   → Step 1: Opening</div>' in body
+        # Warning outranks step even though both keywords are present
+        assert '<div class="l-warn">' in body
+        assert "<div>plain line</div>" in body
+        assert "style=" not in body
+        print("✅ PASSED: Lines classified")
+
+    def test_content_is_escaped(self):
+        """Test markup in logs cannot break the report"""
+        body, _ = render_log_lines("❌ Error: <div id='x'> & more")
+        print(body)
+
+        assert "&lt;div id='x'&gt; &amp; more" in body
+        assert "<div id=" not in body
+        print("✅ PASSED: HTML escaped")
+
+    def test_blank_lines_are_skipped(self):
+        """Test empty and whitespace-only lines are dropped"""
+        _, count = render_log_lines("\n   \nline\n\n")
+        assert count == 1
+        print("✅ PASSED: Blank lines skipped")
+
+    def test_long_logs_are_collapsed(self):
+        """Test long logs are rendered lazily from a template"""
+        short = format_logs_for_html("a\nb", collapse_threshold=5)
+        long = format_logs_for_html("\n".join(f"line {i}" for i in range(10)), collapse_threshold=5)
+
+        assert "<details class=\"trg-log\" open>" in short
+        assert "<template>" not in short
+        assert "<template>" in long
+        assert "ontoggle=" in long
+        assert "(10 lines)" in long
+        print("✅ PASSED: Long log collapsed")
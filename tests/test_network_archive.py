@@ -0,0 +1,176 @@
+"""
+Test suite for the record/replay network archive
+"""
+import io
+import time
+
+import pytest
+import requests
+from utils.network_archive import (
+    ArchiveMiss, NetworkArchive, http_get, set_active_archive
+)
+
+
+class FakeRequest:
+
+    def __init__(self, url):
+        self.url = url
+        self.method = "GET"
+
+
+class FakeResponse:
+    """What route.fetch() returns: encoding headers of the wire, body already decoded"""
+
+    status = 200
+    headers = {"content-type": "text/html", "content-encoding": "gzip", "content-length": "31"}
+
+    def body(self):
+        return b"<html></html>"
+
+
+class FakeRoute:
+
+    def __init__(self, url):
+        self.request = FakeRequest(url)
+        self.fulfilled = None
+
+    def fetch(self, max_redirects=None):
+        return FakeResponse()
+
+    def fulfill(self, **kwargs):
+        self.fulfilled = kwargs
+
+
+class FakeSession:
+    """requests.Session whose GETs return a body that can be streamed"""
+
+    def __init__(self, body):
+        self.body = body
+
+    def get(self, url, timeout=None, stream=False, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "image/png"
+        response.raw = io.BytesIO(self.body)
+        response.url = url
+        return response
+
+
+class TestNetworkArchive:
+
+    def test_store_and_replay_roundtrip(self, tmp_path):
+        """Test recorded responses are served back after reload"""
+        recorder = NetworkArchive(str(tmp_path), mode="record")
+        recorder.store("GET", "https://www.trgint.com/", 200,
+                       {"Content-Type": "text/html", "Content-Encoding": "gzip"}, b"<html></html>")
+        recorder.save()
+
+        replay = NetworkArchive(str(tmp_path), mode="replay")
+        status, headers, body = replay.lookup("get", "https://www.trgint.com/")
+
+        assert status == 200
+        assert body == b"<html></html>"
+        assert "Content-Encoding" not in headers
+        assert replay.hits == 1
+        print("✅ PASSED: Response replayed from archive")
+
+    def test_record_serves_decoded_headers(self, tmp_path):
+        """Test record mode does not send the page encoding headers for an already decoded body"""
+        recorder = NetworkArchive(str(tmp_path), mode="record")
+        route = FakeRoute("https://www.trgint.com/")
+        recorder._record_route(route)
+
+        assert route.fulfilled["body"] == b"<html></html>"
+        assert route.fulfilled["headers"] == {"content-type": "text/html"}
+        print("✅ PASSED: Encoding headers dropped in record mode")
+
+    def test_identical_bodies_are_stored_once(self, tmp_path):
+        """Test bodies are content-addressed"""
+        archive = NetworkArchive(str(tmp_path), mode="record")
+        archive.store("GET", "https://a.example/x.png", 200, {}, b"same")
+        archive.store("GET", "https://b.example/y.png", 200, {}, b"same")
+
+        assert len(list((tmp_path / "bodies").iterdir())) == 1
+        print("✅ PASSED: Duplicate body stored once")
+
+    def test_replay_miss_raises(self, tmp_path):
+        """Test unknown URLs are reported instead of hitting the network"""
+        NetworkArchive(str(tmp_path), mode="record").save()
+        replay = NetworkArchive(str(tmp_path), mode="replay")
+
+        with pytest.raises(ArchiveMiss):
+            replay.lookup("GET", "https://www.trgint.com/unknown")
+        assert replay.misses == 1
+        print("✅ PASSED: Miss reported")
+
+    def test_http_get_uses_active_archive(self, tmp_path):
+        """Test http_get returns a requests-compatible response in replay mode"""
+        recorder = NetworkArchive(str(tmp_path), mode="record")
+        recorder.store("GET", "https://static.wixstatic.com/media/a.png", 200,
+                       {"Content-Type": "image/png"}, b"\x89PNG")
+        recorder.save()
+
+        set_active_archive(NetworkArchive(str(tmp_path), mode="replay"))
+        try:
+            response = http_get("https://static.wixstatic.com/media/a.png")
+        finally:
+            set_active_archive(None)
+
+        response.raise_for_status()
+        assert response.content == b"\x89PNG"
+        assert response.headers["content-type"] == "image/png"
+        print("✅ PASSED: requests path served offline")
+
+    def test_streamed_get_recorded_as_it_is_read(self, tmp_path):
+        """Test record mode tees a streamed body into the archive instead of reading it up front"""
+        url = "https://static.wixstatic.com/media/big.png"
+        body = b"\x89PNG" + b"x" * 10000
+        archive = NetworkArchive(str(tmp_path), mode="record")
+        set_active_archive(archive)
+        try:
+            response = http_get(url, session=FakeSession(body), stream=True)
+            assert not response._content_consumed
+            assert archive.entries == {}
+            streamed = b"".join(response.iter_content(chunk_size=4096))
+        finally:
+            set_active_archive(None)
+
+        assert streamed == body
+        assert archive.lookup("GET", url)[2] == body
+        assert len(list((tmp_path / "bodies").iterdir())) == 1
+        print("✅ PASSED: Streamed body recorded")
+
+    def test_abandoned_stream_not_recorded(self, tmp_path):
+        """Test a body the caller stops reading leaves no entry and no temp file"""
+        archive = NetworkArchive(str(tmp_path), mode="record")
+        set_active_archive(archive)
+        try:
+            response = http_get("https://static.wixstatic.com/media/big.png",
+                                session=FakeSession(b"x" * 10000), stream=True)
+            chunks = response.iter_content(chunk_size=1024)
+            next(chunks)
+            chunks.close()
+        finally:
+            set_active_archive(None)
+
+        assert archive.entries == {}
+        assert list((tmp_path / "bodies").iterdir()) == []
+        print("✅ PASSED: Partial body dropped")
+
+    def test_replay_latency(self, tmp_path):
+        """Test latency_ms delays every replayed response"""
+        recorder = NetworkArchive(str(tmp_path), mode="record")
+        recorder.store("GET", "https://www.trgint.com/", 200, {}, b"<html></html>")
+        recorder.save()
+
+        replay = NetworkArchive(str(tmp_path), mode="replay", latency_ms=50)
+        start = time.perf_counter()
+        replay.lookup("GET", "https://www.trgint.com/")
+        assert time.perf_counter() - start >= 0.05
+        print("✅ PASSED: Latency applied")
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        """Test invalid modes fail fast"""
+        with pytest.raises(ValueError):
+            NetworkArchive(str(tmp_path), mode="offline")
+        print("✅ PASSED: Invalid mode rejected")
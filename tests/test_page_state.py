@@ -0,0 +1,201 @@
+"""
+Test suite for the shared page snapshot and restore
+"""
+from utils.page_state import (
+    HASH_CHANGED, RELOADED, RESTORE_JS, SNAPSHOT_JS, STATE_JS, UNREADABLE, PageSnapshot, SharedPage
+)
+
+
+class FakeKeyboard:
+
+    def __init__(self):
+        self.pressed = []
+
+    def press(self, key):
+        self.pressed.append(key)
+
+
+class FakeContext:
+
+    def __init__(self):
+        self.pages = []
+
+
+class FakePage:
+    """Answers the page_state scripts from a plain dict standing in for the document"""
+
+    def __init__(self, context, url="https://example.com/careers"):
+        self.context = context
+        self.keyboard = FakeKeyboard()
+        self.window = {"url": url, "x": 0, "y": 0, "token": None}
+        self.closed = False
+        self.crashed = False
+        self.restores = 0
+        context.pages.append(self)
+
+    def evaluate(self, script, arg=None):
+        if self.crashed:
+            raise RuntimeError("Execution context was destroyed, most likely because of a navigation")
+        if script == SNAPSHOT_JS:
+            self.window["token"] = arg
+            return {key: self.window[key] for key in ("url", "x", "y")}
+        if script == STATE_JS:
+            return dict(self.window)
+        if script == RESTORE_JS:
+            self.restores += 1
+            self.window.update(url=arg["url"], x=arg["x"], y=arg["y"])
+            return None
+        raise AssertionError(f"Unexpected script: {script}")
+
+    def reload(self):
+        """A reload keeps the URL but loses the snapshot sentinel and scroll"""
+        self.window.update(x=0, y=0, token=None)
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+        self.context.pages.remove(self)
+
+
+class FakeWaits:
+
+    def for_scroll_settled(self, timeout=None, required=True):
+        return True
+
+
+class FakePageObject:
+
+    def __init__(self, page):
+        self.page = page
+        self.waits = FakeWaits()
+        self.prepared = 0
+
+    def open_core_values(self):
+        self.prepared += 1
+        self.page.window["y"] = 2400
+
+
+def make_shared():
+    context = FakeContext()
+    opened = []
+
+    def open_page():
+        opened.append(FakePageObject(FakePage(context)))
+        return opened[-1]
+
+    shared = SharedPage(open_page, FakePageObject.open_core_values)
+    shared.navigate()
+    return shared, context, opened
+
+
+class TestPageSnapshot:
+
+    def test_snapshot_matches_untouched_page(self):
+        """Test a page left as it was has no differences"""
+        page = FakePage(FakeContext())
+        page.window["y"] = 1200
+        snapshot = PageSnapshot.take(page)
+
+        assert snapshot.scroll_y == 1200
+        assert page.window["token"] == snapshot.token
+        assert snapshot.differences(page) == []
+        page.window["y"] = 1203
+        assert snapshot.differences(page) == []
+        print("✅ PASSED: Clean page detected")
+
+    def test_reload_is_not_restorable(self):
+        """Test a reloaded document loses the sentinel and needs a navigation"""
+        page = FakePage(FakeContext())
+        snapshot = PageSnapshot.take(page)
+        page.reload()
+
+        problems = snapshot.differences(page)
+        assert RELOADED in [problem.kind for problem in problems]
+        assert not snapshot.restorable(problems)
+        print("✅ PASSED: Reload detected")
+
+    def test_hash_change_is_restorable(self):
+        """Test an in-page anchor only changes the hash, which is restored in place"""
+        page = FakePage(FakeContext())
+        snapshot = PageSnapshot.take(page)
+        page.window["url"] += "#core-values"
+
+        problems = snapshot.differences(page)
+        assert [problem.kind for problem in problems] == [HASH_CHANGED]
+        assert str(problems[0]) == "URL hash changed to https://example.com/careers#core-values"
+        assert snapshot.restorable(problems)
+        print("✅ PASSED: Hash change restorable")
+
+
+class TestSharedPage:
+
+    def test_clean_page_not_touched(self):
+        """Test nothing is restored or navigated when the last test left the page as it was"""
+        shared, context, opened = make_shared()
+
+        assert shared.restore() == "clean"
+        assert opened[0].page.restores == 0
+        assert opened[0].prepared == 1
+        print("✅ PASSED: Clean page reused")
+
+    def test_scroll_and_popup_restored(self):
+        """Test a scrolled page with a popup tab is restored without navigating"""
+        shared, context, opened = make_shared()
+        page = shared.page
+        popup = FakePage(context, url="https://example.com/job")
+        page.window.update(y=0, url=page.window["url"] + "#top")
+
+        assert shared.restore() == "restored"
+        assert popup.is_closed()
+        assert context.pages == [page]
+        assert page.window["y"] == 2400
+        assert page.keyboard.pressed == ["Escape"]
+        assert opened[0].prepared == 1
+        print("✅ PASSED: Dirty page restored")
+
+    def test_navigated_away_renavigates(self):
+        """Test a page that left the Careers URL is prepared again"""
+        shared, context, opened = make_shared()
+        shared.page.window.update(url="https://example.com/other", token=None)
+
+        assert shared.restore() == "renavigated"
+        assert opened[0].prepared == 2
+        assert shared.snapshot.differences(shared.page) == []
+        print("✅ PASSED: Navigated page prepared again")
+
+    def test_closed_page_replaced(self):
+        """Test a closed page is replaced by a new one"""
+        shared, context, opened = make_shared()
+        opened[0].page.close()
+
+        assert shared.restore() == "renavigated"
+        assert len(opened) == 2
+        assert shared.page_object is opened[1]
+        print("✅ PASSED: Closed page replaced")
+
+    def test_unreadable_page_renavigates(self):
+        """Test a page whose state cannot be read is replaced instead of failing the next test's setup"""
+        shared, context, opened = make_shared()
+        opened[0].page.crashed = True
+
+        assert [problem.kind for problem in shared.snapshot.differences(shared.page)] == [UNREADABLE]
+        assert shared.restore() == "renavigated"
+        assert opened[0].page.is_closed()
+        assert shared.page_object is opened[1]
+        assert shared.snapshot.differences(shared.page) == []
+        print("✅ PASSED: Unreadable page replaced")
+
+    def test_summary(self):
+        """Test the summary counts tests and navigations"""
+        shared, context, opened = make_shared()
+        shared.restore()
+        shared.page.window["y"] = 0
+        shared.restore()
+        shared.page.reload()
+        shared.restore()
+
+        assert shared.summary() == ("   ♻️  Shared page: 3 tests, 2 navigations "
+                                    "(1 clean, 1 restored, 1 renavigated)")
+        print("✅ PASSED: Summary")
@@ -0,0 +1,62 @@
+"""
+Test suite for parallel-run helpers
+"""
+import json
+import os
+from pages import careers_page
+from pages.careers_page import CareersPage, cached_careers_url, remember_careers_url
+from utils.parallel import atomic_write_json, merge_worker_outputs, worker_output_dir
+
+
+class TestParallelHelpers:
+
+    def test_atomic_write_json_leaves_no_temp_files(self, tmp_path):
+        """Test JSON is written completely and temp files are cleaned up"""
+        target = tmp_path / "out" / "core_values.json"
+        atomic_write_json(str(target), {"headline": "Whatever it takes!"}, ensure_ascii=False)
+
+        assert json.loads(target.read_text(encoding="utf-8")) == {"headline": "Whatever it takes!"}
+        assert os.listdir(target.parent) == ["core_values.json"]
+        print("✅ PASSED: Atomic write")
+
+    def test_careers_url_cache_written_atomically(self, tmp_path, monkeypatch):
+        """Test the Careers URL cache shared by workers is written whole and read back"""
+        cache = tmp_path / "cache" / "careers_url.txt"
+        monkeypatch.setattr(careers_page, "CAREERS_URL_CACHE", str(cache))
+        monkeypatch.setattr(CareersPage, "_careers_url", None)
+
+        assert cached_careers_url() is None
+        remember_careers_url("https://careers.trgint.com/")
+        assert cache.read_text(encoding="utf-8") == "https://careers.trgint.com/"
+        assert os.listdir(cache.parent) == ["careers_url.txt"]
+
+        monkeypatch.setattr(CareersPage, "_careers_url", None)
+        assert cached_careers_url() == "https://careers.trgint.com/"
+        print("✅ PASSED: Careers URL cache")
+
+    def test_worker_output_dir(self, monkeypatch):
+        """Test each xdist worker gets its own output folder"""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        assert worker_output_dir("data") == "data"
+
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        assert worker_output_dir("data") == os.path.join("data", ".workers", "gw3")
+        print("✅ PASSED: Per-worker folders")
+
+    def test_merge_prefers_newest_file(self, tmp_path):
+        """Test worker outputs are merged and the newest copy wins"""
+        for worker, content, mtime in [("gw0", b"old", 1000), ("gw1", b"new", 2000)]:
+            image = tmp_path / ".workers" / worker / "images" / "a.png"
+            image.parent.mkdir(parents=True)
+            image.write_bytes(content)
+            os.utime(image, (mtime, mtime))
+        only_gw0 = tmp_path / ".workers" / "gw0" / "core_values.json"
+        only_gw0.write_text("{}")
+
+        merged = merge_worker_outputs(str(tmp_path))
+        print(f"Merged: {merged}")
+
+        assert merged == ["core_values.json", os.path.join("images", "a.png")]
+        assert (tmp_path / "images" / "a.png").read_bytes() == b"new"
+        assert not (tmp_path / ".workers").exists()
+        print("✅ PASSED: Outputs merged")
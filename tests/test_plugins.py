@@ -0,0 +1,140 @@
+"""
+Test suite for the on-demand browser plugin
+"""
+import os
+import time
+
+import pytest
+import conftest
+from benchmarks import bench_startup
+from plugins import uses_browser
+from plugins.browser import new_test_context, trace_policy_key
+from utils.browser_pool import BrowserPool
+from utils.browser_server import ACTIVITY_FILE, DEFAULT_SERVER_DIR, BrowserServer
+from utils.browser_trace import TracePolicy
+from utils.consent import consent_preloaded
+from utils.fan_out import DEFAULT_CONTEXTS
+from utils.network_archive import MODES as NETWORK_MODES
+from utils.selector_resolver import DEFAULT_STATS_PATH
+
+
+class FakeItem:
+
+    def __init__(self, *fixturenames):
+        self.fixturenames = list(fixturenames)
+
+
+class FakeTracing:
+
+    def __init__(self):
+        self.started = None
+
+    def start(self, **options):
+        self.started = options
+
+
+class FakeContext:
+
+    def __init__(self, options):
+        self.options = options
+        self.tracing = FakeTracing()
+        self.routes = []
+
+    def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+
+class FakeBrowser:
+
+    def new_context(self, **options):
+        return FakeContext(options)
+
+
+class FakeNode:
+
+    def __init__(self, nodeid, markers=()):
+        self.nodeid = nodeid
+        self.markers = set(markers)
+
+    def get_closest_marker(self, name):
+        return name if name in self.markers else None
+
+
+class FakeRequest:
+
+    def __init__(self, node, trace_mode="on-failure"):
+        self.node = node
+        self.config = type("Config", (), {"stash": pytest.Stash()})()
+        self.config.stash[trace_policy_key] = TracePolicy(mode=trace_mode)
+
+
+class FakeArchive:
+
+    def __init__(self):
+        self.attached = []
+
+    def attach(self, context):
+        self.attached.append(context)
+
+
+class FakeRouteFilter:
+
+    def __init__(self):
+        self.installed = []
+
+    def install(self, context):
+        self.installed.append(context)
+
+
+class TestBrowserPlugin:
+
+    def test_browser_tests_detected(self):
+        """Test only items requesting a browser fixture load the plugin"""
+        assert uses_browser(FakeItem("setup", "page", "request"))
+        assert uses_browser(FakeItem("async_runner", "async_context_factory"))
+        assert not uses_browser(FakeItem("tmp_path", "monkeypatch"))
+        assert not uses_browser(object())
+        print("✅ PASSED: Browser tests detected")
+
+    def test_option_defaults_in_sync(self):
+        """Test the defaults conftest repeats match the modules that own them"""
+        assert conftest.NETWORK_MODES == NETWORK_MODES
+        assert conftest.SELECTOR_STATS_PATH == DEFAULT_STATS_PATH
+        assert conftest.BROWSER_SERVER_DIR == DEFAULT_SERVER_DIR
+        assert conftest.FAN_OUT_CONTEXTS == DEFAULT_CONTEXTS
+        print("✅ PASSED: Defaults in sync")
+
+    def test_unit_run_does_not_import_playwright(self):
+        """Test a run of pure-Python tests never loads the browser plugin"""
+        sample = bench_startup.run_once()
+        print(f"Collection: {sample['collection'] * 1000:.0f} ms, first test: {sample['first_test'] * 1000:.0f} ms")
+
+        assert not sample["playwright_imported"]
+        assert sample["first_test"] >= sample["collection"]
+        print("✅ PASSED: Playwright not imported")
+
+    def test_new_test_context_setup(self, tmp_path):
+        """Test the context helper shared by context and shared_careers sets everything up once"""
+        server = BrowserServer("chromium", directory=str(tmp_path))
+        activity = os.path.join(server.directory, ACTIVITY_FILE)
+        stale = time.time() - 3600
+        with open(activity, "w"):
+            pass
+        os.utime(activity, (stale, stale))
+        archive, route_filter = FakeArchive(), FakeRouteFilter()
+
+        request = FakeRequest(FakeNode("tests/test_core_values.py"))
+        context = new_test_context(request, BrowserPool(None, server=server), archive, route_filter,
+                                   "state.json", browser=FakeBrowser())
+        assert context.options == {"viewport": {"width": 1920, "height": 1080}, "storage_state": "state.json"}
+        assert consent_preloaded(context)
+        assert archive.attached == [context] and route_filter.installed == [context]
+        assert context.tracing.started["title"] == "tests/test_core_values.py"
+        assert os.path.getmtime(activity) > stale + 3000
+
+        cold = new_test_context(FakeRequest(FakeNode("t", ["cold_state"]), trace_mode="off"),
+                                BrowserPool(None), archive, None, "state.json", browser=FakeBrowser())
+        assert cold.options["storage_state"] is None
+        assert not consent_preloaded(cold)
+        assert cold.tracing.started is None
+        print("✅ PASSED: Context set up once for tests and shared pages")
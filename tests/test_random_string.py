@@ -2,7 +2,14 @@
 Test suite for random string generator
 """
 import pytest
-from utils.string_generator import generate_random_test_string, generate_random_full_name
+from utils.string_generator import (
+    FORMAT_SPACE,
+    StringStream,
+    generate_random_full_name,
+    generate_random_test_string,
+    generate_random_test_strings,
+    string_key,
+)
 
 
 class TestRandomStringGenerator:
@@ -78,4 +85,61 @@ class TestRandomStringGenerator:
             print(f"   {i+1:2d}. {test_string}")
         
         print("\n✅ PASSED: All generated successfully")
-        print("="*70 + "\n")
\ No newline at end of file
+        print("="*70 + "\n")
+
+
+class TestBatchGeneration:
+    
+    def test_batch_format(self):
+        """Test every string of a batch has the single-call format"""
+        values = generate_random_test_strings(10_000)
+        
+        assert len(values) == 10_000
+        assert all(len(v) == 9 and v[:3].isdigit() and v[3:].isalpha() and v[3:].isascii() for v in values)
+        print("✅ PASSED: 10k strings in the right format")
+    
+    def test_seeded_streams_are_reproducible(self):
+        """Test the same seed and worker give the same strings"""
+        first = StringStream(seed=42, worker="gw0").batch(100)
+        second = StringStream(seed=42, worker="gw0").batch(100)
+        
+        assert first == second
+        print("✅ PASSED: Seeded stream reproducible")
+    
+    def test_workers_get_independent_streams(self):
+        """Test each xdist worker's stream differs for the same seed"""
+        gw0 = StringStream(seed=42, worker="gw0").batch(100)
+        gw1 = StringStream(seed=42, worker="gw1").batch(100)
+        
+        assert gw0 != gw1
+        assert not set(gw0) & set(gw1)
+        print("✅ PASSED: Per-worker streams")
+    
+    def test_unique_mode_across_batches(self):
+        """Test a unique stream never repeats a string, even across batches"""
+        stream = StringStream(seed=7, unique=True)
+        values = stream.batch(5000) + stream.batch(5000)
+        
+        assert len(set(values)) == 10_000
+        assert len(stream.seen) == 10_000
+        assert stream.seen.itemsize == 8
+        assert sorted(stream.seen) == sorted(string_key(value) for value in values)
+        print("✅ PASSED: 10k unique strings")
+    
+    def test_unique_mode_skips_strings_of_earlier_batches(self):
+        """Test a replayed stream that shares the seen keys returns none of the earlier strings"""
+        first = StringStream(seed=42, worker="gw0", unique=True)
+        values = first.batch(100)
+        replayed = StringStream(seed=42, worker="gw0", unique=True)
+        replayed.seen = first.seen
+        
+        again = replayed.batch(100)
+        assert len(again) == 100
+        assert not set(values) & set(again)
+        print("✅ PASSED: Earlier batches skipped")
+    
+    def test_unique_mode_rejects_impossible_counts(self):
+        """Test asking for more unique strings than the format allows raises"""
+        with pytest.raises(ValueError):
+            StringStream(unique=True).batch(FORMAT_SPACE + 1)
+        print("✅ PASSED: Impossible count rejected")
@@ -0,0 +1,66 @@
+"""
+Test suite for readiness contracts and the networkidle comparison
+"""
+from utils.readiness import NETWORK_IDLE_MS, NetworkActivity, ReadinessContract
+
+
+class FakeWaits:
+    """Records the waits a contract asks for; selectors in `missing` time out"""
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.calls = []
+
+    def for_element(self, selector, state, timeout, required):
+        self.calls.append(("element", selector, state, required))
+        return selector not in self.missing
+
+    def for_layout_stable(self, quiet_ms, timeout, required):
+        self.calls.append(("layout_stable", quiet_ms, required))
+        return True
+
+
+class TestReadinessContract:
+
+    def test_contract_waits_for_every_condition(self):
+        """Test selectors and layout stability are waited for, never raising"""
+        contract = ReadinessContract("careers", selectors=("#SITE_CONTAINER", "nav"), stable_ms=250)
+        waits = FakeWaits()
+
+        assert contract.wait(waits) is True
+        assert waits.calls == [
+            ("element", "#SITE_CONTAINER", "visible", False),
+            ("element", "nav", "visible", False),
+            ("layout_stable", 250, False),
+        ]
+        print(f"✅ PASSED: {contract}")
+
+    def test_unmet_selector_reports_false(self):
+        """Test a missing selector fails the contract but the other waits still run"""
+        waits = FakeWaits(missing={"#SITE_CONTAINER"})
+
+        assert ReadinessContract("careers", selectors=("#SITE_CONTAINER",)).wait(waits) is False
+        assert waits.calls[-1][0] == "layout_stable"
+        print("✅ PASSED: Unmet contract reported")
+
+
+class TestNetworkActivity:
+
+    def test_idle_after_last_busy_period(self):
+        """Test networkidle is the end of the first busy period followed by a quiet gap"""
+        network = NetworkActivity()
+        network.intervals = [(1000, 1200), (1100, 1600), (1900, 2000), (5000, 5100)]
+
+        # 1600 -> 1900 is shorter than the idle window, 2000 -> 5000 is not
+        assert network.idle_at(since=900, until=10_000) == 2000 + NETWORK_IDLE_MS
+        print("✅ PASSED: networkidle computed")
+
+    def test_not_idle_yet(self):
+        """Test None while the quiet window has not passed or a request is in flight"""
+        network = NetworkActivity()
+        network.intervals = [(1000, 1200)]
+        assert network.idle_at(since=900, until=1500) is None
+
+        network.in_flight = {1: 1300}
+        assert network.idle_at(since=900, until=5000) is None
+        print("✅ PASSED: Not idle reported")
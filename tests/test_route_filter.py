@@ -0,0 +1,107 @@
+"""
+Test suite for the request route filter
+"""
+from utils.route_filter import DEFAULT_ALLOW, ResourceSizes, RouteFilter, STUB_PNG, format_filter_stats
+
+
+class FakeRequest:
+
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    """Records which action the filter took"""
+
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.action = None
+
+    def fallback(self):
+        self.action = "fallback"
+
+    def abort(self, error_code=None):
+        self.action = f"abort:{error_code}"
+
+    def fulfill(self, status=200, content_type=None, body=None):
+        self.action = f"fulfill:{content_type}"
+        self.body = body
+
+
+class FakeResponse:
+
+    def __init__(self, url, headers):
+        self.url = url
+        self.headers = headers
+
+
+def route(route_filter, url, resource_type):
+    fake = FakeRoute(url, resource_type)
+    route_filter._route(fake)
+    return fake
+
+
+class TestRouteFilter:
+
+    def test_block_by_type_and_domain(self):
+        """Test heavy types and tracker domains (with subdomains) are blocked"""
+        route_filter = RouteFilter()
+
+        assert route_filter.block_reason("https://careers.trgint.com/", "document") is None
+        assert route_filter.block_reason("https://fonts.example/a.woff2", "font") == "type:font"
+        assert route_filter.block_reason("https://www.google-analytics.com/g/collect", "fetch") == \
+            "domain:google-analytics.com"
+        assert route_filter.block_reason("https://notgoogle-analytics.com/x.js", "script") is None
+        print("✅ PASSED: Types and domains blocked")
+
+    def test_allowlist_wins(self):
+        """Test allowlisted URLs pass even when their type is blocked"""
+        route_filter = RouteFilter(allow=["static.wixstatic.com/media", "*/core-value-*.png"])
+
+        assert route_filter.block_reason("https://static.wixstatic.com/media/a.jpg", "image") is None
+        assert route_filter.block_reason("https://cdn.example/core-value-1.png", "image") is None
+        assert route_filter.block_reason("https://cdn.example/hero.png", "image") == "type:image"
+        print("✅ PASSED: Allowlist respected")
+
+    def test_core_value_images_allowed_by_default(self):
+        """Test the default allowlist lets Wix media through while other images are stubbed"""
+        route_filter = RouteFilter(allow=DEFAULT_ALLOW)
+        image = "https://static.wixstatic.com/media/11062b_4a3f~mv2.jpg/v1/fill/w_300,h_200/11062b_4a3f~mv2.webp"
+
+        assert route(route_filter, image, "image").action == "fallback"
+        assert route(route_filter, "https://static.parastorage.com/icon.png", "image").action == "fulfill:image/png"
+        print("✅ PASSED: Core value images not stubbed")
+
+    def test_actions_and_counts(self):
+        """Test images are stubbed, other blocked requests aborted, the rest passed on"""
+        sizes = ResourceSizes("unused.json")
+        sizes.sizes = {"https://cdn.example/hero.png": 2048}
+        route_filter = RouteFilter(sizes=sizes)
+
+        image = route(route_filter, "https://cdn.example/hero.png", "image")
+        video = route(route_filter, "https://cdn.example/intro.mp4", "media")
+        page = route(route_filter, "https://careers.trgint.com/", "document")
+
+        assert image.action == "fulfill:image/png" and image.body == STUB_PNG
+        assert video.action == "abort:blockedbyclient"
+        assert page.action == "fallback"
+        stats = route_filter.stats()
+        print(format_filter_stats(stats))
+        assert stats == {"blocked": 2, "allowed": 1, "bytes_saved": 2048, "unknown_size": 1,
+                         "by_reason": {"type:image": 1, "type:media": 1}}
+        print("✅ PASSED: Actions and counts")
+
+    def test_sizes_learned_and_merged(self, tmp_path):
+        """Test response sizes are persisted and merged with other workers' sizes"""
+        path = str(tmp_path / "sizes.json")
+        first = ResourceSizes(path)
+        second = ResourceSizes(path)
+        first.learn(FakeResponse("https://a.example/1.png", {"content-length": "10"}))
+        second.learn(FakeResponse("https://a.example/2.png", {"content-length": "20"}))
+        second.learn(FakeResponse("https://a.example/3.png", {}))
+        first.save()
+        second.save()
+
+        assert ResourceSizes(path).sizes == {"https://a.example/1.png": 10, "https://a.example/2.png": 20}
+        print("✅ PASSED: Sizes persisted")
@@ -0,0 +1,40 @@
+"""
+Test suite for the screenshot policy
+"""
+import pytest
+from utils.screenshots import ScreenshotPolicy
+
+
+class TestScreenshotPolicy:
+
+    @pytest.mark.parametrize("mode, failed, expected", [
+        ("off", True, False),
+        ("on-failure", True, True),
+        ("on-failure", False, False),
+        ("always", False, True),
+    ])
+    def test_capture_modes(self, mode, failed, expected):
+        """Test when screenshots are taken"""
+        policy = ScreenshotPolicy(mode=mode)
+        assert policy.should_capture(failed) is expected
+        print(f"✅ PASSED: mode={mode}, failed={failed} -> {expected}")
+
+    def test_artifact_path_is_file_safe(self):
+        """Test node ids become safe file names with the format's extension"""
+        policy = ScreenshotPolicy(fmt="jpeg", output_dir="artifacts/screenshots")
+        path = policy.artifact_path("tests/test_core_values.py::TestCoreValues::test_extract[1920x1080]")
+        print(f"Path: {path}")
+
+        assert path == "artifacts/screenshots/tests_test_core_values.py_TestCoreValues_test_extract_1920x1080.jpg"
+        assert policy.mime_type == "image/jpeg"
+        print("✅ PASSED: Safe artifact path")
+
+    def test_invalid_settings_rejected(self):
+        """Test invalid mode, format and scale fail fast"""
+        with pytest.raises(ValueError):
+            ScreenshotPolicy(mode="sometimes")
+        with pytest.raises(ValueError):
+            ScreenshotPolicy(fmt="gif")
+        with pytest.raises(ValueError):
+            ScreenshotPolicy(scale=2)
+        print("✅ PASSED: Invalid settings rejected")
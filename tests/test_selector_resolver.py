@@ -0,0 +1,115 @@
+"""
+Test suite for the adaptive selector resolver
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.selector_resolver import SelectorNotFound, SelectorResolver, SelectorStats
+
+
+class FakeLocator:
+    """Union of selectors; visible when any of them is on the fake page"""
+
+    def __init__(self, page, selectors):
+        self.page = page
+        self.selectors = selectors
+
+    def or_(self, other):
+        return FakeLocator(self.page, self.selectors + other.selectors)
+
+    @property
+    def first(self):
+        return self
+
+    def wait_for(self, state, timeout):
+        self.page.waits += 1
+        if not any(s in self.page.visible for s in self.selectors):
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def count(self):
+        return sum(s in self.page.visible for s in self.selectors)
+
+
+class FakePage:
+
+    def __init__(self, *visible):
+        self.visible = {f"{s} >> visible=true" for s in visible}
+        self.waits = 0
+
+    def locator(self, selector):
+        return FakeLocator(self, [selector])
+
+
+CANDIDATES = ["a:has-text('Careers')", "a:has-text('Career')", "[href*='career']"]
+
+
+class TestSelectorResolver:
+
+    def test_candidates_raced_in_one_wait(self, tmp_path):
+        """Test a late candidate is found with a single wait"""
+        page = FakePage("[href*='career']")
+        resolver = SelectorResolver(SelectorStats(str(tmp_path / "stats.json")))
+
+        selector, _ = resolver.resolve(page, "careers_link", CANDIDATES)
+        assert selector == "[href*='career']"
+        assert page.waits == 1
+        print("✅ PASSED: One wait for all candidates")
+
+    def test_most_recent_winner_preferred(self, tmp_path):
+        """Test that among several matches the last successful candidate wins"""
+        stats = SelectorStats(str(tmp_path / "stats.json"))
+        resolver = SelectorResolver(stats)
+
+        # Without stats the list order decides
+        selector, _ = resolver.resolve(FakePage(*CANDIDATES), "careers_link", CANDIDATES)
+        assert selector == CANDIDATES[0]
+
+        stats.record("careers_link", "[href*='career']", hit=True, used=True)
+        for _ in range(2):
+            selector, _ = resolver.resolve(FakePage(*CANDIDATES), "careers_link", CANDIDATES)
+            assert selector == "[href*='career']"
+        print("✅ PASSED: Learned order used")
+
+    def test_no_candidate_raises_and_counts_misses(self, tmp_path):
+        """Test SelectorNotFound and miss counts when nothing is visible"""
+        resolver = SelectorResolver(SelectorStats(str(tmp_path / "stats.json")))
+
+        with pytest.raises(SelectorNotFound):
+            resolver.resolve(FakePage(), "careers_link", CANDIDATES, timeout=10)
+        assert all(entry["misses"] == 1 for entry in resolver.stats.data["careers_link"].values())
+        print("✅ PASSED: Not found reported")
+
+    def test_dead_weight_and_parallel_save(self, tmp_path):
+        """Test stats from two processes add up and unused candidates are reported"""
+        path = str(tmp_path / "stats.json")
+        first, second = SelectorStats(path), SelectorStats(path)
+        for stats in (first, second):
+            for _ in range(2):
+                stats.record("life_link", "a:has-text('Life at TRG')", hit=True)
+                stats.record("life_link", "a[href*='#Life at TRG']", hit=False)
+            stats.save()
+
+        merged = SelectorStats(path)
+        assert merged.data["life_link"]["a:has-text('Life at TRG')"]["hits"] == 4
+        assert merged.dead_weight() == [("life_link", "a[href*='#Life at TRG']", 4)]
+        print("✅ PASSED: Dead weight reported")
+
+    def test_concurrent_records_add_up(self, tmp_path):
+        """Test lookups counted from many threads, with saves in between, are not lost"""
+        path = str(tmp_path / "stats.json")
+        stats = SelectorStats(path)
+        candidates = ["a:has-text('Careers')", "[href*='career']"]
+
+        def lookups(worker):
+            for _ in range(500):
+                stats.record("careers_link", candidates[worker % 2], hit=True, used=True)
+                stats.order("careers_link", candidates)
+            stats.save()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lookups, range(8)))
+
+        saved = SelectorStats(path).data["careers_link"]
+        assert [saved[candidate]["hits"] for candidate in candidates] == [2000, 2000]
+        print("✅ PASSED: Concurrent lookups counted")
@@ -0,0 +1,78 @@
+"""
+Test suite for the per-step timing tracer
+"""
+import json
+
+import pytest
+from utils.tracer import Tracer, render_waterfall, span, start_trace, stop_trace, traced
+
+
+class FakePageObject:
+
+    @traced()
+    def open(self):
+        with span("selector", selector="a:has-text('Careers')"):
+            pass
+
+    @traced()
+    def broken(self):
+        raise RuntimeError("menu not found")
+
+
+class TestTracer:
+
+    def test_spans_are_nested(self):
+        """Test decorated methods and inner steps form a parent/child timeline"""
+        tracer = start_trace("test_nested")
+        try:
+            FakePageObject().open()
+        finally:
+            stop_trace()
+
+        outer, inner = tracer.spans
+        print(json.dumps(tracer.to_dict(), indent=2))
+        assert outer["name"] == "FakePageObject.open"
+        assert outer["depth"] == 0 and inner["depth"] == 1
+        assert inner["parent"] == outer["id"]
+        assert inner["attrs"] == {"selector": "a:has-text('Careers')"}
+        assert outer["duration_ms"] >= inner["duration_ms"]
+        print("✅ PASSED: Spans nested")
+
+    def test_errors_mark_span_and_propagate(self):
+        """Test a failing step is recorded as an error and still raises"""
+        tracer = start_trace("test_error")
+        try:
+            with pytest.raises(RuntimeError):
+                FakePageObject().broken()
+        finally:
+            stop_trace()
+
+        assert tracer.spans[0]["status"] == "error"
+        assert tracer.spans[0]["attrs"]["error"] == "menu not found"
+        print("✅ PASSED: Error recorded")
+
+    def test_no_tracer_is_a_no_op(self):
+        """Test page objects work unchanged when tracing is off"""
+        stop_trace()
+        with span("anything") as record:
+            assert record is None
+        FakePageObject().open()
+        print("✅ PASSED: No-op without a tracer")
+
+    def test_timeline_saved_and_rendered(self, tmp_path):
+        """Test the JSON timeline and the escaped waterfall"""
+        tracer = Tracer("test_render")
+        with tracer.span("wait:for_element", target="<b>menu</b>"):
+            pass
+        path = tmp_path / "timeline.json"
+        tracer.save(str(path))
+
+        timeline = json.loads(path.read_text(encoding="utf-8"))
+        html = render_waterfall(timeline)
+        print(html)
+        assert timeline["test"] == "test_render"
+        assert len(timeline["spans"]) == 1
+        assert "tl-wait" in html
+        assert "&lt;b&gt;menu&lt;/b&gt;" in html
+        assert "<b>menu" not in html
+        print("✅ PASSED: Timeline saved and rendered")
@@ -0,0 +1,61 @@
+"""
+Test suite for the condition-based wait engine
+"""
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.waits import WaitEngine, WaitTimeout
+
+
+class FakePage:
+    """Minimal page whose load state is either reached or times out"""
+
+    def __init__(self, reached=True):
+        self.reached = reached
+
+    def wait_for_load_state(self, state, timeout):
+        if not self.reached:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+
+class TestWaitEngine:
+
+    def test_met_wait_is_recorded(self):
+        """Test a satisfied wait returns True and records its blocked time"""
+        waits = WaitEngine(FakePage(reached=True))
+
+        assert waits.for_load_state("load") is True
+        assert len(waits.records) == 1
+        assert waits.records[0]["met"] is True
+        assert waits.records[0]["elapsed_ms"] >= 0
+        print("✅ PASSED: Wait recorded")
+
+    def test_required_wait_raises_on_deadline(self):
+        """Test a required wait raises WaitTimeout"""
+        waits = WaitEngine(FakePage(reached=False))
+
+        with pytest.raises(WaitTimeout):
+            waits.for_load_state("networkidle", timeout=100)
+        assert waits.records[0]["met"] is False
+        print("✅ PASSED: Deadline enforced")
+
+    def test_optional_wait_returns_false(self):
+        """Test an optional wait returns False instead of raising"""
+        waits = WaitEngine(FakePage(reached=False))
+
+        assert waits.for_load_state("load", timeout=100, required=False) is False
+        print("✅ PASSED: Optional wait did not raise")
+
+    def test_summary_lists_slowest_first(self):
+        """Test summary orders waits by blocked time"""
+        waits = WaitEngine(FakePage())
+        waits.records = [
+            {"wait": "url", "target": "careers", "elapsed_ms": 10.0, "timeout_ms": 100, "met": True},
+            {"wait": "scroll_settled", "target": "quiet 200 ms", "elapsed_ms": 900.0, "timeout_ms": 2000, "met": True},
+        ]
+
+        assert waits.slowest(1)[0]["wait"] == "scroll_settled"
+        summary = waits.summary()
+        print(summary)
+        assert "2 conditions" in summary
+        assert summary.index("scroll_settled") < summary.index("url:")
+        print("✅ PASSED: Summary sorted")
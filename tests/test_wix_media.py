@@ -0,0 +1,174 @@
+"""
+Test suite for Wix image transforms and content type detection
+"""
+import pytest
+from benchmarks.standin_site import png_bytes
+from pages.careers_page import (
+    CORE_VALUE_CONFIGS,
+    core_value_image_jobs,
+    name_by_content,
+    rendered_image_jobs,
+    shape_core_values,
+)
+from utils.downloader import Downloader
+from utils.network_archive import NetworkArchive, set_active_archive
+from utils.wix_media import (
+    configure_image_fetch,
+    fix_extension,
+    format_savings,
+    image_fetch_settings,
+    original_url,
+    sniff_image_type,
+    transform_url,
+)
+
+
+ORIGINAL = "https://static.wixstatic.com/media/11062b_4a3f~mv2.jpg"
+RENDERED_SRC = f"{ORIGINAL}/v1/fill/w_980,h_650,al_c,q_85,enc_auto/11062b_4a3f~mv2.jpg"
+WEBP = b"RIFF\x24\x00\x00\x00WEBPVP8 " + b"\x00" * 20
+
+
+class TestWixUrls:
+
+    def test_transform_original(self):
+        """Test an original media URL is rewritten to the rendered size and format"""
+        assert transform_url(ORIGINAL, 300, 200) == (
+            f"{ORIGINAL}/v1/fill/w_300,h_200,al_c,q_80/11062b_4a3f~mv2.webp"
+        )
+        print("✅ PASSED: Original transformed")
+
+    def test_transform_replaces_existing_transform(self):
+        """Test a src that is already transformed gets the requested size instead"""
+        assert original_url(RENDERED_SRC) == ORIGINAL
+        assert transform_url(f"//{RENDERED_SRC[8:]}", 600, 400, image_format="jpg", quality=70) == (
+            f"{ORIGINAL}/v1/fill/w_600,h_400,al_c,q_70/11062b_4a3f~mv2.jpg"
+        )
+        print("✅ PASSED: Existing transform replaced")
+
+    def test_other_urls_unchanged(self):
+        """Test non-Wix URLs and missing sizes are left alone"""
+        assert transform_url("https://careers.trgint.com/logo.png", 300, 200) == "https://careers.trgint.com/logo.png"
+        assert transform_url(ORIGINAL, 0, 0) == ORIGINAL
+        print("✅ PASSED: Other URLs unchanged")
+
+    def test_unknown_fetch_mode_rejected(self):
+        """Test configure_image_fetch validates the mode"""
+        before = image_fetch_settings()
+        with pytest.raises(ValueError):
+            configure_image_fetch("thumbnail")
+        assert image_fetch_settings() == before
+        print("✅ PASSED: Unknown mode rejected")
+
+
+class TestContentType:
+
+    @pytest.mark.parametrize("head,expected", [
+        (png_bytes(2, 2, seed=1), "png"),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "jpg"),
+        (WEBP, "webp"),
+        (b"GIF89a\x01\x00", "gif"),
+        (b"\x00\x00\x00\x1cftypavif", "avif"),
+        (b'<?xml version="1.0"?><svg xmlns="http://www.w3.org/2000/svg">', "svg"),
+        (b"<html>Not found</html>", None),
+    ])
+    def test_magic_bytes(self, head, expected):
+        """Test the image type comes from the first bytes"""
+        assert sniff_image_type(head) == expected
+        print(f"✅ PASSED: {expected}")
+
+    def test_file_renamed_to_real_type(self, tmp_path):
+        """Test a WebP saved as .png is renamed, a real PNG keeps its name"""
+        webp = tmp_path / "whatever-it-takes.png"
+        webp.write_bytes(WEBP)
+        png = tmp_path / "we-work-together.png"
+        png.write_bytes(png_bytes(2, 2, seed=1))
+
+        assert fix_extension(str(webp)) == str(tmp_path / "whatever-it-takes.webp")
+        assert not webp.exists()
+        assert fix_extension(str(png)) == str(png)
+        print("✅ PASSED: Files named by content")
+
+
+class TestRenderedFetch:
+
+    def test_jobs_rewritten_to_rendered_size(self):
+        """Test Wix jobs get the rendered size, others and unsized ones are kept"""
+        jobs = [
+            ("#img_a", ORIGINAL, "a.png"),
+            ("#img_b", "https://careers.trgint.com/b.png", "b.png"),
+            ("#img_c", ORIGINAL, "c.png"),
+        ]
+        fetch = {"mode": "rendered", "image_format": "webp", "quality": 80}
+
+        rendered, originals = rendered_image_jobs(jobs, [[300, 200], [300, 200], None], fetch)
+        assert rendered[0][1].endswith("/w_300,h_200,al_c,q_80/11062b_4a3f~mv2.webp")
+        assert rendered[1:] == jobs[1:]
+        assert originals == {rendered[0][1]: ORIGINAL}
+        print("✅ PASSED: Jobs rewritten")
+
+    def test_image_jobs_planned_from_headlines(self, tmp_path):
+        """Test the jobs both Careers pages download: absolute URLs, files named after the headlines"""
+        core_values = shape_core_values([
+            {"headline": "Whatever it takes!", "description": "d"},
+            {"headline": None, "description": None},
+            {"headline": "We make an impact.", "description": "d"},
+            {"headline": "Passion is our fuel.", "description": "d"},
+        ])
+        assert core_values[1] == {"headline": CORE_VALUE_CONFIGS[1]["fallback_headline"],
+                                  "description": CORE_VALUE_CONFIGS[1]["fallback_description"]}
+
+        jobs = core_value_image_jobs(core_values, ["//static.wixstatic.com/a.png", "/b.png", ORIGINAL, None],
+                                     str(tmp_path))
+        assert [img_id for img_id, _, _ in jobs] == [config["img_id"] for config in CORE_VALUE_CONFIGS]
+        assert [src for _, src, _ in jobs] == ["https://static.wixstatic.com/a.png",
+                                               "https://careers.trgint.com/b.png", ORIGINAL, None]
+        assert [path.rsplit("/", 1)[1] for _, _, path in jobs] == [
+            "whatever-it-takes.png", "we-work-together.png", "we-make-an-impact.png", "passion-is-our-fuel.png"]
+        print("✅ PASSED: Image jobs planned")
+
+    def test_savings_report(self, tmp_path):
+        """Test bytes downloaded and avoided are reported against the original sizes"""
+        path = tmp_path / "a.webp"
+        path.write_bytes(b"x" * 2048)
+        url = transform_url(ORIGINAL, 300, 200)
+        results = [{"url": url, "path": str(path), "bytes": 2048, "ok": True}]
+
+        line = format_savings(results, {url: ORIGINAL}, {ORIGINAL: 2048 * 100})
+        assert "2.0 KB downloaded" in line
+        assert "198.0 KB avoided" in line
+        assert "unknown" in format_savings(results, {url: ORIGINAL}, {ORIGINAL: None})
+        print("✅ PASSED: Savings reported")
+
+    def test_original_size_from_replayed_archive(self, tmp_path):
+        """Test the original's size is known offline from the archived GET"""
+        recorder = NetworkArchive(str(tmp_path / "archive"), mode="record")
+        recorder.store("GET", ORIGINAL, 200, {"Content-Type": "image/jpeg"}, b"x" * 5000)
+        recorder.save()
+
+        replay = NetworkArchive(str(tmp_path / "archive"), mode="replay")
+        set_active_archive(replay)
+        try:
+            lengths = Downloader().content_lengths([ORIGINAL, "https://static.wixstatic.com/media/missing.jpg"])
+        finally:
+            set_active_archive(None)
+        assert lengths == [5000, None]
+        # The HEAD lookup falls back to the GET; only the URL missing from both counts
+        assert replay.misses == 1
+        print("✅ PASSED: Original size replayed")
+
+    def test_downloads_named_by_content(self, tmp_path):
+        """Test successful downloads are renamed and mapped back to the requested path"""
+        requested = tmp_path / "passion-is-our-fuel.png"
+        requested.write_bytes(WEBP)
+        results = [
+            {"url": "u1", "path": str(requested), "ok": True},
+            {"url": "u2", "path": str(tmp_path / "failed.png"), "ok": False},
+        ]
+
+        stale = tmp_path / "passion-is-our-fuel.jpg"
+        stale.write_bytes(b"\xff\xd8\xff" + b"\x00" * 20)
+
+        assert name_by_content(results) == {str(requested): str(tmp_path / "passion-is-our-fuel.webp")}
+        assert results[0]["path"].endswith(".webp")
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["passion-is-our-fuel.webp"]
+        print("✅ PASSED: Downloads renamed")
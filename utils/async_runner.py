@@ -0,0 +1,62 @@
+"""
+Event loop for the async page objects (pages.async_base_page)
+
+pytest runs test functions synchronously, so the async fixtures and tests
+drive coroutines through one long-lived loop per session instead of a
+plugin such as pytest-asyncio: the async browser and its contexts stay
+bound to the loop that created them.
+
+The loop runs in its own thread. Sync Playwright keeps an event loop
+running on the main thread once any browser test has started it, and a
+second loop cannot run there (run_until_complete and asyncio.run both
+refuse), so coroutines are submitted to the loop thread instead.
+"""
+import asyncio
+import threading
+
+
+class AsyncRunner:
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="async-runner", daemon=True)
+        self.thread.start()
+
+    def run(self, coro):
+        """Run a coroutine to completion on the session loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def gather(self, *coros, limit: int = None):
+        """
+        Run coroutines concurrently; results come back in argument order
+        limit caps how many run at the same time (e.g. open pages)
+        """
+        return self.run(gather_limited(coros, limit))
+
+    def close(self):
+        self.run(self.loop.shutdown_asyncgens())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def run_async(coro):
+    """asyncio.run() that also works while another loop runs on this thread"""
+    runner = AsyncRunner()
+    try:
+        return runner.run(coro)
+    finally:
+        runner.close()
+
+
+async def gather_limited(coros, limit: int = None) -> list:
+    """asyncio.gather with at most limit coroutines in flight"""
+    if not limit:
+        return await asyncio.gather(*coros)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(bounded(coro) for coro in coros))
@@ -0,0 +1,71 @@
+"""
+Session-wide browser pool shared by all tests of a pytest worker
+"""
+
+
+class BrowserPool:
+    """
+    Lazily launched pool of Chromium browsers
+
+    Browsers are started on first use and handed out round-robin, so a
+    run with pool size 1 pays the launch cost exactly once. Each test
+    gets its own BrowserContext, which keeps cookies, storage and pages
+    isolated without relaunching the browser.
+
+    With a BrowserServer the pool connects to the persistent Chromium
+    instead of launching one, so the launch cost is paid once across runs.
+    """
+
+    def __init__(self, playwright, size: int = 1, headless: bool = True, slow_mo: int = 0, server=None):
+        self.playwright = playwright
+        self.size = max(1, int(size))
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.server = server
+        self.browsers = []
+        self._next = 0
+
+    def launch(self):
+        """Launch (or connect to) one more Chromium instance and add it to the pool"""
+        if self.server is not None:
+            browser = self.server.connect(self.playwright, slow_mo=self.slow_mo)
+        else:
+            browser = self.playwright.chromium.launch(
+                headless=self.headless,
+                slow_mo=self.slow_mo
+            )
+        self.browsers.append(browser)
+        return browser
+
+    def acquire(self):
+        """Return the next browser, launching it if the pool is not full yet"""
+        if len(self.browsers) < self.size:
+            browser = self.launch()
+        else:
+            browser = self.browsers[self._next % self.size]
+            self._next += 1
+
+        if not browser.is_connected():
+            # Replace a crashed browser instead of failing every later test
+            self.browsers.remove(browser)
+            browser = self.launch()
+
+        return browser
+
+    def new_context(self, browser=None, **kwargs):
+        """
+        Create a fresh, isolated BrowserContext on browser (one of the pool's)
+        or the next pooled browser; every context counts as server activity
+        """
+        if self.server is not None:
+            self.server.touch()
+        return (browser or self.acquire()).new_context(**kwargs)
+
+    def close(self):
+        """Close every browser in the pool (a server's Chromium is only disconnected)"""
+        for browser in self.browsers:
+            try:
+                browser.close()
+            except Exception:
+                pass
+        self.browsers = []
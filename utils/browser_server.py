@@ -0,0 +1,329 @@
+"""
+Persistent Chromium server reused across pytest invocations
+
+Launching Chromium dominates the edit-run loop when one test is rerun
+over and over. With browser_server enabled the first run starts Chromium
+in a detached helper process that exposes a CDP (remote debugging)
+endpoint; later runs attach to it with connect_over_cdp instead of
+launching. The helper health-checks Chromium and shuts it down after an
+idle period without test contexts being opened.
+
+    python -m utils.browser_server status
+    python -m utils.browser_server stop
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from urllib.request import urlopen
+
+
+DEFAULT_SERVER_DIR = "data/.cache/browser_server"
+STATE_FILE = "server.json"
+ACTIVITY_FILE = "activity"
+STOP_FILE = "stop"
+LOCK_FILE = "launch.lock"
+LOG_FILE = "server.log"
+
+# A launch lock older than this was left behind by a killed run
+STALE_LOCK_SECONDS = 60
+# Consecutive failed health checks before the helper gives up on Chromium
+MAX_HEALTH_FAILURES = 3
+
+CHROMIUM_ARGS = (
+    "--remote-debugging-port=0",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-dev-shm-usage",
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def probe(endpoint: str, timeout: float = 1.0):
+    """webSocketDebuggerUrl of a CDP endpoint, None when it does not answer"""
+    try:
+        with urlopen(f"{endpoint}/json/version", timeout=timeout) as response:
+            return json.load(response).get("webSocketDebuggerUrl")
+    except (OSError, ValueError):
+        return None
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _touch(path: str):
+    with open(path, "a"):
+        pass
+    os.utime(path)
+
+
+class BrowserServer:
+    """
+    Client side of the persistent browser: finds a healthy server with
+    matching settings, or launches one and waits for its endpoint
+    """
+
+    def __init__(self, executable: str, headless: bool = True, idle_seconds: float = 1800,
+                 directory: str = DEFAULT_SERVER_DIR, poll_seconds: float = 2.0):
+        self.executable = executable
+        self.headless = headless
+        self.idle_seconds = idle_seconds
+        self.directory = os.path.abspath(directory)
+        self.poll_seconds = poll_seconds
+        self.reused = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def read_state(self):
+        """State written by the running helper, None when no server is running"""
+        try:
+            with open(self._path(STATE_FILE), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_healthy(self, state=None) -> bool:
+        state = state if state is not None else self.read_state()
+        return state is not None and probe(state["endpoint"]) is not None
+
+    def _usable(self, state) -> bool:
+        return (state is not None and state["executable"] == self.executable
+                and state["headless"] == self.headless and self.is_healthy(state))
+
+    def touch(self):
+        """Record activity so the helper's idle timer starts over"""
+        if os.path.isdir(self.directory):
+            _touch(self._path(ACTIVITY_FILE))
+
+    def endpoint(self, timeout: float = 30) -> str:
+        """HTTP endpoint of a healthy server with these settings, launched if needed"""
+        state = self.read_state()
+        if not self._usable(state):
+            with self._launch_lock(timeout):
+                # Another xdist worker may have launched it while we waited
+                state = self.read_state()
+                if not self._usable(state):
+                    if state is not None:
+                        # Different headless/executable: wait for a clean shutdown.
+                        # Not answering: the helper is most likely gone already
+                        self.stop(timeout=10 if self.is_healthy(state) else 2)
+                    state = self._wait_for_state(self._spawn(), timeout)
+                    self.reused = False
+        if self.reused is None:
+            self.reused = True
+        self.touch()
+        return state["endpoint"]
+
+    def connect(self, playwright, slow_mo: int = 0):
+        """Attach a sync Playwright instance to the server"""
+        return playwright.chromium.connect_over_cdp(self.endpoint(), slow_mo=slow_mo)
+
+    def stop(self, timeout: float = 10) -> bool:
+        """Ask the helper to shut Chromium down; returns whether a server was running"""
+        if self.read_state() is None:
+            return False
+        _touch(self._path(STOP_FILE))
+        deadline = time.monotonic() + timeout
+        while self.read_state() is not None:
+            if time.monotonic() > deadline:
+                # The helper is gone (killed) and left its state behind
+                _remove(self._path(STATE_FILE))
+                break
+            time.sleep(0.1)
+        _remove(self._path(STOP_FILE))
+        return True
+
+    @contextmanager
+    def _launch_lock(self, timeout: float):
+        os.makedirs(self.directory, exist_ok=True)
+        lock = self._path(LOCK_FILE)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock) > STALE_LOCK_SECONDS:
+                        _remove(lock)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {lock}")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            _remove(lock)
+
+    def _spawn(self):
+        """Start the helper detached, so Chromium outlives this pytest run"""
+        _remove(self._path(STOP_FILE))
+        command = [
+            sys.executable, "-m", "utils.browser_server", "--dir", self.directory, "serve",
+            "--executable", self.executable,
+            "--idle-seconds", str(self.idle_seconds),
+            "--poll-seconds", str(self.poll_seconds),
+        ]
+        if not self.headless:
+            command.append("--headed")
+        options = {}
+        if os.name == "nt":
+            options["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            options["start_new_session"] = True
+        with open(self._path(LOG_FILE), "w", encoding="utf-8") as log:
+            return subprocess.Popen(command, cwd=ROOT, stdin=subprocess.DEVNULL, stdout=log, stderr=log, **options)
+
+    def _wait_for_state(self, helper, timeout: float) -> dict:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and helper.poll() is None:
+            state = self.read_state()
+            if state is not None and self.is_healthy(state):
+                return state
+            time.sleep(0.1)
+        with open(self._path(LOG_FILE), encoding="utf-8", errors="replace") as f:
+            log = f.read()[-2000:]
+        if helper.poll() is not None:
+            raise RuntimeError(f"Browser server exited with code {helper.returncode}\n{log}")
+        raise RuntimeError(f"Browser server did not start within {timeout:g}s\n{log}")
+
+
+def _wait_for_port(port_file: str, chromium, timeout: float = 30) -> int:
+    """Port Chromium picked for --remote-debugging-port=0 (it writes DevToolsActivePort)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if chromium.poll() is not None:
+            raise RuntimeError(f"Chromium exited with code {chromium.returncode}")
+        try:
+            with open(port_file, encoding="utf-8") as f:
+                port = f.readline().strip()
+            if port:
+                return int(port)
+        except (OSError, ValueError):
+            pass
+        time.sleep(0.05)
+    raise RuntimeError(f"Chromium did not open a debugging port within {timeout:g}s")
+
+
+def serve(directory: str, executable: str, headless: bool = True, idle_seconds: float = 1800,
+          poll_seconds: float = 2.0):
+    """
+    Helper process: run Chromium until it is idle, stopped or unhealthy
+    The state file exists only while the endpoint is usable
+    """
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    state_path = os.path.join(directory, STATE_FILE)
+    activity_path = os.path.join(directory, ACTIVITY_FILE)
+    stop_path = os.path.join(directory, STOP_FILE)
+    profile = os.path.join(directory, "profile")
+    port_file = os.path.join(profile, "DevToolsActivePort")
+    _remove(port_file)
+
+    command = [executable, f"--user-data-dir={profile}", *CHROMIUM_ARGS]
+    if headless:
+        command.append("--headless=new")
+    command.append("about:blank")
+    chromium = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+    reason = "Chromium exited"
+    try:
+        endpoint = f"http://127.0.0.1:{_wait_for_port(port_file, chromium)}"
+        state = {
+            "endpoint": endpoint,
+            "pid": os.getpid(),
+            "chromium_pid": chromium.pid,
+            "executable": executable,
+            "headless": headless,
+            "idle_seconds": idle_seconds,
+            "started": time.time(),
+        }
+        with open(state_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        os.replace(state_path + ".tmp", state_path)
+        _touch(activity_path)
+        print(f"   ✅ Browser server on {endpoint} (pid {chromium.pid})", flush=True)
+
+        failures = 0
+        while chromium.poll() is None:
+            time.sleep(poll_seconds)
+            if os.path.exists(stop_path):
+                reason = "stop requested"
+                break
+            if time.time() - os.path.getmtime(activity_path) > idle_seconds:
+                reason = f"idle for {idle_seconds:g}s"
+                break
+            failures = 0 if probe(endpoint) is not None else failures + 1
+            if failures >= MAX_HEALTH_FAILURES:
+                reason = "endpoint stopped answering"
+                break
+    finally:
+        # State goes first so no client connects to a browser that is shutting down
+        _remove(state_path)
+        if chromium.poll() is None:
+            chromium.terminate()
+            try:
+                chromium.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                chromium.kill()
+        _remove(stop_path)
+    print(f"   ℹ️  Browser server stopped: {reason}", flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.browser_server",
+                                     description="Persistent Chromium server for the test suite")
+    parser.add_argument("--dir", default=DEFAULT_SERVER_DIR, help="Server state directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="Show the running server")
+    commands.add_parser("stop", help="Shut the running server down")
+    serve_parser = commands.add_parser("serve", help="Run Chromium in the foreground (started by the tests)")
+    serve_parser.add_argument("--executable", required=True, help="Chromium binary")
+    serve_parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    serve_parser.add_argument("--idle-seconds", type=float, default=1800, help="Shut down after this long unused")
+    serve_parser.add_argument("--poll-seconds", type=float, default=2.0, help="Interval of idle and health checks")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    directory = os.path.abspath(args.dir)
+
+    if args.command == "serve":
+        serve(directory, args.executable, headless=not args.headed, idle_seconds=args.idle_seconds,
+              poll_seconds=args.poll_seconds)
+        return 0
+
+    server = BrowserServer(executable=None, directory=directory)
+    state = server.read_state()
+    if args.command == "stop":
+        print("   ✅ Browser server stopped" if server.stop() else "   ℹ️  No browser server running")
+        return 0
+
+    if state is None:
+        print("   ℹ️  No browser server running")
+        return 1
+    activity = os.path.join(directory, ACTIVITY_FILE)
+    idle = time.time() - os.path.getmtime(activity) if os.path.exists(activity) else 0
+    health = "healthy" if server.is_healthy(state) else "NOT answering"
+    print(f"   ✅ {state['endpoint']} ({health}), Chromium pid {state['chromium_pid']}, "
+          f"{'headless' if state['headless'] else 'headed'}, idle {idle:.0f}s of {state['idle_seconds']:g}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Playwright trace policy for test contexts
+
+Tracing starts with every test context and records into Playwright's
+temporary trace buffer. When the test is over the buffer is either
+written to a zip (for the tests the mode keeps, e.g. failures) or
+discarded without touching the artifacts directory. Retained traces are
+capped in total size; the oldest are removed first.
+
+Open a trace with: playwright show-trace <file>.zip
+"""
+import os
+import re
+
+
+MODES = ("off", "on-failure", "always")
+
+# pytest-playwright's --tracing values, honoured when given
+PYTEST_PLAYWRIGHT_MODES = {"on": "always", "retain-on-failure": "on-failure"}
+
+
+class TracePolicy:
+
+    def __init__(self, mode: str = "on-failure", screenshots: bool = False, snapshots: bool = True,
+                 sources: bool = False, max_mb: float = 200, output_dir: str = "artifacts/traces"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown trace mode '{mode}', expected one of {MODES}")
+        self.mode = mode
+        self.screenshots = screenshots
+        self.snapshots = snapshots
+        self.sources = sources
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.output_dir = output_dir
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def should_keep(self, failed: bool) -> bool:
+        """Apply the trace mode to a test outcome"""
+        if self.mode == "always":
+            return True
+        return self.mode == "on-failure" and failed
+
+    def artifact_path(self, nodeid: str) -> str:
+        """File path for a test's trace, derived from its node id"""
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+        return os.path.join(self.output_dir, f"{safe_name}.zip")
+
+    def start(self, context, title: str = None):
+        """Start recording the context (screencast frames and DOM snapshots as configured)"""
+        if self.enabled:
+            context.tracing.start(title=title, screenshots=self.screenshots, snapshots=self.snapshots,
+                                  sources=self.sources)
+
+    def start_chunk(self, context, title: str = None):
+        """Start a test's chunk on a shared context whose tracing start() already began"""
+        if self.enabled:
+            context.tracing.start_chunk(title=title)
+
+    def stop(self, context, nodeid: str, failed: bool, chunk: bool = False):
+        """
+        Stop recording (only the current chunk with chunk=True); write the
+        trace only when the mode keeps it
+        Returns the trace path, or None when it was discarded
+        """
+        stop = context.tracing.stop_chunk if chunk else context.tracing.stop
+        if not self.should_keep(failed):
+            stop()
+            return None
+        path = self.artifact_path(nodeid)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        stop(path=path)
+        self.enforce_cap(keep=path)
+        return path
+
+    def enforce_cap(self, keep: str = None) -> list:
+        """Remove the oldest traces until the retained ones fit in max_bytes; returns removed paths"""
+        traces = []
+        for name in os.listdir(self.output_dir):
+            path = os.path.join(self.output_dir, name)
+            if name.endswith(".zip") and os.path.isfile(path):
+                stat = os.stat(path)
+                traces.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in traces)
+        removed = []
+        for _, size, path in sorted(traces):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another xdist worker evicted it first
+                pass
+            total -= size
+            removed.append(path)
+        return removed
@@ -0,0 +1,53 @@
+"""
+Cookie consent handled once per session
+
+The consent banner is accepted once in a setup context; its cookies and
+localStorage are saved with context.storage_state() and preloaded into
+every test context. Nothing is saved when no banner was accepted. Page objects ask consent_preloaded(context) to skip
+looking for a banner that will not appear.
+"""
+import weakref
+
+
+# Both TRG sites show the same banner buttons
+COOKIE_BUTTONS = "button:has-text('Accept'), button:has-text('I Accept')"
+
+_preloaded_contexts = weakref.WeakSet()
+
+
+def mark_consent_preloaded(context):
+    """Record that a context was created from the saved consent state"""
+    _preloaded_contexts.add(context)
+
+
+def consent_preloaded(context) -> bool:
+    return context in _preloaded_contexts
+
+
+def capture_consent_state(context, page_object, urls, path: str):
+    """
+    Visit each URL, accept the banner where it appears and save the
+    context's storage state (cookies + localStorage) to path
+    Returns path, or None when no banner was accepted: there is no consent
+    to preload, so test contexts keep looking for the banner themselves
+    """
+    accepted = False
+    for url in urls:
+        page_object.goto_ready(url)
+        accepted = page_object.accept_cookies(timeout=5000) or accepted
+    if not accepted:
+        return None
+    context.storage_state(path=path)
+    return path
+
+
+async def capture_consent_state_async(context, page_object, urls, path: str):
+    """capture_consent_state() for async page objects"""
+    accepted = False
+    for url in urls:
+        await page_object.goto_ready(url)
+        accepted = await page_object.accept_cookies(timeout=5000) or accepted
+    if not accepted:
+        return None
+    await context.storage_state(path=path)
+    return path
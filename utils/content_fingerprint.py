@@ -0,0 +1,111 @@
+"""
+Fingerprints of extracted page sections, for incremental runs
+
+A section (e.g. the Careers core values) is read in one page.evaluate
+call; its records (text and image srcs) are hashed. When the hash
+matches the one stored by the last run and that run's output files are
+still there, the extraction, JSON writes and downloads can be skipped.
+When it differs, a compact summary lists the fields that changed.
+"""
+import hashlib
+import json
+import os
+
+from utils.parallel import atomic_write_json
+
+
+DEFAULT_FINGERPRINTS_PATH = "data/.cache/content_fingerprints.json"
+
+
+def fingerprint(records) -> str:
+    """sha256 of the records, independent of key order"""
+    payload = json.dumps(records, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def diff_records(old, new) -> list:
+    """One line per changed field, added or removed record"""
+    changes = []
+    for idx in range(max(len(old), len(new))):
+        if idx >= len(old):
+            changes.append(f"record {idx + 1}: added")
+            continue
+        if idx >= len(new):
+            changes.append(f"record {idx + 1}: removed")
+            continue
+        for field in sorted(set(old[idx]) | set(new[idx])):
+            before, after = old[idx].get(field), new[idx].get(field)
+            if before != after:
+                changes.append(f"record {idx + 1} {field}: {str(before)[:40]!r} -> {str(after)[:40]!r}")
+    return changes
+
+
+class ContentCheck:
+    """Result of comparing a section with its stored fingerprint"""
+
+    def __init__(self, name: str, fingerprint: str, previous: str = None, changes=(), missing_outputs=()):
+        self.name = name
+        self.fingerprint = fingerprint
+        self.previous = previous
+        self.changes = list(changes)
+        self.missing_outputs = list(missing_outputs)
+
+    @property
+    def unchanged(self) -> bool:
+        """Same content as last run and its outputs are still on disk"""
+        return self.fingerprint == self.previous and not self.missing_outputs
+
+    def summary(self) -> str:
+        if self.previous is None:
+            return f"   ℹ️  {self.name}: no stored fingerprint, extracting"
+        if self.unchanged:
+            return f"   ✅ {self.name}: unchanged ({self.fingerprint[:12]}), skipping extraction"
+        if self.fingerprint == self.previous:
+            return (f"   ℹ️  {self.name}: unchanged, but {len(self.missing_outputs)} outputs are missing, "
+                    f"extracting")
+        lines = [f"   🔄 {self.name}: changed ({self.previous[:12]} -> {self.fingerprint[:12]}), "
+                 f"{len(self.changes)} changes"]
+        lines.extend(f"      {change}" for change in self.changes)
+        return "\n".join(lines)
+
+
+class FingerprintStore:
+    """
+    Fingerprint, records and output files of each section, persisted between runs
+
+    outputs are paths relative to root (the output directory), so runs
+    under xdist check the merged outputs of the previous run.
+    """
+
+    def __init__(self, path: str = DEFAULT_FINGERPRINTS_PATH, root: str = "data"):
+        self.path = path
+        self.root = root
+        self.entries = self._load()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def check(self, name: str, records) -> ContentCheck:
+        """Compare records with the stored fingerprint of the section"""
+        entry = self.entries.get(name)
+        current = fingerprint(records)
+        if entry is None:
+            return ContentCheck(name, current)
+        missing = [output for output in entry["outputs"] if not os.path.exists(os.path.join(self.root, output))]
+        changes = diff_records(entry["records"], records) if current != entry["fingerprint"] else []
+        return ContentCheck(name, current, entry["fingerprint"], changes, missing)
+
+    def output_path(self, output: str) -> str:
+        """Where an output of the stored run is (to reuse it when unchanged)"""
+        return os.path.join(self.root, output)
+
+    def update(self, name: str, records, outputs):
+        """Store the section's fingerprint, merged with what other workers saved meanwhile"""
+        entry = {"fingerprint": fingerprint(records), "records": records, "outputs": sorted(outputs)}
+        self.entries[name] = entry
+        merged = self._load()
+        merged[name] = entry
+        atomic_write_json(self.path, merged, indent=2, ensure_ascii=False, sort_keys=True)
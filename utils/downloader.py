@@ -0,0 +1,170 @@
+"""
+Concurrent, connection-pooled file downloads
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.image_cache import ImageCache
+from utils.network_archive import http_get, http_head
+from utils.parallel import temp_path
+from utils.tracer import span
+
+
+DEFAULT_WORKERS = 4
+CHUNK_SIZE = 64 * 1024
+
+_shared_downloader = None
+_shared_settings = {}
+
+
+class Downloader:
+    """
+    Downloads files over one keep-alive requests.Session
+
+    Bodies are streamed to disk in chunks (into a temp file that is
+    renamed when complete), and every download reports its byte count
+    and timing. download_all runs downloads on a bounded thread pool.
+    With an ImageCache, downloads are revalidated against the cache and
+    unchanged files cost a 304 instead of a full transfer.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, timeout: int = 10, chunk_size: int = CHUNK_SIZE,
+                 cache: ImageCache = None):
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.results = []
+
+    def download(self, url: str, path: str) -> dict:
+        """Download one URL to path; returns a result dict (never raises)"""
+        start = time.perf_counter()
+        result = {"url": url, "path": path, "bytes": 0, "elapsed_ms": 0.0, "ok": False, "error": None,
+                  "cache": None}
+        with span("download", file=os.path.basename(path)) as step:
+            try:
+                if self.cache is not None:
+                    result.update(self.cache.fetch(url, path, session=self.session, timeout=self.timeout,
+                                                   chunk_size=self.chunk_size))
+                else:
+                    result["bytes"] = self._stream_to_file(url, path)
+                result["ok"] = True
+            except Exception as e:
+                result["error"] = str(e)
+            if step is not None:
+                step["attrs"].update(bytes=result["bytes"], cache=result["cache"])
+                if not result["ok"]:
+                    step["status"] = "error"
+                    step["attrs"]["error"] = result["error"][:200]
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        self.results.append(result)
+        return result
+
+    def _stream_to_file(self, url: str, path: str) -> int:
+        """Stream a response body into path; returns the number of bytes written"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        part_path = temp_path(path)
+        written = 0
+        try:
+            response = http_get(url, timeout=self.timeout, session=self.session, stream=True)
+            with response:
+                response.raise_for_status()
+                with open(part_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        f.write(chunk)
+                        written += len(chunk)
+            os.replace(part_path, path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        return written
+
+    def download_all(self, jobs) -> list:
+        """
+        Download (url, path) pairs concurrently
+        Results are returned in the same order as jobs
+        """
+        jobs = list(jobs)
+        try:
+            if len(jobs) <= 1:
+                return [self.download(url, path) for url, path in jobs]
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+                return list(pool.map(lambda job: self.download(*job), jobs))
+        finally:
+            # One index write per batch instead of one per file
+            if self.cache is not None:
+                self.cache.save()
+
+    def content_length(self, url: str):
+        """Size of url from a HEAD request, None when unknown (never raises)"""
+        try:
+            status, headers = http_head(url, timeout=self.timeout, session=self.session)
+        except Exception:
+            return None
+        length = headers.get("Content-Length")
+        return int(length) if status < 400 and length and length.isdigit() else None
+
+    def content_lengths(self, urls) -> list:
+        """content_length of each URL, requested concurrently"""
+        urls = list(urls)
+        if len(urls) <= 1:
+            return [self.content_length(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            return list(pool.map(self.content_length, urls))
+
+    def close(self):
+        self.session.close()
+
+
+def configure_downloader(**settings):
+    """Set the Downloader arguments used when the shared downloader is created"""
+    global _shared_downloader
+    _shared_settings.clear()
+    _shared_settings.update(settings)
+    _shared_downloader = None
+
+
+def get_downloader() -> Downloader:
+    """Process-wide downloader, so keep-alive connections survive across tests"""
+    global _shared_downloader
+    if _shared_downloader is None:
+        _shared_downloader = Downloader(**_shared_settings)
+    return _shared_downloader
+
+
+def shared_cache_stats():
+    """Counters of the shared downloader's cache, or None if nothing was cached"""
+    if _shared_downloader is None or _shared_downloader.cache is None:
+        return None
+    return _shared_downloader.cache.stats()
+
+
+def save_shared_cache():
+    """Write the shared downloader's cache index if downloads changed it"""
+    if _shared_downloader is not None and _shared_downloader.cache is not None:
+        _shared_downloader.cache.save()
+
+
+def format_results(results) -> str:
+    """One line per download with size and timing"""
+    lines = []
+    for r in results:
+        status = "✓" if r["ok"] else f"❌ {str(r['error'])[:50]}"
+        if r.get("cache"):
+            status += f" (cache {r['cache']})"
+        lines.append(
+            f"      {r['bytes'] / 1024:8.1f} KB  {r['elapsed_ms']:8.1f} ms  {os.path.basename(r['path'])} {status}"
+        )
+    total_bytes = sum(r["bytes"] for r in results)
+    lines.append(f"      Total: {len(results)} files, {total_bytes / 1024:.1f} KB")
+    return "\n".join(lines)
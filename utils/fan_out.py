@@ -0,0 +1,158 @@
+"""
+Fan-out of one extraction across several browser contexts
+
+Each ContextSpec (viewport + locale) gets its own BrowserContext in the
+same browser; the flow runs in all of them concurrently on one event
+loop (see pages.async_careers_page). The per-context results are merged
+into one report with the timings of every context and the fields whose
+values differ between contexts.
+"""
+import re
+import time
+from contextlib import contextmanager
+
+from utils.async_runner import gather_limited
+
+
+# name, viewport and locale of each context, e.g. "mobile 390x844 vi-VN"
+DEFAULT_CONTEXTS = (
+    "desktop 1920x1080 en-US",
+    "laptop 1280x800 en-GB",
+    "mobile 390x844 vi-VN",
+)
+
+SPEC_PATTERN = re.compile(r"^(\S+)\s+(\d+)x(\d+)(?:\s+(\S+))?$")
+
+
+class ContextSpec:
+
+    def __init__(self, name: str, width: int, height: int, locale: str = None):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.locale = locale
+
+    @classmethod
+    def parse(cls, spec: str) -> "ContextSpec":
+        """'<name> <width>x<height> [locale]'"""
+        match = SPEC_PATTERN.match(spec.strip())
+        if not match:
+            raise ValueError(f"Invalid context spec '{spec}' (expected '<name> <width>x<height> [locale]')")
+        name, width, height, locale = match.groups()
+        return cls(name, int(width), int(height), locale)
+
+    def context_options(self) -> dict:
+        """Keyword arguments for browser.new_context()"""
+        options = {"viewport": {"width": self.width, "height": self.height}}
+        if self.locale:
+            options["locale"] = self.locale
+        return options
+
+    def __str__(self):
+        return f"{self.name} {self.width}x{self.height}" + (f" {self.locale}" if self.locale else "")
+
+
+class ContextRun:
+    """Outcome of the flow in one context: data or error, and step timings"""
+
+    def __init__(self, spec: ContextSpec):
+        self.spec = spec
+        self.steps = {}
+        self.data = None
+        self.error = None
+        self.elapsed_ms = 0.0
+
+    @contextmanager
+    def step(self, name: str):
+        """Time a step of the flow (the block may await)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "context": str(self.spec),
+            "elapsed_ms": self.elapsed_ms,
+            "steps": self.steps,
+            "error": self.error,
+            "data": self.data
+        }
+
+
+async def run_in_context(new_context, spec: ContextSpec, flow) -> ContextRun:
+    """
+    Open a context for spec and run `await flow(context, run)`
+    A failing context is recorded, it does not stop the other contexts
+    """
+    run = ContextRun(spec)
+    start = time.perf_counter()
+    try:
+        with run.step("context"):
+            context = await new_context(**spec.context_options())
+        run.data = await flow(context, run)
+    except Exception as e:
+        run.error = str(e)
+    run.elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    return run
+
+
+async def fan_out(new_context, specs, flow, limit: int = None) -> list:
+    """Run flow in one context per spec concurrently; results in spec order"""
+    return await gather_limited([run_in_context(new_context, spec, flow) for spec in specs], limit)
+
+
+def find_differences(runs) -> list:
+    """
+    Fields whose values are not the same in every successful context
+    data is a list of records (dicts); returns [{'index', 'field', 'values': {context: value}}]
+    """
+    data = {run.spec.name: run.data or [] for run in runs if run.error is None}
+    differences = []
+    if len(data) < 2:
+        return differences
+    for index in range(max(map(len, data.values()))):
+        records = {name: rows[index] if index < len(rows) else {} for name, rows in data.items()}
+        fields = sorted({field for record in records.values() for field in record})
+        for field in fields:
+            values = {name: record.get(field) for name, record in records.items()}
+            if len(set(map(repr, values.values()))) > 1:
+                differences.append({"index": index, "field": field, "values": values})
+    return differences
+
+
+def build_report(runs) -> dict:
+    """Merged report: every context's timings and data, plus the differences"""
+    differences = find_differences(runs)
+    return {
+        "contexts": [run.to_dict() for run in runs],
+        "failed": [str(run.spec) for run in runs if run.error is not None],
+        "differences": differences,
+        "consistent": not differences
+    }
+
+
+def format_report(report: dict) -> str:
+    """Per-context timing table followed by the differences"""
+    contexts = report["contexts"]
+    step_names = list(dict.fromkeys(step for context in contexts for step in context["steps"]))
+    lines = [f"   🔀 Fan-out: {len(contexts)} contexts, {len(report['failed'])} failed"]
+    header = f"      {'context':<28}{'total':>10}" + "".join(f"{name:>12}" for name in step_names)
+    lines.append(header)
+    for context in contexts:
+        row = f"      {context['context'][:27]:<28}{context['elapsed_ms']:>8.0f}ms"
+        row += "".join(f"{context['steps'][name]:>10.0f}ms" if name in context["steps"] else f"{'-':>12}"
+                       for name in step_names)
+        if context["error"]:
+            row += f"  ❌ {context['error'][:60]}"
+        lines.append(row)
+    if report["consistent"]:
+        lines.append("   ✅ Same data in every context")
+    else:
+        lines.append(f"   ⚠️  {len(report['differences'])} fields differ between contexts:")
+        for difference in report["differences"]:
+            lines.append(f"      [{difference['index'] + 1}] {difference['field']}:")
+            for name, value in difference["values"].items():
+                lines.append(f"         {name:<12} {repr(value)[:70]}")
+    return "\n".join(lines)
@@ -0,0 +1,211 @@
+"""
+Content-addressed on-disk cache for downloaded assets
+
+Each URL maps to a blob named by the SHA-256 of its content, plus the
+ETag / Last-Modified validators from the response. Cached URLs are
+revalidated with If-None-Match / If-Modified-Since, so an unchanged
+image costs one 304. The cache is bounded in size with LRU eviction.
+Fetches only mark the index dirty; it is written by save(), once per
+download batch and at the end of the session.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+from utils.network_archive import get_active_archive, http_get
+from utils.parallel import atomic_write_json, temp_path
+
+
+DEFAULT_CACHE_DIR = "data/.cache/images"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+class ImageCache:
+    """
+    Layout:
+        <path>/index.json       url -> digest, etag, last_modified, size, last_used
+        <path>/blobs/<sha256>   content, stored once
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.path, "index.json")
+
+    @property
+    def blobs_dir(self):
+        return os.path.join(self.path, "blobs")
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.blobs_dir, digest)
+
+    def load(self):
+        """Load the index, dropping entries whose blob is gone"""
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    entries = json.load(f)
+            except ValueError:
+                entries = {}
+            self.entries = {
+                url: entry for url, entry in entries.items()
+                if os.path.exists(self.blob_path(entry["digest"]))
+            }
+
+    def save(self):
+        """
+        Write the index atomically if it changed, keeping entries other
+        processes (e.g. parallel xdist workers) added since we loaded it
+        """
+        with self._lock:
+            if not self.dirty:
+                return
+            entries = {}
+            if os.path.exists(self.index_path):
+                try:
+                    with open(self.index_path, encoding="utf-8") as f:
+                        entries = json.load(f)
+                except ValueError:
+                    pass
+            entries.update(self.entries)
+            entries = {url: e for url, e in entries.items() if os.path.exists(self.blob_path(e["digest"]))}
+            atomic_write_json(self.index_path, entries, sort_keys=True)
+            self.dirty = False
+
+    @property
+    def size(self) -> int:
+        """Bytes held by distinct blobs"""
+        return sum({e["digest"]: e["size"] for e in self.entries.values()}.values())
+
+    def stats(self) -> dict:
+        """
+        hits: served from the cache; misses: downloaded in full
+        revalidations: the hits confirmed by a 304 from the server
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.size
+        }
+
+    def fetch(self, url: str, dest: str, session=None, timeout: int = 10, chunk_size: int = 64 * 1024) -> dict:
+        """
+        Fetch url into dest through the cache
+        Returns {'bytes': transferred bytes, 'cache': 'hit' | 'miss'}; raises on HTTP errors
+        """
+        with self._lock:
+            entry = self.entries.get(url)
+
+        headers = {}
+        archive = get_active_archive()
+        # Conditional requests only make sense against the live site
+        if entry and (archive is None or archive.mode == "live"):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = http_get(url, timeout=timeout, session=session, headers=headers, stream=True)
+        with response:
+            revalidated = response.status_code == 304 and entry is not None
+            if not revalidated:
+                response.raise_for_status()
+                digest, size = self._store_blob(response, chunk_size)
+
+        if revalidated:
+            if os.path.exists(self.blob_path(entry["digest"])):
+                with self._lock:
+                    self.hits += 1
+                    self.revalidations += 1
+                    entry["last_used"] = time.time()
+                    self.dirty = True
+                self._materialize(entry["digest"], dest)
+                return {"bytes": 0, "cache": "hit"}
+            # The blob was evicted meanwhile (e.g. by another worker): forget it and fetch unconditionally
+            with self._lock:
+                if self.entries.get(url) is entry:
+                    del self.entries[url]
+                    self.dirty = True
+            return self.fetch(url, dest, session=session, timeout=timeout, chunk_size=chunk_size)
+
+        with self._lock:
+            self.misses += 1
+            self.entries[url] = {
+                "digest": digest,
+                "size": size,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "last_used": time.time()
+            }
+            self._evict(keep=url)
+            self.dirty = True
+        self._materialize(digest, dest)
+        return {"bytes": size, "cache": "miss"}
+
+    def _store_blob(self, response, chunk_size: int):
+        """Stream a response body into the blob store, hashing as it goes"""
+        os.makedirs(self.blobs_dir, exist_ok=True)
+        tmp_path = temp_path(os.path.join(self.blobs_dir, "incoming"))
+        sha = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    sha.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            digest = sha.hexdigest()
+            os.replace(tmp_path, self.blob_path(digest))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return digest, size
+
+    def _materialize(self, digest: str, dest: str):
+        """Copy a blob to dest unless dest already holds the same content"""
+        blob = self.blob_path(digest)
+        if os.path.exists(dest) and os.path.getsize(dest) == os.path.getsize(blob):
+            sha = hashlib.sha256()
+            with open(dest, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+            if sha.hexdigest() == digest:
+                return
+        directory = os.path.dirname(dest)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = temp_path(dest)
+        shutil.copyfile(blob, tmp_path)
+        os.replace(tmp_path, dest)
+
+    def _evict(self, keep: str = None):
+        """Drop least recently used entries (except keep) until the cache fits in max_bytes"""
+        while self.size > self.max_bytes:
+            candidates = [u for u in self.entries if u != keep]
+            if not candidates:
+                break
+            url = min(candidates, key=lambda u: self.entries[u]["last_used"])
+            digest = self.entries.pop(url)["digest"]
+            self.evictions += 1
+            if not any(e["digest"] == digest for e in self.entries.values()):
+                try:
+                    os.remove(self.blob_path(digest))
+                except OSError:
+                    pass
@@ -0,0 +1,86 @@
+"""
+Compact HTML rendering of captured test logs for the pytest-html report
+
+Lines are classified with one regex scan for all keywords; the matched
+keywords map to their rule through a table built once from the rules
+(same priority as the original emoji/keyword colour coding). Content is
+HTML-escaped and lines carry short CSS classes from one shared
+stylesheet instead of inline styles.
+Long logs are collapsed: their lines sit in a <template> that is only
+inserted into the page when the section is expanded.
+"""
+import html
+import re
+
+
+# (css class, keywords) in priority order
+LOG_RULES = [
+    ("ok", ("✅", "PASSED", "✓", "Successfully")),
+    ("err", ("❌", "FAILED", "ERROR", "Error")),
+    ("warn", ("⚠️", "WARNING", "Could not")),
+    ("step", ("→", "Step")),
+    ("retry", ("🔄", "ATTEMPT", "Retry")),
+    ("info", ("ℹ️", "INFO")),
+    ("data", ("Extracted", "Downloaded", "Saved")),
+    ("search", ("Looking for", "Searching", "Checking")),
+]
+
+# Every keyword in one compiled alternation (longest first, so no keyword is cut
+# short by another), mapped to its rule's priority and CSS class at import
+KEYWORD_PRIORITY = {keyword: priority for priority, (_, keywords) in enumerate(LOG_RULES) for keyword in keywords}
+RULE_CLASSES = tuple(f' class="l-{css_class}"' for css_class, _ in LOG_RULES)
+KEYWORDS = re.compile("|".join(re.escape(keyword) for keyword in sorted(KEYWORD_PRIORITY, key=len, reverse=True)))
+
+# Logs longer than this are collapsed and rendered on demand
+COLLAPSE_THRESHOLD = 200
+
+LOG_STYLESHEET = """<style>
+.trg-log{background:#1e1e1e;padding:15px;border-radius:8px;border:2px solid #444;font-family:'Courier New',monospace}
+.trg-log>summary{color:#61dafb;font-weight:bold;cursor:pointer}
+.trg-log-body{white-space:pre-wrap;max-height:600px;overflow-y:auto;margin-top:8px;color:#d4d4d4;line-height:1.5}
+.trg-log-body>div{margin:3px 0}
+.l-ok{color:#28a745}.l-err{color:#dc3545}.l-warn{color:#ffc107}.l-step{color:#007bff}
+.l-retry{color:#6f42c1}.l-info{color:#17a2b8}.l-data{color:#20c997}.l-search{color:#fd7e14}
+</style>"""
+
+# Moves the template's lines into the <details> the first time it is opened
+EXPAND_ON_TOGGLE = "var t=this.querySelector('template');if(this.open&&t){this.appendChild(t.content);t.remove();}"
+
+
+def render_log_lines(logs: str) -> tuple:
+    """
+    Render non-empty log lines as classed, escaped <div> elements
+    Returns (html, number of rendered lines)
+    """
+    find_keywords = KEYWORDS.findall
+    priority = KEYWORD_PRIORITY.__getitem__
+    classes = RULE_CLASSES
+    parts = []
+    append = parts.append
+    # Escaping creates no keyword, so the whole log is escaped once before classifying
+    for line in html.escape(logs, quote=False).split("\n"):
+        if not line or line.isspace():
+            continue
+        # One scan of the line finds every keyword; the highest-priority rule among them wins
+        keywords = find_keywords(line)
+        if keywords:
+            append(f'<div{classes[min(map(priority, keywords))]}>{line}</div>')
+        else:
+            append(f"<div>{line}</div>")
+    return "".join(parts), len(parts)
+
+
+def format_logs_for_html(logs: str, collapse_threshold: int = COLLAPSE_THRESHOLD) -> str:
+    """
+    Format console logs into HTML with color coding for better readability
+    Requires LOG_STYLESHEET to be present once in the report
+    """
+    body, line_count = render_log_lines(logs)
+    title = f"📋 Test Execution Logs ({line_count} lines)"
+
+    if line_count <= collapse_threshold:
+        return (f'<details class="trg-log" open><summary>{title}</summary>'
+                f'<div class="trg-log-body">{body}</div></details>')
+
+    return (f'<details class="trg-log" ontoggle="{EXPAND_ON_TOGGLE}"><summary>{title} - click to expand</summary>'
+            f'<template><div class="trg-log-body">{body}</div></template></details>')
@@ -0,0 +1,293 @@
+"""
+Record/replay archive for HTTP traffic
+
+In record mode every browser request (and every image fetched with
+requests) is stored on disk. In replay mode the same archive is served
+back through context.route, so the suite can run offline.
+"""
+import glob
+import hashlib
+import json
+import os
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.parallel import atomic_write_bytes, atomic_write_json, temp_path, worker_id
+
+
+MODES = ("live", "record", "replay")
+
+# Bodies are stored decoded, so these headers would no longer be true
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+_active_archive = None
+
+
+def decoded_headers(headers: dict) -> dict:
+    """Response headers that are still true for the decoded body"""
+    return {k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS}
+
+
+class ArchiveMiss(Exception):
+    """Raised in replay mode when a URL is not in the archive"""
+
+
+class NetworkArchive:
+    """
+    Directory based archive of HTTP responses
+
+    Layout:
+        <path>/index.json      "METHOD URL" -> status, headers, body file
+        <path>/bodies/<sha1>   response bodies, stored once per content
+
+    Under pytest-xdist each worker records into index.<worker>.json;
+    merge_worker_indexes folds them into index.json after the run.
+    """
+
+    def __init__(self, path: str, mode: str = "live", latency_ms: float = 0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown network mode '{mode}', expected one of {MODES}")
+        self.path = path
+        self.mode = mode
+        # Artificial delay per replayed response, to simulate a slow network
+        self.latency_ms = latency_ms
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        if mode == "replay":
+            self.load()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.path, "index.json")
+
+    @property
+    def bodies_dir(self):
+        return os.path.join(self.path, "bodies")
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        return f"{method.upper()} {url}"
+
+    def load(self):
+        """Load the archive index, including per-worker indexes not merged yet"""
+        indexes = [i for i in [self.index_path] + sorted(glob.glob(os.path.join(self.path, "index.*.json")))
+                   if os.path.exists(i)]
+        if not indexes:
+            raise FileNotFoundError(
+                f"No network archive at {self.path} - run once with --network-mode=record"
+            )
+        for index in indexes:
+            with open(index, encoding="utf-8") as f:
+                self.entries.update(json.load(f))
+
+    def save(self):
+        """Write the archive index to disk (a per-worker index under xdist)"""
+        worker = worker_id()
+        path = self.index_path if worker is None else os.path.join(self.path, f"index.{worker}.json")
+        atomic_write_json(path, self.entries, sort_keys=True)
+
+    def store(self, method: str, url: str, status: int, headers: dict, body: bytes):
+        """Add one response to the archive"""
+        os.makedirs(self.bodies_dir, exist_ok=True)
+        digest = hashlib.sha1(body).hexdigest()
+        body_path = os.path.join(self.bodies_dir, digest)
+        if not os.path.exists(body_path):
+            atomic_write_bytes(body_path, body)
+        self._add(method, url, status, headers, digest)
+
+    def store_stream(self, method: str, url: str, status: int, headers: dict, chunks):
+        """
+        Pass body chunks through while writing them to the archive
+        The response is added once the body has been read to the end
+        """
+        os.makedirs(self.bodies_dir, exist_ok=True)
+        tmp_path = temp_path(os.path.join(self.bodies_dir, "incoming"))
+        sha = hashlib.sha1()
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in chunks:
+                    sha.update(chunk)
+                    f.write(chunk)
+                    yield chunk
+            digest = sha.hexdigest()
+            os.replace(tmp_path, os.path.join(self.bodies_dir, digest))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._add(method, url, status, headers, digest)
+
+    def _add(self, method: str, url: str, status: int, headers: dict, digest: str):
+        self.entries[self.key(method, url)] = {
+            "status": status,
+            "headers": decoded_headers(headers),
+            "body": digest
+        }
+
+    def lookup(self, method: str, url: str, count_miss: bool = True):
+        """
+        Return (status, headers, body) for a recorded request or raise ArchiveMiss
+        count_miss=False for lookups with a fallback, which are not missing requests
+        """
+        entry = self.entries.get(self.key(method, url))
+        if entry is None:
+            if count_miss:
+                self.misses += 1
+            raise ArchiveMiss(f"Not in network archive: {method.upper()} {url}")
+        self.hits += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        with open(os.path.join(self.bodies_dir, entry["body"]), "rb") as f:
+            body = f.read()
+        return entry["status"], entry["headers"], body
+
+    def attach(self, context):
+        """Install the record or replay route handler on a BrowserContext"""
+        if self.mode == "record":
+            context.route("**/*", self._record_route)
+        elif self.mode == "replay":
+            context.route("**/*", self._replay_route)
+
+    async def attach_async(self, context):
+        """attach() for a playwright.async_api BrowserContext"""
+        if self.mode == "record":
+            await context.route("**/*", self._record_route_async)
+        elif self.mode == "replay":
+            await context.route("**/*", self._replay_route_async)
+
+    def _record_route(self, route):
+        request = route.request
+        try:
+            # Keep redirects as separate entries so replay follows the same chain
+            response = route.fetch(max_redirects=0)
+        except Exception:
+            route.abort()
+            return
+        body = response.body()
+        self.store(request.method, request.url, response.status, response.headers, body)
+        route.fulfill(status=response.status, headers=decoded_headers(response.headers), body=body)
+
+    def _replay_route(self, route):
+        request = route.request
+        try:
+            status, headers, body = self.lookup(request.method, request.url)
+        except ArchiveMiss:
+            route.abort("internetdisconnected")
+            return
+        route.fulfill(status=status, headers=headers, body=body)
+
+    async def _record_route_async(self, route):
+        request = route.request
+        try:
+            response = await route.fetch(max_redirects=0)
+        except Exception:
+            await route.abort()
+            return
+        body = await response.body()
+        self.store(request.method, request.url, response.status, response.headers, body)
+        await route.fulfill(status=response.status, headers=decoded_headers(response.headers), body=body)
+
+    async def _replay_route_async(self, route):
+        request = route.request
+        try:
+            status, headers, body = self.lookup(request.method, request.url)
+        except ArchiveMiss:
+            await route.abort("internetdisconnected")
+            return
+        await route.fulfill(status=status, headers=headers, body=body)
+
+
+def merge_worker_indexes(path: str) -> int:
+    """Fold index.<worker>.json files into index.json; returns the number of entries"""
+    index_path = os.path.join(path, "index.json")
+    worker_indexes = sorted(glob.glob(os.path.join(path, "index.*.json")))
+    if not worker_indexes:
+        return 0
+
+    entries = {}
+    for index in [index_path] + worker_indexes:
+        if os.path.exists(index):
+            with open(index, encoding="utf-8") as f:
+                entries.update(json.load(f))
+    atomic_write_json(index_path, entries, sort_keys=True)
+    for index in worker_indexes:
+        os.remove(index)
+    return len(entries)
+
+
+def set_active_archive(archive):
+    """Make an archive visible to code that fetches URLs outside the browser"""
+    global _active_archive
+    _active_archive = archive
+
+
+def get_active_archive():
+    return _active_archive
+
+
+def is_replaying() -> bool:
+    """Whether fetches outside the browser are served from an archive (no network access)"""
+    return _active_archive is not None and _active_archive.mode == "replay"
+
+
+def http_get(url: str, timeout: int = 10, session=None, **kwargs):
+    """
+    requests.get that honours the active archive
+
+    live   -> plain request
+    record -> plain request, response stored in the archive (with stream=True
+              once the caller has read the body through iter_content)
+    replay -> response served from the archive, no network access
+    """
+    archive = _active_archive
+    if archive is not None and archive.mode == "replay":
+        status, headers, body = archive.lookup("GET", url)
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response._content_consumed = True
+        response.url = url
+        return response
+
+    response = (session or requests).get(url, timeout=timeout, **kwargs)
+    if archive is not None and archive.mode == "record":
+        if kwargs.get("stream"):
+            tee_to_archive(archive, response, "GET", url)
+        else:
+            archive.store("GET", url, response.status_code, dict(response.headers), response.content)
+    return response
+
+
+def tee_to_archive(archive, response, method: str, url: str):
+    """Make response.iter_content copy the body into archive while the caller streams it"""
+    iter_content = response.iter_content
+
+    def iter_and_record(chunk_size=1, decode_unicode=False):
+        return archive.store_stream(method, url, response.status_code, dict(response.headers),
+                                    iter_content(chunk_size, decode_unicode))
+
+    response.iter_content = iter_and_record
+
+
+def http_head(url: str, timeout: int = 10, session=None):
+    """
+    Content headers of url without its body, honouring the active archive
+    In replay mode the headers come from the archived HEAD, or from the
+    archived GET with Content-Length set to its body size.
+    """
+    archive = _active_archive
+    if archive is not None and archive.mode == "replay":
+        try:
+            status, headers, _ = archive.lookup("HEAD", url, count_miss=False)
+        except ArchiveMiss:
+            status, headers, body = archive.lookup("GET", url)
+            headers = dict(headers, **{"Content-Length": str(len(body))})
+        return status, CaseInsensitiveDict(headers)
+
+    response = (session or requests).head(url, timeout=timeout, allow_redirects=True)
+    if archive is not None and archive.mode == "record":
+        archive.store("HEAD", url, response.status_code, dict(response.headers), b"")
+    return response.status_code, response.headers
@@ -0,0 +1,196 @@
+"""
+Page state shared by the tests of a module
+
+Reaching a section like Core Values takes a full navigation and several
+scrolls. SharedPage does that once and takes a PageSnapshot: the URL,
+the scroll position and a sentinel stored in the document. Before every
+test the page is compared with the snapshot and, when a test left it
+dirty, restored: popup tabs closed, overlays dismissed, URL hash and
+scroll position reset. Only when that cannot bring the page back (it
+was reloaded, navigated away or closed) is the navigation repeated.
+"""
+import uuid
+
+
+SNAPSHOT_JS = """
+(token) => {
+    window.__trgSnapshot = token;
+    return {url: location.href, x: window.scrollX, y: window.scrollY};
+}
+"""
+
+STATE_JS = """
+() => ({url: location.href, x: window.scrollX, y: window.scrollY, token: window.__trgSnapshot || null})
+"""
+
+RESTORE_JS = """
+(snapshot) => {
+    if (location.href !== snapshot.url) {
+        history.replaceState(history.state, "", snapshot.url);
+    }
+    window.scrollTo({left: snapshot.x, top: snapshot.y, behavior: "instant"});
+}
+"""
+
+# Scroll offsets this close to the snapshot count as restored (sticky headers shift a few px)
+SCROLL_TOLERANCE_PX = 4
+
+# Kinds of difference between a page and its snapshot
+CLOSED = "closed"
+POPUPS = "popups"
+RELOADED = "reloaded"
+NAVIGATED = "navigated"
+HASH_CHANGED = "hash_changed"
+SCROLLED = "scrolled"
+UNREADABLE = "unreadable"
+RESTORE_FAILED = "restore_failed"
+
+# Kinds SharedPage.reset() undoes in place; any other kind means navigating again
+RESTORABLE = frozenset({POPUPS, HASH_CHANGED, SCROLLED})
+
+
+def without_hash(url: str) -> str:
+    return url.split("#", 1)[0]
+
+
+class PageProblem:
+    """One way a page differs from its snapshot: kind decides, message is for the log"""
+
+    def __init__(self, kind: str, message: str):
+        self.kind = kind
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"PageProblem({self.kind!r}, {self.message!r})"
+
+
+class PageSnapshot:
+    """Where a shared page was left after its navigation"""
+
+    def __init__(self, url: str, scroll_x: float, scroll_y: float, token: str):
+        self.url = url
+        self.scroll_x = scroll_x
+        self.scroll_y = scroll_y
+        self.token = token
+
+    @classmethod
+    def take(cls, page) -> "PageSnapshot":
+        """Record the page's state and mark its document with a new sentinel"""
+        token = uuid.uuid4().hex
+        state = page.evaluate(SNAPSHOT_JS, token)
+        return cls(state["url"], state["x"], state["y"], token)
+
+    def differences(self, page) -> list:
+        """
+        PageProblems that keep the page from matching the snapshot (empty when it does)
+        A page that cannot be read (mid-navigation, destroyed context, crash) is UNREADABLE
+        """
+        try:
+            if page.is_closed():
+                return [PageProblem(CLOSED, "page closed")]
+            popups = [other for other in page.context.pages if other is not page]
+            state = page.evaluate(STATE_JS)
+        except Exception as e:
+            return [PageProblem(UNREADABLE, f"state not readable: {str(e)[:60]}")]
+        problems = []
+        if popups:
+            problems.append(PageProblem(POPUPS, f"{len(popups)} popup pages open"))
+        if state["token"] != self.token:
+            problems.append(PageProblem(RELOADED, "document reloaded or replaced"))
+        if without_hash(state["url"]) != without_hash(self.url):
+            problems.append(PageProblem(NAVIGATED, f"navigated to {state['url']}"))
+        elif state["url"] != self.url:
+            problems.append(PageProblem(HASH_CHANGED, f"URL hash changed to {state['url']}"))
+        if (abs(state["x"] - self.scroll_x) > SCROLL_TOLERANCE_PX
+                or abs(state["y"] - self.scroll_y) > SCROLL_TOLERANCE_PX):
+            problems.append(PageProblem(SCROLLED, f"scrolled to {state['x']:.0f},{state['y']:.0f}"))
+        return problems
+
+    def restorable(self, problems) -> bool:
+        """Whether the problems can be undone in place (otherwise the page is navigated again)"""
+        return all(problem.kind in RESTORABLE for problem in problems)
+
+    def to_dict(self) -> dict:
+        return {"url": self.url, "x": self.scroll_x, "y": self.scroll_y}
+
+
+class SharedPage:
+    """
+    A page object kept in one state across tests
+
+    open_page: creates the page object on a new page of the shared context
+    prepare: brings the page object to the state the tests start from
+    """
+
+    def __init__(self, open_page, prepare):
+        self.open_page = open_page
+        self.prepare = prepare
+        self.page_object = None
+        self.snapshot = None
+        self.counts = {"navigations": 0, "clean": 0, "restored": 0, "renavigated": 0}
+
+    @property
+    def page(self):
+        return self.page_object.page
+
+    def navigate(self, fresh: bool = False):
+        """
+        Run the full preparation and snapshot it, on a new page when the old one
+        was closed or fresh is set (a page whose state could not be read)
+        """
+        if fresh and self.page_object is not None:
+            try:
+                self.page.close()
+            except Exception:
+                pass
+        if self.page_object is None or self.page.is_closed():
+            self.page_object = self.open_page()
+        self.prepare(self.page_object)
+        self.snapshot = PageSnapshot.take(self.page)
+        self.counts["navigations"] += 1
+
+    def reset(self):
+        """Undo what a test may have left behind, without navigating"""
+        for other in self.page.context.pages:
+            if other is not self.page:
+                other.close()
+        # Wix lightboxes and menus close on Escape
+        self.page.keyboard.press("Escape")
+        self.page.evaluate(RESTORE_JS, self.snapshot.to_dict())
+        self.page_object.waits.for_scroll_settled(timeout=1000, required=False)
+
+    def restore(self) -> str:
+        """
+        Bring the page back to the snapshot before a test
+        Returns "clean", "restored" or "renavigated"
+        """
+        problems = self.snapshot.differences(self.page)
+        if not problems:
+            self.counts["clean"] += 1
+            return "clean"
+
+        print(f"   → Shared page dirty: {', '.join(map(str, problems))}")
+        if self.snapshot.restorable(problems):
+            try:
+                self.reset()
+                problems = self.snapshot.differences(self.page)
+            except Exception as e:
+                problems = [PageProblem(RESTORE_FAILED, f"restore failed: {str(e)[:60]}")]
+            if not problems:
+                self.counts["restored"] += 1
+                print("   ✅ Shared page restored")
+                return "restored"
+
+        print(f"   ⚠️  Could not restore ({', '.join(map(str, problems))}), navigating again")
+        self.navigate(fresh=any(problem.kind == UNREADABLE for problem in problems))
+        self.counts["renavigated"] += 1
+        return "renavigated"
+
+    def summary(self) -> str:
+        counts = self.counts
+        uses = counts["clean"] + counts["restored"] + counts["renavigated"]
+        return (f"   ♻️  Shared page: {uses} tests, {counts['navigations']} navigations "
+                f"({counts['clean']} clean, {counts['restored']} restored, {counts['renavigated']} renavigated)")
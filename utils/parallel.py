@@ -0,0 +1,96 @@
+"""
+Helpers for running the suite in parallel with pytest-xdist
+
+- atomic file writes (temp file + rename), so readers never see half a file
+- per-worker output directories, so workers never write the same path
+- a merge step that combines worker outputs after the run
+"""
+import json
+import os
+import shutil
+import threading
+
+
+WORKERS_DIR = ".workers"
+
+
+def worker_id():
+    """xdist worker id ('gw0', 'gw1', ...) or None when not running under xdist"""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def is_xdist_controller(config) -> bool:
+    """True in the main process of an xdist run (or in a plain run)"""
+    return not hasattr(config, "workerinput")
+
+
+def is_distributing(config) -> bool:
+    """True in the main process of an xdist run that starts workers (-n N, N > 0)"""
+    return is_xdist_controller(config) and config.getoption("dist", default="no") != "no"
+
+
+def worker_output_dir(base_dir: str) -> str:
+    """base_dir in a plain run, base_dir/.workers/<worker> under xdist"""
+    worker = worker_id()
+    if worker is None:
+        return base_dir
+    return os.path.join(base_dir, WORKERS_DIR, worker)
+
+
+def temp_path(path: str) -> str:
+    """Temp file next to path, unique per process and thread"""
+    return f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write bytes to path via a temp file and an atomic rename"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = temp_path(path)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def atomic_write_json(path: str, data, **dump_kwargs):
+    """Serialize data as JSON and write it atomically"""
+    dump_kwargs.setdefault("indent", 2)
+    atomic_write_bytes(path, json.dumps(data, **dump_kwargs).encode("utf-8"))
+
+
+def merge_worker_outputs(base_dir: str) -> list:
+    """
+    Move every worker's files from base_dir/.workers/<worker>/ into base_dir
+
+    When several workers produced the same relative path, the most
+    recently written file wins. Returns the merged relative paths.
+    """
+    workers_root = os.path.join(base_dir, WORKERS_DIR)
+    if not os.path.isdir(workers_root):
+        return []
+
+    newest = {}
+    for worker in sorted(os.listdir(workers_root)):
+        worker_dir = os.path.join(workers_root, worker)
+        for root, _, files in os.walk(worker_dir):
+            for name in files:
+                source = os.path.join(root, name)
+                relative = os.path.relpath(source, worker_dir)
+                mtime = os.path.getmtime(source)
+                if relative not in newest or mtime > newest[relative][0]:
+                    newest[relative] = (mtime, source)
+
+    for relative, (_, source) in newest.items():
+        target = os.path.join(base_dir, relative)
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        tmp = temp_path(target)
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
+
+    shutil.rmtree(workers_root, ignore_errors=True)
+    return sorted(newest)
@@ -0,0 +1,109 @@
+"""
+Readiness contracts for page objects
+
+A page is "ready" when its contract is satisfied: a load state
+(DOMContentLoaded by default), a set of visible selectors and no layout
+shift for a quiet period. This replaces wait_until="networkidle", which
+waits for every lazy widget, beacon and long poll on the Wix pages.
+
+NetworkActivity keeps the browser timings of a page's requests, so the
+moment networkidle would have fired can be computed afterwards and
+compared with the moment the contract was satisfied.
+"""
+import time
+
+
+# Playwright's networkidle: no request in flight for 500 ms
+NETWORK_IDLE_MS = 500
+
+
+def now_ms() -> float:
+    """Wall clock in epoch milliseconds (same clock as request timings)"""
+    return time.time() * 1000
+
+
+class ReadinessContract:
+
+    def __init__(self, name: str, load_state: str = "domcontentloaded", selectors=(),
+                 stable_ms: int = 300, timeout: int = 15000):
+        self.name = name
+        self.load_state = load_state
+        self.selectors = tuple(selectors)
+        self.stable_ms = stable_ms
+        self.timeout = timeout
+
+    def wait(self, waits) -> bool:
+        """
+        Wait for every condition after the load state, sharing one deadline
+        Returns False (instead of raising) when a condition is not met in time,
+        so the page object's own waits still get their chance.
+        """
+        deadline = time.perf_counter() + self.timeout / 1000
+        remaining = lambda: max(1, int((deadline - time.perf_counter()) * 1000))
+
+        met = True
+        for selector in self.selectors:
+            met = waits.for_element(selector, state="visible", timeout=remaining(), required=False) and met
+        if self.stable_ms:
+            met = waits.for_layout_stable(self.stable_ms, timeout=remaining(), required=False) and met
+        return met
+
+    async def wait_async(self, waits) -> bool:
+        """wait() for an AsyncWaitEngine"""
+        deadline = time.perf_counter() + self.timeout / 1000
+        remaining = lambda: max(1, int((deadline - time.perf_counter()) * 1000))
+
+        met = True
+        for selector in self.selectors:
+            met = await waits.for_element(selector, state="visible", timeout=remaining(), required=False) and met
+        if self.stable_ms:
+            met = await waits.for_layout_stable(self.stable_ms, timeout=remaining(), required=False) and met
+        return met
+
+    def __str__(self):
+        parts = [self.load_state] + [f"'{s}' visible" for s in self.selectors]
+        if self.stable_ms:
+            parts.append(f"no layout shift for {self.stable_ms} ms")
+        return f"{self.name}: " + " + ".join(parts)
+
+
+class NetworkActivity:
+    """Start and end times (epoch ms) of the requests of one page"""
+
+    def __init__(self, page=None):
+        self.intervals = []
+        self.in_flight = {}
+        if page is not None:
+            page.on("request", self._started)
+            page.on("requestfinished", self._finished)
+            page.on("requestfailed", self._finished)
+
+    def _started(self, request):
+        self.in_flight[id(request)] = now_ms()
+
+    def _finished(self, request):
+        self.in_flight.pop(id(request), None)
+        timing = request.timing
+        start = timing.get("startTime", -1)
+        if start < 0:
+            return
+        end = timing.get("responseEnd", -1)
+        self.intervals.append((start, start + end if end >= 0 else now_ms()))
+
+    def idle_at(self, since: float, until: float = None):
+        """
+        When networkidle fired after `since`: the first moment no request had
+        been in flight for NETWORK_IDLE_MS. None if that had not happened by `until`.
+        """
+        until = now_ms() if until is None else until
+        busy_end = since
+        for start, end in sorted(i for i in self.intervals if i[1] >= since and i[0] <= until):
+            if start > busy_end + NETWORK_IDLE_MS:
+                break
+            busy_end = max(busy_end, end)
+        else:
+            # Still waiting for a request that started inside the window
+            if any(started <= until for started in self.in_flight.values()):
+                return None
+        idle = busy_end + NETWORK_IDLE_MS
+        return idle if idle <= until else None
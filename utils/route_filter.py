@@ -0,0 +1,174 @@
+"""
+Request filter that keeps heavy and third-party resources out of page loads
+
+Installed on each BrowserContext (so popups are covered too). Requests
+for blocked resource types or domains never reach the network: images
+are stubbed with a 1x1 PNG (layout and src attributes stay intact),
+everything else is aborted. Other requests fall through to the next
+route handler (the network archive) or to the network.
+
+Blocked bytes are estimated from a table of resource sizes learned from
+responses that were let through (e.g. a run with --no-route-filter).
+"""
+import base64
+import fnmatch
+import json
+import os
+from collections import Counter
+from urllib.parse import urlsplit
+
+from utils.parallel import atomic_write_json
+
+
+DEFAULT_BLOCK_TYPES = ("media", "font", "image")
+
+# Analytics, tag managers and tracking pixels seen on the TRG (Wix) pages
+DEFAULT_BLOCK_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "px.ads.linkedin.com",
+    "frog.wix.com",
+)
+
+# Never blocked: the Wix media host serving the core value images the tests read and download
+DEFAULT_ALLOW = ("static.wixstatic.com/media",)
+
+DEFAULT_SIZES_PATH = "data/.cache/resource_sizes.json"
+
+# 1x1 transparent PNG served in place of blocked images
+STUB_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+class ResourceSizes:
+    """URL -> body size in bytes, persisted between runs"""
+
+    def __init__(self, path: str = DEFAULT_SIZES_PATH):
+        self.path = path
+        self.sizes = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.sizes = json.load(f)
+        self.dirty = False
+
+    def get(self, url: str):
+        return self.sizes.get(url)
+
+    def learn(self, response):
+        """Remember the size of a response that reports its Content-Length"""
+        length = response.headers.get("content-length")
+        if length and length.isdigit() and self.sizes.get(response.url) != int(length):
+            self.sizes[response.url] = int(length)
+            self.dirty = True
+
+    def save(self):
+        """Write learned sizes, merged with what other workers saved meanwhile"""
+        if not self.dirty:
+            return
+        merged = ResourceSizes(self.path).sizes
+        merged.update(self.sizes)
+        atomic_write_json(self.path, merged, sort_keys=True)
+        self.dirty = False
+
+
+class RouteFilter:
+
+    def __init__(self, block_types=DEFAULT_BLOCK_TYPES, block_domains=DEFAULT_BLOCK_DOMAINS,
+                 allow=(), sizes: ResourceSizes = None):
+        self.block_types = set(block_types)
+        self.block_domains = tuple(d.lower().lstrip(".") for d in block_domains)
+        self.allow = tuple(allow)
+        self.sizes = sizes
+        self.blocked = 0
+        self.allowed = 0
+        self.bytes_saved = 0
+        self.unknown_size = 0
+        self.by_reason = Counter()
+
+    def is_allowed(self, url: str) -> bool:
+        """Allowlist entries are URL substrings or glob patterns"""
+        return any(pattern in url or fnmatch.fnmatch(url, pattern) for pattern in self.allow)
+
+    def block_reason(self, url: str, resource_type: str):
+        """'domain:<domain>', 'type:<resource type>' or None when the request may pass"""
+        if self.is_allowed(url):
+            return None
+        host = (urlsplit(url).hostname or "").lower()
+        for domain in self.block_domains:
+            if host == domain or host.endswith("." + domain):
+                return f"domain:{domain}"
+        if resource_type in self.block_types:
+            return f"type:{resource_type}"
+        return None
+
+    def install(self, context):
+        """Route every request of the context through the filter"""
+        context.route("**/*", self._route)
+        if self.sizes is not None:
+            context.on("response", self.sizes.learn)
+
+    async def install_async(self, context):
+        """install() for a playwright.async_api BrowserContext"""
+        await context.route("**/*", self._route_async)
+        if self.sizes is not None:
+            context.on("response", self.sizes.learn)
+
+    def _decide(self, request) -> str:
+        """Count the request and return 'fallback', 'stub' or 'abort'"""
+        reason = self.block_reason(request.url, request.resource_type)
+        if reason is None:
+            self.allowed += 1
+            return "fallback"
+
+        self.blocked += 1
+        self.by_reason[reason] += 1
+        size = self.sizes.get(request.url) if self.sizes is not None else None
+        if size is None:
+            self.unknown_size += 1
+        else:
+            self.bytes_saved += size
+        return "stub" if request.resource_type == "image" else "abort"
+
+    def _route(self, route):
+        action = self._decide(route.request)
+        if action == "fallback":
+            route.fallback()
+        elif action == "stub":
+            route.fulfill(status=200, content_type="image/png", body=STUB_PNG)
+        else:
+            route.abort("blockedbyclient")
+
+    async def _route_async(self, route):
+        action = self._decide(route.request)
+        if action == "fallback":
+            await route.fallback()
+        elif action == "stub":
+            await route.fulfill(status=200, content_type="image/png", body=STUB_PNG)
+        else:
+            await route.abort("blockedbyclient")
+
+    def stats(self) -> dict:
+        return {
+            "blocked": self.blocked,
+            "allowed": self.allowed,
+            "bytes_saved": self.bytes_saved,
+            "unknown_size": self.unknown_size,
+            "by_reason": dict(self.by_reason.most_common())
+        }
+
+
+def format_filter_stats(stats: dict) -> str:
+    """One-line summary of a test's blocked requests"""
+    reasons = ", ".join(f"{reason} {count}" for reason, count in stats["by_reason"].items())
+    line = (f"Route filter: {stats['blocked']} of {stats['blocked'] + stats['allowed']} requests blocked, "
+            f"{stats['bytes_saved'] / 1024:.0f} KB saved")
+    if stats["unknown_size"]:
+        line += f" (+{stats['unknown_size']} of unknown size)"
+    if reasons:
+        line += f" [{reasons}]"
+    return line
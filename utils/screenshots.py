@@ -0,0 +1,87 @@
+"""
+Screenshot policy for test reports
+
+Decides when a screenshot is taken and how (viewport or full page,
+PNG or JPEG, quality, downscaling), and writes it as a separate file
+so the HTML report links to it instead of inlining base64 data.
+"""
+import base64
+import os
+import re
+
+
+MODES = ("off", "on-failure", "always")
+FORMATS = ("jpeg", "png")
+
+
+class ScreenshotPolicy:
+
+    def __init__(self, mode: str = "on-failure", full_page: bool = False, fmt: str = "jpeg",
+                 quality: int = 70, scale: float = 1.0, output_dir: str = "artifacts/screenshots"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown screenshot mode '{mode}', expected one of {MODES}")
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown screenshot format '{fmt}', expected one of {FORMATS}")
+        if not 0 < scale <= 1:
+            raise ValueError(f"Screenshot scale must be in (0, 1], got {scale}")
+        self.mode = mode
+        self.full_page = full_page
+        self.format = fmt
+        self.quality = quality
+        self.scale = scale
+        self.output_dir = output_dir
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "jpeg" else "png"
+
+    @property
+    def mime_type(self) -> str:
+        return f"image/{self.format}"
+
+    def should_capture(self, failed: bool) -> bool:
+        """Apply the capture mode to a test outcome"""
+        if self.mode == "always":
+            return True
+        return self.mode == "on-failure" and failed
+
+    def artifact_path(self, nodeid: str) -> str:
+        """File path for a test's screenshot, derived from its node id"""
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+        return os.path.join(self.output_dir, f"{safe_name}.{self.extension}")
+
+    def capture(self, page, nodeid: str) -> str:
+        """Take a screenshot according to the policy and return its file path"""
+        path = self.artifact_path(nodeid)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if self.scale < 1:
+            self._capture_scaled(page, path)
+        else:
+            options = {"path": path, "full_page": self.full_page, "type": self.format}
+            if self.format == "jpeg":
+                options["quality"] = self.quality
+            page.screenshot(**options)
+        return path
+
+    def _capture_scaled(self, page, path: str):
+        """Downscaled capture through the Chromium DevTools protocol (clip.scale)"""
+        cdp = page.context.new_cdp_session(page)
+        try:
+            if self.full_page:
+                size = cdp.send("Page.getLayoutMetrics")["cssContentSize"]
+                clip = {"x": 0, "y": 0, "width": size["width"], "height": size["height"]}
+            else:
+                clip = page.evaluate(
+                    "() => ({x: scrollX, y: scrollY, width: innerWidth, height: innerHeight})"
+                )
+            clip["scale"] = self.scale
+            params = {"format": self.format, "clip": clip, "captureBeyondViewport": self.full_page}
+            if self.format == "jpeg":
+                params["quality"] = self.quality
+            data = cdp.send("Page.captureScreenshot", params)["data"]
+        finally:
+            cdp.detach()
+
+        with open(path, "wb") as f:
+            f.write(base64.b64decode(data))
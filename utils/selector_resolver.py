@@ -0,0 +1,183 @@
+"""
+Adaptive resolution of fallback selector lists
+
+Instead of trying candidates one after another (each miss costing its
+full timeout), all candidates are raced in one query: a single wait on
+the union of the candidates returns as soon as any of them is visible.
+Which candidates matched is then counted instantly, and the winner is
+chosen by the stats persisted on disk (most recent success first).
+Candidates that never match are reported as dead weight.
+"""
+import json
+import os
+import threading
+import time
+from functools import reduce
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils.parallel import atomic_write_json
+from utils.tracer import span
+
+
+DEFAULT_STATS_PATH = "data/.cache/selector_stats.json"
+
+# A candidate with no hit after this many lookups is reported as dead weight
+DEAD_WEIGHT_MIN_LOOKUPS = 3
+
+_shared_resolver = None
+
+
+class SelectorNotFound(Exception):
+    """Raised when no candidate of a selector list became visible in time"""
+
+
+class SelectorStats:
+    """
+    Hits and misses per candidate, per named selector list
+
+    Layout: {name: {candidate: {"hits": n, "misses": n, "last_hit": epoch seconds last used}}}
+    Only this process's increments are added on save, so parallel workers
+    sharing the file do not overwrite each other's counts. Async pages
+    resolve concurrently, so every access holds a lock.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATS_PATH):
+        self.path = path
+        self.data = self._load()
+        self._delta = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _entry(data: dict, name: str, candidate: str) -> dict:
+        return data.setdefault(name, {}).setdefault(candidate, {"hits": 0, "misses": 0, "last_hit": None})
+
+    def record(self, name: str, candidate: str, hit: bool, used: bool = False):
+        """Count a lookup; last_hit marks the candidate that was actually used"""
+        with self._lock:
+            for data in (self.data, self._delta):
+                entry = self._entry(data, name, candidate)
+                if hit:
+                    entry["hits"] += 1
+                else:
+                    entry["misses"] += 1
+                if used:
+                    entry["last_hit"] = time.time()
+
+    def order(self, name: str, candidates) -> list:
+        """Candidates by most recent use, then by hits; unknown ones keep their order"""
+        with self._lock:
+            known = self.data.get(name, {})
+            keys = {
+                candidate: (-(known[candidate]["last_hit"] or 0), -known[candidate]["hits"])
+                for candidate in candidates if candidate in known
+            }
+        return sorted(candidates, key=lambda candidate: keys.get(candidate, (0, 0)))
+
+    def dead_weight(self, min_lookups: int = DEAD_WEIGHT_MIN_LOOKUPS) -> list:
+        """(name, candidate, lookups) for candidates that never matched"""
+        with self._lock:
+            return [
+                (name, candidate, entry["misses"])
+                for name, candidates in sorted(self.data.items())
+                for candidate, entry in candidates.items()
+                if entry["hits"] == 0 and entry["misses"] >= min_lookups
+            ]
+
+    def save(self):
+        """Add this process's increments to the file on disk"""
+        with self._lock:
+            if not self._delta:
+                return
+            merged = self._load()
+            for name, candidates in self._delta.items():
+                for candidate, delta in candidates.items():
+                    entry = self._entry(merged, name, candidate)
+                    entry["hits"] += delta["hits"]
+                    entry["misses"] += delta["misses"]
+                    entry["last_hit"] = max(entry["last_hit"] or 0, delta["last_hit"] or 0) or None
+            atomic_write_json(self.path, merged, sort_keys=True)
+            self.data = merged
+            self._delta = {}
+
+
+class SelectorResolver:
+
+    def __init__(self, stats: SelectorStats = None):
+        self.stats = stats or SelectorStats()
+
+    def resolve(self, page, name: str, candidates, timeout: int = 5000):
+        """
+        Return (selector, locator) of a visible candidate, waiting at most
+        timeout for all of them together; raises SelectorNotFound
+        """
+        visible = {candidate: page.locator(f"{candidate} >> visible=true") for candidate in candidates}
+        with span("resolve", selectors=name) as step:
+            try:
+                reduce(lambda a, b: a.or_(b), visible.values()).first.wait_for(state="visible", timeout=timeout)
+            except PlaywrightTimeoutError:
+                self._not_found(name, candidates, timeout)
+
+            matched = [candidate for candidate in candidates if visible[candidate].count() > 0]
+            selector = self._choose(name, candidates, matched)
+            if step is not None:
+                step["attrs"]["selector"] = selector
+        return selector, visible[selector].first
+
+    async def resolve_async(self, page, name: str, candidates, timeout: int = 5000):
+        """resolve() for playwright.async_api pages (same stats)"""
+        visible = {candidate: page.locator(f"{candidate} >> visible=true") for candidate in candidates}
+        try:
+            await reduce(lambda a, b: a.or_(b), visible.values()).first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            self._not_found(name, candidates, timeout)
+
+        matched = [candidate for candidate in candidates if await visible[candidate].count() > 0]
+        selector = self._choose(name, candidates, matched)
+        return selector, visible[selector].first
+
+    def _not_found(self, name: str, candidates, timeout: int):
+        for candidate in candidates:
+            self.stats.record(name, candidate, hit=False)
+        raise SelectorNotFound(f"None of {len(candidates)} '{name}' selectors visible within {timeout} ms")
+
+    def _choose(self, name: str, candidates, matched) -> str:
+        """Pick the matched candidate to use and record the lookup"""
+        selector = self.stats.order(name, matched)[0] if matched else None
+        for candidate in candidates:
+            self.stats.record(name, candidate, hit=candidate in matched, used=candidate == selector)
+        if selector is None:
+            # The element disappeared between the wait and the count
+            raise SelectorNotFound(f"'{name}' selector vanished before it could be used")
+        return selector
+
+
+def configure_resolver(stats_path: str = DEFAULT_STATS_PATH):
+    """Create the shared resolver with stats stored at stats_path"""
+    global _shared_resolver
+    _shared_resolver = SelectorResolver(SelectorStats(stats_path))
+    return _shared_resolver
+
+
+def get_resolver() -> SelectorResolver:
+    """Process-wide resolver, so stats accumulate across tests"""
+    global _shared_resolver
+    if _shared_resolver is None:
+        _shared_resolver = SelectorResolver()
+    return _shared_resolver
+
+
+def format_dead_weight(dead_weight) -> str:
+    """Report of candidates that never matched"""
+    if not dead_weight:
+        return "Selector fallbacks: no dead weight"
+    lines = [f"Selector fallbacks: {len(dead_weight)} candidates never matched (consider removing them)"]
+    for name, candidate, lookups in dead_weight:
+        lines.append(f"   {name}: {candidate}  (0 hits in {lookups} lookups)")
+    return "\n".join(lines)
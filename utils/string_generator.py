@@ -1,8 +1,36 @@
 """
 Random string generator for testing
 """
+import hashlib
 import random
 import string
+from array import array
+
+from utils.parallel import worker_id
+
+
+LETTER_COUNT = 6
+DIGIT_COUNT = 3
+
+# Number of distinct strings the format can produce (52^6 * 10^3)
+FORMAT_SPACE = len(string.ascii_letters) ** LETTER_COUNT * len(string.digits) ** DIGIT_COUNT
+
+
+def _byte_table(alphabet: str):
+    """
+    translate() table mapping a random byte to a character of alphabet,
+    plus the bytes to drop so that every character stays equally likely
+    """
+    usable = 256 - 256 % len(alphabet)
+    table = bytes(ord(alphabet[b % len(alphabet)]) for b in range(usable)) + bytes(256 - usable)
+    return table, bytes(range(usable, 256))
+
+
+LETTER_TABLE = _byte_table(string.ascii_letters)
+DIGIT_TABLE = _byte_table(string.digits)
+
+# Digit prefix -> its number, shifted above the letter bytes (a lookup is cheaper than int())
+DIGIT_KEYS = {f"{n:0{DIGIT_COUNT}d}": n << (8 * LETTER_COUNT) for n in range(10 ** DIGIT_COUNT)}
 
 
 def generate_random_test_string():
@@ -45,6 +73,96 @@ def generate_random_full_name():
     return generate_random_test_string()
 
 
+def string_key(value: str) -> int:
+    """58-bit key of a string: its 3 digits as a number above the 6 ASCII bytes of its letters"""
+    return DIGIT_KEYS[value[:DIGIT_COUNT]] | int.from_bytes(value[DIGIT_COUNT:].encode("ascii"), "big")
+
+
+def stream_seed(seed, worker: str = None) -> int:
+    """Independent seed for each worker's stream derived from one base seed"""
+    digest = hashlib.sha256(f"{seed}/{worker or 'main'}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class StringStream:
+    """
+    Batches of strings in the generate_random_test_string format
+
+    Characters are drawn as random bytes and mapped with bytes.translate,
+    so a batch costs a few C-level calls instead of two random.choices
+    calls per string. With a seed the stream is reproducible; each xdist
+    worker gets its own independent stream of the same seed. In unique
+    mode no string is returned twice by the stream; the strings seen are
+    kept as an array of 64-bit keys (8 bytes per string instead of a set
+    of int objects), checked once per batch.
+    """
+
+    def __init__(self, seed=None, unique: bool = False, worker: str = None):
+        worker = worker_id() if worker is None else worker
+        self.rng = random.Random(None if seed is None else stream_seed(seed, worker))
+        self.unique = unique
+        self.seen = array("Q") if unique else None
+
+    def _draw(self, table, count: int) -> str:
+        """count characters of the table's alphabet"""
+        mapping, rejected = table
+        out = b""
+        while len(out) < count:
+            missing = count - len(out)
+            out += self.rng.randbytes(missing + missing // 8 + 8).translate(mapping, rejected)
+        return out[:count].decode("ascii")
+
+    def _raw_batch(self, count: int) -> list:
+        letters = self._draw(LETTER_TABLE, count * LETTER_COUNT)
+        digits = self._draw(DIGIT_TABLE, count * DIGIT_COUNT)
+        # Reversed (letters + digits) is digits then letters, both random anyway
+        return [
+            digits[d:d + DIGIT_COUNT] + letters[l:l + LETTER_COUNT]
+            for d, l in zip(range(0, len(digits), DIGIT_COUNT), range(0, len(letters), LETTER_COUNT))
+        ]
+
+    def batch(self, count: int) -> list:
+        """
+        Generate count strings at once
+        
+        Returns:
+            list: 9-character strings, 3 digits followed by 6 letters
+        """
+        if not self.unique:
+            return self._raw_batch(count)
+        if len(self.seen) + count > FORMAT_SPACE:
+            raise ValueError(f"Only {FORMAT_SPACE - len(self.seen)} unique strings left in this stream")
+
+        out = []
+        fresh = set()
+        while len(out) < count:
+            values = self._raw_batch(count - len(out))
+            keys = list(map(string_key, values))
+            # Keys an earlier batch returned, found in one C-level pass over the array
+            repeated = set(keys).intersection(self.seen)
+            for value, key in zip(values, keys):
+                if key not in fresh and key not in repeated:
+                    fresh.add(key)
+                    out.append(value)
+        self.seen.extend(fresh)
+        return out
+
+
+def generate_random_test_strings(count: int, unique: bool = False, seed=None) -> list:
+    """
+    Generate count strings in the generate_random_test_string format
+    
+    Args:
+        count: number of strings
+        unique: no duplicates within the batch
+        seed: reproducible output (independent per xdist worker)
+    
+    Returns:
+        list: 9-character strings
+    """
+    return StringStream(seed=seed, unique=unique).batch(count)
+
+
 if __name__ == "__main__":
     print("Testing Random String Generator:")
     print("=" * 50)
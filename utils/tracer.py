@@ -0,0 +1,158 @@
+"""
+Per-step timing tracer for page-object flows
+
+Page-object methods and their inner steps (retry attempts, selector
+fallbacks, waits, downloads) are recorded as nested timed spans. Each
+test gets its own Tracer; its spans are written to a JSON timeline and
+rendered as a waterfall in the HTML report.
+"""
+import functools
+import html
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.parallel import atomic_write_json
+
+
+_current_tracer = None
+
+
+class Tracer:
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """Time a block; exceptions mark the span as failed and propagate"""
+        stack = self._stack()
+        record = {
+            "name": name,
+            "start_ms": round((time.perf_counter() - self.origin) * 1000, 2),
+            "duration_ms": None,
+            "depth": len(stack),
+            "parent": stack[-1]["id"] if stack else None,
+            "thread": threading.current_thread().name,
+            "status": "ok",
+            "attrs": attrs
+        }
+        with self._lock:
+            record["id"] = len(self.spans)
+            self.spans.append(record)
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["status"] = "error"
+            record["attrs"]["error"] = str(e)[:200]
+            raise
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            stack.pop()
+
+    def to_dict(self) -> dict:
+        return {
+            "test": self.name,
+            "total_ms": max((s["start_ms"] + (s["duration_ms"] or 0) for s in self.spans), default=0),
+            "spans": self.spans
+        }
+
+    def save(self, path: str):
+        """Write the timeline as JSON"""
+        atomic_write_json(path, self.to_dict(), ensure_ascii=False)
+
+
+def timeline_path(output_dir: str, nodeid: str) -> str:
+    """File path for a test's JSON timeline, derived from its node id"""
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+    return os.path.join(output_dir, f"{safe_name}.json")
+
+
+def start_trace(name: str = "") -> Tracer:
+    """Start a fresh tracer that page objects will record into"""
+    global _current_tracer
+    _current_tracer = Tracer(name)
+    return _current_tracer
+
+
+def stop_trace():
+    global _current_tracer
+    tracer, _current_tracer = _current_tracer, None
+    return tracer
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Record a span on the current tracer (no-op when tracing is off)"""
+    tracer = _current_tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, **attrs) as record:
+        yield record
+
+
+def traced(name: str = None):
+    """Decorator: record every call of a page-object method as a span"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            span_name = name or f"{type(self).__name__}.{func.__name__}"
+            with span(span_name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+TIMELINE_STYLESHEET = """<style>
+.trg-tl{font-family:'Courier New',monospace;font-size:12px;border:1px solid #ccc;border-radius:6px;padding:8px}
+.trg-tl>summary{font-weight:bold;cursor:pointer}
+.tl-row{display:flex;align-items:center;height:18px}
+.tl-name{width:38%;overflow:hidden;white-space:nowrap;text-overflow:ellipsis}
+.tl-track{position:relative;flex:1;height:12px;background:#f3f3f3}
+.tl-bar{position:absolute;top:0;height:12px;min-width:1px;background:#007bff}
+.tl-error{background:#dc3545}.tl-wait{background:#ffc107}.tl-download{background:#20c997}
+.tl-ms{width:80px;text-align:right}
+</style>"""
+
+
+def render_waterfall(timeline: dict, max_spans: int = 300) -> str:
+    """Render a timeline as an HTML waterfall (one bar per span)"""
+    spans = timeline["spans"][:max_spans]
+    total = timeline["total_ms"] or 1
+    rows = []
+    for s in spans:
+        duration = s["duration_ms"] or 0
+        left = s["start_ms"] / total * 100
+        width = duration / total * 100
+        kind = "tl-error" if s["status"] == "error" else (
+            "tl-wait" if s["name"].startswith("wait:") else
+            "tl-download" if s["name"].startswith("download") else "")
+        label = s["name"]
+        detail = ", ".join(f"{k}={v}" for k, v in s["attrs"].items())
+        if detail:
+            label += f" ({detail})"
+        label = html.escape(label)
+        rows.append(
+            f'<div class="tl-row"><span class="tl-name" style="padding-left:{s["depth"] * 12}px" title="{label}">{label}</span>'
+            f'<span class="tl-track"><span class="tl-bar {kind}" style="left:{left:.2f}%;width:{width:.2f}%"></span></span>'
+            f'<span class="tl-ms">{duration:.0f} ms</span></div>'
+        )
+    more = len(timeline["spans"]) - len(spans)
+    if more > 0:
+        rows.append(f"<div>… {more} more spans in the JSON timeline</div>")
+    return (f'<details class="trg-tl"><summary>⏱️ Step timeline ({len(timeline["spans"])} spans, '
+            f'{total / 1000:.2f}s)</summary>{"".join(rows)}</details>')
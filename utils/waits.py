@@ -0,0 +1,306 @@
+"""
+Condition-based waits for page objects
+
+Replaces fixed time.sleep calls: every wait blocks only until its
+condition is met (or its deadline passes) and records how long it
+actually blocked, so slow conditions can be found and tuned.
+"""
+import time
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils.tracer import span
+
+
+DEFAULT_TIMEOUT = 5000
+
+# Resolves once window.scrollY has not changed for `quiet` ms
+SCROLL_SETTLED_JS = """
+({ quiet }) => {
+    const now = performance.now();
+    const y = window.scrollY;
+    const state = window.__trgScrollState;
+    if (!state || state.y !== y) {
+        window.__trgScrollState = { y: y, since: now };
+        return false;
+    }
+    return now - state.since >= quiet;
+}
+"""
+
+# True once no layout shift has been reported for `quiet` ms (first call installs the observer)
+LAYOUT_STABLE_JS = """
+({ quiet }) => {
+    const now = performance.now();
+    let state = window.__trgLayoutState;
+    if (!state) {
+        state = window.__trgLayoutState = { last: 0 };
+        try {
+            new PerformanceObserver(list => {
+                for (const entry of list.getEntries()) {
+                    state.last = Math.max(state.last, entry.startTime + entry.duration);
+                }
+            }).observe({ type: 'layout-shift', buffered: true });
+        } catch (e) {}
+        return false;
+    }
+    return now - state.last >= quiet;
+}
+"""
+
+# True when no CSS animation / transition is running (optionally inside one element)
+ANIMATIONS_DONE_JS = """
+(selector) => {
+    const root = selector ? document.querySelector(selector) : document;
+    if (!root) return true;
+    const animations = root === document
+        ? document.getAnimations()
+        : root.getAnimations({ subtree: true });
+    return animations.every(a => a.playState !== 'running');
+}
+"""
+
+# Resolves true once the element's box has not moved for `quiet` ms, false at the deadline
+ELEMENT_STABLE_JS = """
+(el, { quiet, timeout }) => new Promise(resolve => {
+    const start = performance.now();
+    let last = null;
+    let since = start;
+    function tick() {
+        const r = el.getBoundingClientRect();
+        const key = [r.x, r.y, r.width, r.height].join(',');
+        const now = performance.now();
+        if (key !== last) { last = key; since = now; }
+        if (now - since >= quiet) return resolve(true);
+        if (now - start >= timeout) return resolve(false);
+        requestAnimationFrame(tick);
+    }
+    tick();
+})
+"""
+
+
+class WaitTimeout(Exception):
+    """Raised when a required wait condition is not met before its deadline"""
+
+
+class WaitEngine:
+    """
+    Event-driven waits bound to one Playwright page
+
+    Every wait returns True when its condition is met. On timeout it
+    raises WaitTimeout, or returns False when called with required=False.
+    """
+
+    def __init__(self, page, default_timeout: int = DEFAULT_TIMEOUT):
+        self.page = page
+        self.default_timeout = default_timeout
+        self.records = []
+
+    def _run(self, name: str, target: str, check, timeout, required: bool) -> bool:
+        """Run one wait, record how long it blocked and apply the timeout policy"""
+        timeout = self.default_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        with span(f"wait:{name}", target=target) as step:
+            try:
+                met = check(timeout) is not False
+            except PlaywrightTimeoutError:
+                met = False
+            if step is not None:
+                step["attrs"]["met"] = met
+        return self._record(name, target, start, timeout, met, required)
+
+    def _record(self, name: str, target: str, start: float, timeout, met: bool, required: bool) -> bool:
+        """Record a finished wait and apply the timeout policy"""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.records.append({
+            "wait": name,
+            "target": target,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "timeout_ms": timeout,
+            "met": met
+        })
+
+        if not met and required:
+            raise WaitTimeout(f"{name}({target}) not met within {timeout} ms")
+        return met
+
+    def for_element(self, selector_or_locator, state: str = "visible", timeout=None, required=True) -> bool:
+        """Wait for an element to be attached, detached, visible or hidden"""
+        locator = self._locator(selector_or_locator)
+        return self._run(
+            "element", f"{locator} {state}",
+            lambda t: locator.wait_for(state=state, timeout=t),
+            timeout, required
+        )
+
+    def for_element_stable(self, selector_or_locator, quiet_ms: int = 150, timeout=None, required=True) -> bool:
+        """Wait for a visible element to stop moving (dropdown and slide-in animations)"""
+        locator = self._locator(selector_or_locator)
+
+        def check(t):
+            started = time.perf_counter()
+            locator.wait_for(state="visible", timeout=t)
+            remaining = max(0, t - (time.perf_counter() - started) * 1000)
+            return locator.evaluate(ELEMENT_STABLE_JS, {"quiet": quiet_ms, "timeout": remaining})
+
+        return self._run("element_stable", str(locator), check, timeout, required)
+
+    def for_url(self, expected, timeout=None, required=True) -> bool:
+        """Wait until the page URL contains a substring or satisfies a predicate"""
+        if callable(expected):
+            predicate = expected
+            target = getattr(expected, "__name__", "predicate")
+        else:
+            predicate = lambda url: expected in url
+            target = expected
+        return self._run(
+            "url", target,
+            lambda t: self.page.wait_for_url(predicate, timeout=t, wait_until="commit"),
+            timeout, required
+        )
+
+    def for_scroll_settled(self, quiet_ms: int = 200, timeout=None, required=True) -> bool:
+        """Wait until smooth scrolling has finished"""
+        def check(t):
+            self.page.evaluate("delete window.__trgScrollState")
+            return self.page.wait_for_function(
+                SCROLL_SETTLED_JS, arg={"quiet": quiet_ms}, polling="raf", timeout=t
+            )
+
+        return self._run("scroll_settled", f"quiet {quiet_ms} ms", check, timeout, required)
+
+    def for_animations(self, selector: str = None, timeout=None, required=True) -> bool:
+        """Wait until CSS animations and transitions have ended"""
+        return self._run(
+            "animations", selector or "document",
+            lambda t: self.page.wait_for_function(
+                ANIMATIONS_DONE_JS, arg=selector, polling="raf", timeout=t
+            ),
+            timeout, required
+        )
+
+    def for_layout_stable(self, quiet_ms: int = 300, timeout=None, required=True) -> bool:
+        """Wait until the page has had no layout shift for quiet_ms"""
+        return self._run(
+            "layout_stable", f"quiet {quiet_ms} ms",
+            lambda t: self.page.wait_for_function(
+                LAYOUT_STABLE_JS, arg={"quiet": quiet_ms}, polling="raf", timeout=t
+            ),
+            timeout, required
+        )
+
+    def for_load_state(self, state: str = "load", timeout=None, required=True) -> bool:
+        """Wait for a document load state (load, domcontentloaded, networkidle)"""
+        return self._run(
+            "load_state", state,
+            lambda t: self.page.wait_for_load_state(state, timeout=t),
+            timeout, required
+        )
+
+    def _locator(self, selector_or_locator):
+        if isinstance(selector_or_locator, str):
+            return self.page.locator(selector_or_locator).first
+        return selector_or_locator
+
+    @property
+    def total_ms(self) -> float:
+        return sum(r["elapsed_ms"] for r in self.records)
+
+    def slowest(self, n: int = 5):
+        """Return the n waits that blocked the longest"""
+        return sorted(self.records, key=lambda r: r["elapsed_ms"], reverse=True)[:n]
+
+    def summary(self, n: int = 5):
+        """Human readable summary of blocked time, slowest waits first"""
+        lines = [f"   ⏱️  Waits: {len(self.records)} conditions, {self.total_ms / 1000:.2f}s blocked"]
+        for record in self.slowest(n):
+            status = "✓" if record["met"] else "⚠️ timeout"
+            lines.append(
+                f"      {record['elapsed_ms']:8.1f} ms  {record['wait']}: {record['target'][:60]} {status}"
+            )
+        return "\n".join(lines)
+
+
+class AsyncWaitEngine(WaitEngine):
+    """
+    WaitEngine for playwright.async_api pages: the same waits as coroutines
+
+    Not traced: spans nest per thread, and concurrent tasks share one thread.
+    """
+
+    async def _run(self, name: str, target: str, check, timeout, required: bool) -> bool:
+        timeout = self.default_timeout if timeout is None else timeout
+        start = time.perf_counter()
+        try:
+            met = await check(timeout) is not False
+        except PlaywrightTimeoutError:
+            met = False
+        return self._record(name, target, start, timeout, met, required)
+
+    async def for_element(self, selector_or_locator, state: str = "visible", timeout=None, required=True) -> bool:
+        locator = self._locator(selector_or_locator)
+        return await self._run(
+            "element", f"{locator} {state}",
+            lambda t: locator.wait_for(state=state, timeout=t),
+            timeout, required
+        )
+
+    async def for_element_stable(self, selector_or_locator, quiet_ms: int = 150, timeout=None,
+                                 required=True) -> bool:
+        locator = self._locator(selector_or_locator)
+
+        async def check(t):
+            started = time.perf_counter()
+            await locator.wait_for(state="visible", timeout=t)
+            remaining = max(0, t - (time.perf_counter() - started) * 1000)
+            return await locator.evaluate(ELEMENT_STABLE_JS, {"quiet": quiet_ms, "timeout": remaining})
+
+        return await self._run("element_stable", str(locator), check, timeout, required)
+
+    async def for_url(self, expected, timeout=None, required=True) -> bool:
+        if callable(expected):
+            predicate = expected
+            target = getattr(expected, "__name__", "predicate")
+        else:
+            predicate = lambda url: expected in url
+            target = expected
+        return await self._run(
+            "url", target,
+            lambda t: self.page.wait_for_url(predicate, timeout=t, wait_until="commit"),
+            timeout, required
+        )
+
+    async def for_scroll_settled(self, quiet_ms: int = 200, timeout=None, required=True) -> bool:
+        async def check(t):
+            await self.page.evaluate("delete window.__trgScrollState")
+            return await self.page.wait_for_function(
+                SCROLL_SETTLED_JS, arg={"quiet": quiet_ms}, polling="raf", timeout=t
+            )
+
+        return await self._run("scroll_settled", f"quiet {quiet_ms} ms", check, timeout, required)
+
+    async def for_layout_stable(self, quiet_ms: int = 300, timeout=None, required=True) -> bool:
+        return await self._run(
+            "layout_stable", f"quiet {quiet_ms} ms",
+            lambda t: self.page.wait_for_function(
+                LAYOUT_STABLE_JS, arg={"quiet": quiet_ms}, polling="raf", timeout=t
+            ),
+            timeout, required
+        )
+
+    async def for_animations(self, selector: str = None, timeout=None, required=True) -> bool:
+        return await self._run(
+            "animations", selector or "document",
+            lambda t: self.page.wait_for_function(
+                ANIMATIONS_DONE_JS, arg=selector, polling="raf", timeout=t
+            ),
+            timeout, required
+        )
+
+    async def for_load_state(self, state: str = "load", timeout=None, required=True) -> bool:
+        return await self._run(
+            "load_state", state,
+            lambda t: self.page.wait_for_load_state(state, timeout=t),
+            timeout, required
+        )
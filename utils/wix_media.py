@@ -0,0 +1,135 @@
+"""
+Wix media URLs and image type detection
+
+Images on the TRG (Wix) pages are served from static.wixstatic.com,
+which resizes and re-encodes on request:
+
+    https://static.wixstatic.com/media/<id>~mv2.jpg                        original
+    https://static.wixstatic.com/media/<id>~mv2.jpg/v1/fill/w_300,h_200,
+        al_c,q_80/<id>~mv2.webp                                          300x200 WebP
+
+In "rendered" fetch mode images are requested at the size they are
+rendered in the page and in a compact format, instead of the (often
+multi-megabyte) original. Saved files are named after their real type,
+detected from the magic bytes rather than trusted from the URL.
+"""
+import os
+import re
+from urllib.parse import urlsplit
+
+
+WIX_MEDIA_HOST = "static.wixstatic.com"
+FETCH_MODES = ("original", "rendered")
+
+# (offset, signature, file extension)
+MAGIC_BYTES = (
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpg"),
+    (0, b"GIF87a", "gif"),
+    (0, b"GIF89a", "gif"),
+    (8, b"WEBP", "webp"),
+    (4, b"ftypavif", "avif"),
+    (0, b"BM", "bmp"),
+)
+
+# Extensions an image may have been saved under (detected types, plus the .png default name)
+IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "webp", "avif", "bmp", "svg")
+
+_MEDIA_PATH = re.compile(r"^/media/([^/]+)")
+
+_settings = {"mode": "original", "image_format": "webp", "quality": 80}
+
+
+def configure_image_fetch(mode: str = "original", image_format: str = "webp", quality: int = 80):
+    """Set how core value images are fetched (see FETCH_MODES)"""
+    if mode not in FETCH_MODES:
+        raise ValueError(f"Unknown image fetch mode '{mode}' (expected one of {', '.join(FETCH_MODES)})")
+    _settings.update(mode=mode, image_format=image_format, quality=int(quality))
+
+
+def image_fetch_settings() -> dict:
+    return dict(_settings)
+
+
+def media_file(url: str):
+    """'<id>~mv2.jpg' for a Wix media URL, None for any other URL"""
+    if not url:
+        return None
+    parts = urlsplit(url if not url.startswith("//") else "https:" + url)
+    if parts.hostname != WIX_MEDIA_HOST:
+        return None
+    match = _MEDIA_PATH.match(parts.path)
+    return match.group(1) if match else None
+
+
+def original_url(url: str) -> str:
+    """The untransformed original of a Wix media URL (other URLs unchanged)"""
+    name = media_file(url)
+    return f"https://{WIX_MEDIA_HOST}/media/{name}" if name else url
+
+
+def transform_url(url: str, width: int, height: int, image_format: str = "webp", quality: int = 80) -> str:
+    """Wix media URL resized to width x height and encoded as image_format (other URLs unchanged)"""
+    name = media_file(url)
+    if not name or not width or not height:
+        return url
+    stem = os.path.splitext(name)[0]
+    return (f"https://{WIX_MEDIA_HOST}/media/{name}/v1/fill/"
+            f"w_{int(width)},h_{int(height)},al_c,q_{int(quality)}/{stem}.{image_format}")
+
+
+def sniff_image_type(head: bytes):
+    """File extension for the image format of head (first bytes of a file), None if unknown"""
+    for offset, signature, extension in MAGIC_BYTES:
+        if head[offset:offset + len(signature)] == signature:
+            return extension
+    stripped = head.lstrip()
+    if stripped.startswith(b"<svg") or (stripped.startswith(b"<?xml") and b"<svg" in head):
+        return "svg"
+    return None
+
+
+def fix_extension(path: str) -> str:
+    """
+    Rename path so its extension matches the detected image type and
+    remove the same image saved under another extension by earlier runs
+    Returns the (possibly new) path; unknown types keep their name
+    """
+    with open(path, "rb") as f:
+        extension = sniff_image_type(f.read(64))
+    base, current = os.path.splitext(path)
+    current = current.lower().lstrip(".")
+    if extension is None:
+        return path
+    new_path = path
+    if current != extension and (current, extension) != ("jpeg", "jpg"):
+        new_path = f"{base}.{extension}"
+        os.replace(path, new_path)
+    for stale in (f"{base}.{other}" for other in IMAGE_EXTENSIONS):
+        if stale != new_path and os.path.exists(stale):
+            os.remove(stale)
+    return new_path
+
+
+def format_savings(results, originals: dict, original_sizes: dict) -> str:
+    """
+    Bytes downloaded against bytes avoided by fetching rendered sizes
+    originals: {requested url: original url}; original_sizes: {original url: bytes or None}
+    """
+    rendered = [r for r in results if r["ok"] and r["url"] in originals]
+    downloaded = sum(r["bytes"] for r in rendered)
+    original_total = 0
+    avoided = 0
+    unknown = 0
+    for result in rendered:
+        original = original_sizes.get(originals[result["url"]])
+        if original is None:
+            unknown += 1
+            continue
+        original_total += original
+        avoided += max(0, original - os.path.getsize(result["path"]))
+    line = (f"      Rendered sizes: {len(rendered)} images, {downloaded / 1024:.1f} KB downloaded, "
+            f"{avoided / 1024:.1f} KB avoided (originals {original_total / 1024:.1f} KB)")
+    if unknown:
+        line += f", {unknown} originals of unknown size"
+    return line